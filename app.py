@@ -1,3 +1,5 @@
+import io
+import json
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -6,12 +8,24 @@ warnings.filterwarnings('ignore')
 
 # Importações dos módulos locais
 from data_analysis.survey_analyzer import INJuniorSurveyAnalyzer
+from data_analysis.streaming import StreamingSurveyAnalyzer
+from data_analysis.history import get_history_store
+from data_analysis.correlation_engine import correlation_pairs
+from data_analysis.bitmap_index import COMBINE_ALL, COMBINE_ANY, filter_signature
 from charts.satisfaction_charts import create_satisfaction_charts
 from charts.workload_charts import create_workload_charts
 from charts.organizational_charts import create_organizational_charts
 from charts.feedback_charts import create_feedback_charts
-from utils.helpers import display_metrics_cards
-from data_analysis.cruzamentos.satisfacao_vs_carga import create_satisfaction_workload_charts
+from charts.history_charts import create_history_charts
+from charts.segment_charts import create_segment_charts
+from utils.helpers import display_metrics_cards, display_streaming_report
+from utils.cache import get_survey_cache, get_filter_cache, hash_bytes
+from utils.columnar_cache import get_columnar_cache
+from utils.figure_cache import get_figure_cache
+from utils.table_viewer import get_paged_table, display_paged_table
+from utils.export import EXPORT_FORMATS, available_formats, get_export_cache
+from utils.profiling import get_profiler, span
+from data_analysis.cruzamentos import create_crossing_charts
 
 # Configuração da página
 st.set_page_config(
@@ -21,6 +35,401 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+def load_survey(uploaded_file):
+    """
+    Carrega a pesquisa reaproveitando o cache entre reruns
+    
+    O cache é indexado pelo hash do conteúdo enviado, então interações com
+    widgets não refazem a leitura do CSV, o processamento nem o relatório.
+    
+    O DataFrame original não fica em memória depois do processamento; a
+    visualização "Dados Originais" relê o arquivo sob demanda. Fora da
+    memória, os dados processados ficam em um cache em disco (Arrow IPC),
+    recarregado sem reprocessar o CSV quando o mesmo arquivo volta a ser enviado.
+    
+    Returns:
+        dict: Entrada com 'analyzer' e 'report'
+    """
+    content = uploaded_file.getvalue()
+    key = hash_bytes(content)
+    
+    def _build():
+        disk_cache = get_columnar_cache()
+        with span('app.cache_colunar_leitura'):
+            df_processed = disk_cache.load(key)
+        if df_processed is not None:
+            analyzer = INJuniorSurveyAnalyzer.from_processed(df_processed)
+        else:
+            with span('app.leitura_csv', bytes=len(content)):
+                df = pd.read_csv(io.BytesIO(content))
+            with span('app.processamento', linhas=len(df)):
+                analyzer = INJuniorSurveyAnalyzer(df, keep_raw=False)
+            del df
+            with span('app.cache_colunar_gravacao'):
+                disk_cache.store(key, analyzer.df_processed)
+        # O hash do arquivo identifica os dados nas chaves do cache de figuras
+        analyzer.dataset_key = key
+        # Bitmaps do painel de filtros, montados uma única vez por arquivo
+        with span('app.indice_bitmap'):
+            analyzer.bitmap_index()
+        return {
+            'analyzer': analyzer,
+            'report': analyzer.generate_summary_report()
+        }
+    
+    return get_survey_cache().get_or_create(key, _build)
+
+
+def _question_label(key):
+    return key.replace('_', ' ').title()
+
+
+def render_filter_panel(analyzer):
+    """
+    Painel de filtros na barra lateral, sobre as perguntas categóricas/Likert
+    
+    Returns:
+        tuple: (seleções: chave -> valores aceitos, combinação entre perguntas)
+    """
+    index = analyzer.bitmap_index()
+    selections = {}
+    
+    with st.sidebar.expander("🔎 Filtros"):
+        questions = st.multiselect(
+            "Filtrar por:", index.columns, format_func=_question_label, key='filtro_perguntas'
+        )
+        for key in questions:
+            selections[key] = st.multiselect(
+                f"{_question_label(key)}:", index.values(key), format_func=str, key=f'filtro_{key}'
+            )
+        combine = st.radio(
+            "Combinar perguntas com:",
+            [COMBINE_ALL, COMBINE_ANY],
+            format_func={COMBINE_ALL: "E (todas)", COMBINE_ANY: "OU (qualquer uma)"}.get,
+            horizontal=True,
+            key='filtro_combinacao'
+        )
+        # Contagem direto dos bitmaps, sem montar o subconjunto
+        st.caption(f"{index.count(selections, combine)} de {index.n_rows} respostas")
+    
+    return selections, combine
+
+
+def load_filtered_survey(survey, selections, combine):
+    """
+    Pesquisa restrita às respostas do filtro (com cache por dados + filtro)
+    
+    O subconjunto é selecionado pelo índice bitmap e recebe seu próprio
+    analisador, então todas as seções recalculam sobre ele.
+    
+    Returns:
+        dict: Entrada com 'analyzer', 'report' e 'filtrada' (a própria `survey` sem filtro)
+    """
+    analyzer = survey['analyzer']
+    signature = filter_signature(selections, combine)
+    if not signature:
+        return survey
+    
+    def _build():
+        subset = analyzer.filtered(selections, combine)
+        return {
+            'analyzer': subset,
+            'report': subset.generate_summary_report(),
+            'filtrada': True
+        }
+    
+    with span('app.filtro', filtro=signature):
+        return get_filter_cache().get_or_create(f"{analyzer.dataset_key}_{signature}", _build)
+
+
+def load_survey_streaming(uploaded_file, incremental=False, state=None):
+    """
+    Processa a pesquisa em blocos (modo streaming), com cache entre reruns
+    
+    No modo incremental, o analisador de cada arquivo fica no estado da
+    sessão (`st.session_state`), indexado pelo nome do arquivo: ao reenviar
+    o CSV com mais respostas, apenas as linhas ainda não vistas atualizam os
+    agregadores, sem reprocessar as anteriores. Ele não passa pelo cache
+    compartilhado de pesquisas, então outra sessão que envie um arquivo com
+    o mesmo nome começa do zero, e o estado acumulado não é descartado por
+    falta de espaço no cache.
+    
+    Args:
+        uploaded_file: Arquivo enviado (`getvalue()` e `name`)
+        incremental (bool): Incorporar só as respostas novas a cada envio
+        state (MutableMapping, optional): Estado da sessão (padrão: `st.session_state`)
+    
+    Returns:
+        dict: 'report' (relatório resumo), 'correlacoes' (Pearson) e
+            'novas' (respostas incorporadas no último envio; None fora do modo incremental)
+    """
+    content = uploaded_file.getvalue()
+    
+    def _summarize(analyzer, new_rows=None):
+        return {
+            'report': analyzer.generate_summary_report(),
+            'correlacoes': analyzer.correlations(),
+            'novas': new_rows
+        }
+    
+    if not incremental:
+        return get_survey_cache().get_or_create(
+            'streaming:' + hash_bytes(content),
+            lambda: _summarize(StreamingSurveyAnalyzer.from_csv(io.BytesIO(content)))
+        )
+    
+    if state is None:
+        state = st.session_state
+    streams = state.setdefault('streaming_incremental', {})
+    stream = streams.setdefault(
+        uploaded_file.name, {'analyzer': StreamingSurveyAnalyzer(), 'conteudo': None}
+    )
+    content_key = hash_bytes(content)
+    if stream['conteudo'] != content_key:
+        with span('app.streaming_incremental', bytes=len(content)):
+            new_rows = stream['analyzer'].append_csv(io.BytesIO(content))
+        stream.update(_summarize(stream['analyzer'], new_rows), conteudo=content_key)
+    return stream
+
+
+def render_satisfacao(survey, uploaded_file):
+    """Seção de satisfação geral"""
+    analyzer = survey['analyzer']
+    report = survey['report']
+    
+    st.subheader("Análise de Satisfação")
+    create_satisfaction_charts(analyzer)
+    
+    if 'satisfacao_geral' in report['satisfacao']:
+        sat = report['satisfacao']['satisfacao_geral']
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.info(f"**Média:** {sat['media']}/5")
+        with col2:
+            st.info(f"**Mediana:** {sat['mediana']}/5")
+        with col3:
+            st.info(f"**Desvio Padrão:** {sat['desvio_padrao']}")
+        
+        # Intervalo de confiança bootstrap da média (calculado uma vez por arquivo)
+        intervals = analyzer.confidence_intervals()
+        if 'satisfacao_geral' in intervals.index and 'ic_media_inf' in intervals.columns:
+            ci = intervals.loc['satisfacao_geral']
+            st.caption(
+                f"IC 95% (bootstrap) da média: {ci['ic_media_inf']:.2f} a {ci['ic_media_sup']:.2f}"
+            )
+
+
+def render_carga_trabalho(survey, uploaded_file):
+    """Seção de carga de trabalho"""
+    analyzer = survey['analyzer']
+    report = survey['report']
+    
+    st.subheader("Análise de Carga de Trabalho")
+    create_workload_charts(analyzer)
+    
+    # Tabela resumo
+    if report['carga_trabalho']:
+        st.subheader("Resumo da Carga de Trabalho")
+        workload_summary = []
+        for key, data in report['carga_trabalho'].items():
+            workload_summary.append({
+                'Métrica': key.replace('_', ' ').title(),
+                'Média': data['media'],
+                'Mediana': data['mediana'],
+                'Máximo': data['maximo'],
+                'N° Respostas': data['n_respostas']
+            })
+        
+        if workload_summary:
+            st.dataframe(pd.DataFrame(workload_summary), width="stretch")
+
+
+def render_estrutura(survey, uploaded_file):
+    """Seção de estrutura organizacional"""
+    analyzer = survey['analyzer']
+    
+    st.subheader("Estrutura Organizacional")
+    create_organizational_charts(analyzer)
+
+
+def render_feedback(survey, uploaded_file):
+    """Seção de cultura de feedback"""
+    analyzer = survey['analyzer']
+    
+    st.subheader("Cultura de Feedback")
+    create_feedback_charts(analyzer)
+
+
+def render_cruzamentos(survey, uploaded_file):
+    """Seção de cruzamentos"""
+    analyzer = survey['analyzer']
+    
+    st.subheader("Análises de Cruzamento")
+    # Todos os cruzamentos registrados, calculados em paralelo e em cache por versão dos dados
+    create_crossing_charts(analyzer)
+
+
+def render_segmentos(survey, uploaded_file):
+    """Seção de métricas por segmento"""
+    analyzer = survey['analyzer']
+    
+    st.subheader("Métricas por Segmento")
+    create_segment_charts(analyzer)
+
+
+def render_dados_detalhados(survey, uploaded_file):
+    """Seção de dados detalhados, mapeamento de colunas e download"""
+    analyzer = survey['analyzer']
+    report = survey['report']
+    
+    st.subheader("Dados Detalhados")
+    
+    # Opções de visualização
+    view_option = st.radio(
+        "Escolha o que visualizar:",
+        ["Dados Processados", "Estatísticas Resumidas", "Dados Originais"]
+    )
+    
+    # As tabelas ficam no servidor: só a página visível é enviada ao navegador
+    if view_option == "Dados Processados":
+        table = get_paged_table(
+            (analyzer.dataset_key, analyzer.data_version, 'processado'),
+            lambda: analyzer.df_processed
+        )
+        display_paged_table(table, key="tabela_processada")
+    
+    elif view_option == "Estatísticas Resumidas":
+        try:
+            numeric_cols = analyzer.df_processed.select_dtypes(include=['number']).columns
+            if len(numeric_cols) > 0:
+                st.dataframe(analyzer.df_processed[numeric_cols].describe(), width="stretch")
+            else:
+                st.warning("Nenhuma coluna numérica encontrada para estatísticas.")
+        except Exception as e:
+            st.error(f"Erro ao gerar estatísticas: {str(e)}")
+            st.info("Tentando método alternativo...")
+            try:
+                # Método alternativo
+                numeric_data = analyzer.df_processed._get_numeric_data()
+                if not numeric_data.empty:
+                    st.dataframe(numeric_data.describe(), width="stretch")
+                else:
+                    st.warning("Nenhuma coluna numérica encontrada.")
+            except:
+                st.warning("Não foi possível gerar estatísticas para este dataset.")
+    
+    else:  # Dados Originais
+        # Relido sob demanda: o original não fica junto com a pesquisa, só
+        # no cache de tabelas (limitado) enquanto estiver sendo consultado.
+        # Com filtro ativo, ficam só as linhas do subconjunto (os rótulos do
+        # índice de df_processed são as posições das linhas no CSV)
+        filtered = survey.get('filtrada', False)
+        
+        def _original():
+            original = pd.read_csv(io.BytesIO(uploaded_file.getvalue()))
+            if filtered:
+                original = original.loc[analyzer.df_processed.index]
+            return original
+        
+        if filtered:
+            st.caption(f"🔎 Somente as {len(analyzer.df_processed)} linhas do arquivo original que atendem aos filtros.")
+        table = get_paged_table((analyzer.dataset_key, 'original'), _original)
+        display_paged_table(table, key="tabela_original")
+    
+    # Perguntas conhecidas x colunas encontradas no arquivo
+    with st.expander("🧭 Mapeamento de Colunas"):
+        st.dataframe(analyzer.schema.match_report(), width="stretch")
+        if analyzer.schema.unmatched_columns:
+            st.write("**Colunas sem pergunta conhecida:**", analyzer.schema.unmatched_columns)
+    
+    # Intervalos de confiança de todas as métricas
+    with st.expander("📏 Intervalos de Confiança (bootstrap, 95%)"):
+        st.dataframe(analyzer.confidence_intervals().round(2), width="stretch")
+    
+    # Uso de memória dos dados processados
+    with st.expander("💾 Uso de Memória"):
+        memory = analyzer.memory_report()
+        st.write(f"**Dados processados:** {memory['processado_bytes'] / 1024 ** 2:.2f} MB")
+        st.dataframe(memory['por_coluna'], width="stretch")
+    
+    # Acertos e falhas do cache de figuras Plotly
+    with st.expander("⚡ Cache de Figuras"):
+        figure_stats = get_figure_cache().stats()
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Acertos", figure_stats['acertos'])
+        with col2:
+            st.metric("Falhas", figure_stats['falhas'])
+        with col3:
+            st.metric("Figuras em cache", f"{figure_stats['figuras']}/{figure_stats['capacidade']}")
+    
+    # Download dos dados processados: o arquivo só é gerado quando o botão é
+    # clicado (em outra thread) e fica em disco enquanto os dados não mudam
+    export_cache = get_export_cache()
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox(
+            "Formato:", available_formats(),
+            format_func=lambda f: EXPORT_FORMATS[f]['rotulo'], key="formato_exportacao"
+        )
+    with col2:
+        st.download_button(
+            label="📥 Download dos Dados Processados",
+            data=lambda: export_cache.read(analyzer, fmt),
+            file_name=f"dados_processados_in_junior.{fmt}",
+            mime=EXPORT_FORMATS[fmt]['mime'],
+            on_click="ignore"
+        )
+
+
+def render_historico(survey, uploaded_file):
+    """Seção de evolução entre ondas"""
+    st.subheader("Evolução entre Ondas")
+    create_history_charts(get_history_store())
+
+
+# Seções do dashboard (rótulo -> função que desenha a seção)
+SECTIONS = {
+    "😊 Satisfação": render_satisfacao,
+    "⏰ Carga de Trabalho": render_carga_trabalho,
+    "🏢 Estrutura Organizacional": render_estrutura,
+    "💬 Cultura de Feedback": render_feedback,
+    "🔄 Cruzamentos": render_cruzamentos,
+    "👥 Segmentos": render_segmentos,
+    "📊 Dados Detalhados": render_dados_detalhados,
+    "📅 Histórico": render_historico,
+}
+
+
+def render_performance_panel():
+    """Painel de depuração com o tempo e a memória de cada etapa medida"""
+    profiler = get_profiler()
+    with st.expander("🔍 Informações de Debug"):
+        summary = profiler.summary()
+        if summary.empty:
+            st.info("Nenhuma etapa medida ainda. Interaja com o dashboard ou envie o arquivo novamente.")
+            return
+        
+        st.write("**Tempo por etapa (acumulado desde a última limpeza):**")
+        st.bar_chart(summary.head(15).set_index('etapa')['total_ms'], horizontal=True)
+        st.dataframe(summary, width="stretch")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Formato Trace Event: abre no chrome://tracing, Perfetto ou speedscope
+            st.download_button(
+                label="📥 Baixar trace (JSON)",
+                data=lambda: json.dumps(profiler.chrome_trace()),
+                file_name="trace_dashboard.json",
+                mime="application/json",
+                on_click="ignore"
+            )
+        with col2:
+            if st.button("🧹 Limpar medições"):
+                profiler.clear()
+                st.rerun()
+
+
 # Interface principal do Streamlit
 def main():
     st.title("📊 Dashboard de Análise - IN Junior")
@@ -33,121 +442,96 @@ def main():
         type=['csv'],
         help="Faça upload do arquivo CSV com os dados da pesquisa de satisfação"
     )
+    streaming_mode = st.sidebar.checkbox(
+        "⚡ Modo streaming (arquivos grandes)",
+        help="Processa o CSV em blocos e mostra apenas métricas agregadas, sem carregar o arquivo inteiro"
+    )
+    incremental_mode = st.sidebar.checkbox(
+        "➕ Incorporar só respostas novas",
+        disabled=not streaming_mode,
+        help="No modo streaming, ao reenviar o CSV atualizado (mesmo nome de arquivo), "
+             "apenas as respostas ainda não processadas atualizam as métricas"
+    )
+    profiling = st.sidebar.checkbox(
+        "⏱️ Medir desempenho",
+        value=get_profiler().enabled,
+        help="Mede tempo e memória de cada etapa (leitura, processamento, análises e gráficos)"
+    )
+    if profiling != get_profiler().enabled:
+        get_profiler().set_enabled(profiling)
     
-    if uploaded_file is not None:
+    if uploaded_file is not None and streaming_mode:
         try:
-            # Carrega os dados
-            df = pd.read_csv(uploaded_file)
-            
-            # Inicializa o analisador
-            analyzer = INJuniorSurveyAnalyzer(df)
-            
-            # Gera o relatório
-            report = analyzer.generate_summary_report()
+            summary = load_survey_streaming(uploaded_file, incremental=incremental_mode)
+            report = summary['report']
             
-            # Exibe cards com métricas principais
+            if summary['novas'] is not None:
+                st.success(
+                    f"➕ {summary['novas']} resposta(s) nova(s) incorporada(s) — "
+                    f"total de {report['info_geral']['total_respostas']}"
+                )
             st.subheader("📈 Visão Geral")
             display_metrics_cards(report)
+            st.info("⚡ Modo streaming: gráficos detalhados e dados linha a linha não estão disponíveis.")
+            display_streaming_report(report)
             
-            # Tabs para diferentes análises
-            tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-                "😊 Satisfação",
-                "⏰ Carga de Trabalho",
-                "🏢 Estrutura Organizacional",
-                "💬 Cultura de Feedback",
-                "🔄 Cruzamentos",
-                "📊 Dados Detalhados"
-            ])
-            
-            with tab1:
-                st.subheader("Análise de Satisfação")
-                create_satisfaction_charts(analyzer)
-                
-                if 'satisfacao_geral' in report['satisfacao']:
-                    sat = report['satisfacao']['satisfacao_geral']
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.info(f"**Média:** {sat['media']}/5")
-                    with col2:
-                        st.info(f"**Mediana:** {sat['mediana']}/5")
-                    with col3:
-                        st.info(f"**Desvio Padrão:** {sat['desvio_padrao']}")
+            if summary['correlacoes'] is not None:
+                pairs = correlation_pairs(summary['correlacoes'], 'pearson')
+                st.subheader("🧮 Correlações mais fortes (Pearson)")
+                st.dataframe(pairs.head(10), width="stretch")
+        
+        except Exception as e:
+            st.error(f"Erro ao processar o arquivo: {str(e)}")
+            st.info("Verifique se o arquivo CSV está no formato correto.")
+    
+    elif uploaded_file is not None:
+        try:
+            # Carrega os dados, o analisador e o relatório (com cache)
+            survey = load_survey(uploaded_file)
+            analyzer = survey['analyzer']
+            report = survey['report']
             
-            with tab2:
-                st.subheader("Análise de Carga de Trabalho")
-                create_workload_charts(analyzer)
-                
-                # Tabela resumo
-                if report['carga_trabalho']:
-                    st.subheader("Resumo da Carga de Trabalho")
-                    workload_summary = []
-                    for key, data in report['carga_trabalho'].items():
-                        workload_summary.append({
-                            'Métrica': key.replace('_', ' ').title(),
-                            'Média': data['media'],
-                            'Mediana': data['mediana'],
-                            'Máximo': data['maximo'],
-                            'N° Respostas': data['n_respostas']
-                        })
-                    
-                    if workload_summary:
-                        st.dataframe(pd.DataFrame(workload_summary), width="stretch")
+            # Registro da pesquisa atual como uma onda do histórico
+            with st.sidebar.expander("📅 Histórico de Ondas"):
+                wave_name = st.text_input("Nome da onda:", placeholder="ex: 2025.1")
+                if st.button("Salvar como onda", disabled=not wave_name):
+                    get_history_store().ingest_wave(
+                        wave_name, analyzer, content_hash=hash_bytes(uploaded_file.getvalue())
+                    )
+                    st.success(f"Onda '{wave_name}' salva no histórico.")
             
-            with tab3:
-                st.subheader("Estrutura Organizacional")
-                create_organizational_charts(analyzer)
+            # Filtros: todas as seções passam a usar o subconjunto filtrado
+            selections, combine = render_filter_panel(analyzer)
+            if analyzer.bitmap_index().count(selections, combine) == 0:
+                st.warning("Nenhuma resposta atende aos filtros escolhidos; exibindo todas as respostas.")
+            else:
+                survey = load_filtered_survey(survey, selections, combine)
+                report = survey['report']
+                if survey['analyzer'] is not analyzer:
+                    st.info(f"🔎 Filtro ativo: {len(survey['analyzer'].df_processed)} de "
+                            f"{len(analyzer.df_processed)} respostas.")
             
-            with tab4:
-                st.subheader("Cultura de Feedback")
-                create_feedback_charts(analyzer)
+            # Exibe cards com métricas principais
+            st.subheader("📈 Visão Geral")
+            display_metrics_cards(report)
             
-            with tab5:
-                st.subheader("Análises de Cruzamento")
-                create_satisfaction_workload_charts(analyzer)
+            # Navegação por seções: apenas a seção ativa é calculada e desenhada.
+            # Os resultados de cada seção ficam memoizados no analisador, então
+            # voltar a uma seção já aberta não recalcula nada
+            section = st.radio(
+                "Seção:",
+                list(SECTIONS),
+                horizontal=True,
+                key="secao_ativa",
+                label_visibility="collapsed"
+            )
+            st.markdown("---")
+            render_section = SECTIONS[section]
+            with span(f'app.{render_section.__name__}'):
+                render_section(survey, uploaded_file)
             
-            with tab6:
-                st.subheader("Dados Detalhados")
-                
-                # Opções de visualização
-                view_option = st.radio(
-                    "Escolha o que visualizar:",
-                    ["Dados Processados", "Estatísticas Resumidas", "Dados Originais"]
-                )
-                
-                if view_option == "Dados Processados":
-                    st.dataframe(analyzer.df_processed, width="stretch")
-                
-                elif view_option == "Estatísticas Resumidas":
-                    try:
-                        numeric_cols = analyzer.df_processed.select_dtypes(include=['number']).columns
-                        if len(numeric_cols) > 0:
-                            st.dataframe(analyzer.df_processed[numeric_cols].describe(), width="stretch")
-                        else:
-                            st.warning("Nenhuma coluna numérica encontrada para estatísticas.")
-                    except Exception as e:
-                        st.error(f"Erro ao gerar estatísticas: {str(e)}")
-                        st.info("Tentando método alternativo...")
-                        try:
-                            # Método alternativo
-                            numeric_data = analyzer.df_processed._get_numeric_data()
-                            if not numeric_data.empty:
-                                st.dataframe(numeric_data.describe(), width="stretch")
-                            else:
-                                st.warning("Nenhuma coluna numérica encontrada.")
-                        except:
-                            st.warning("Não foi possível gerar estatísticas para este dataset.")
-                
-                else:  # Dados Originais
-                    st.dataframe(df, width="stretch")
-                
-                # Download dos dados processados
-                csv = analyzer.df_processed.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download dos Dados Processados",
-                    data=csv,
-                    file_name="dados_processados_in_junior.csv",
-                    mime="text/csv"
-                )
+            if get_profiler().enabled:
+                render_performance_panel()
         
         except Exception as e:
             st.error(f"Erro ao processar o arquivo: {str(e)}")
@@ -170,7 +554,7 @@ def main():
             
             1. **Upload do Arquivo**: Use a barra lateral para fazer upload do arquivo CSV da pesquisa
             2. **Visualização Automática**: O dashboard processará os dados automaticamente
-            3. **Navegação por Abas**: Use as abas para explorar diferentes aspectos da análise
+            3. **Navegação por Seções**: Use o seletor de seções para explorar diferentes aspectos da análise
             4. **Métricas Interativas**: Todos os gráficos são interativos - você pode fazer zoom, filtrar, etc.
             5. **Cruzamentos**: Nova aba para análises de correlação entre variáveis
             
@@ -0,0 +1,207 @@
+"""
+Geração de relatórios em lote (sem interface) para uma pasta de CSVs da pesquisa
+
+Uso:
+    python batch_report.py PASTA_CSV PASTA_SAIDA [--workers N] [--formato json parquet] [--recursivo]
+
+Cada arquivo é processado em um processo separado. Para cada CSV são
+gravados o relatório resumo + cruzamento satisfação vs carga (JSON) e a
+tabela de métricas (Parquet). Ao final, um índice combinado (indice.json e
+indice.csv) lista o status de todos os arquivos; falhas são registradas por
+arquivo sem interromper os demais.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_analysis.survey_analyzer import INJuniorSurveyAnalyzer
+from data_analysis.history import report_aggregates
+from data_analysis.metric_results import MetricResult
+from data_analysis.cruzamentos.registry import DEFAULT_MAX_WORKERS
+from data_analysis.cruzamentos.satisfacao_vs_carga import analyze_satisfaction_vs_workload
+
+
+# Séries com os dados linha a linha, que não entram nos arquivos de saída
+RAW_DATA_KEYS = {'data', 'numeric_data', 'data_numerica'}
+
+AVAILABLE_FORMATS = ('json', 'parquet')
+
+
+def _to_jsonable(value):
+    """Converte o relatório (dicts, Series, DataFrames, escalares numpy) para JSON"""
+    if isinstance(value, MetricResult):
+        # Só os agregados: as séries sob demanda não são montadas
+        value = value.to_dict()
+    if isinstance(value, dict):
+        return {
+            str(key): _to_jsonable(item) for key, item in value.items()
+            if key not in RAW_DATA_KEYS
+        }
+    if isinstance(value, pd.DataFrame):
+        return {str(col): _to_jsonable(value[col]) for col in value.columns}
+    if isinstance(value, pd.Series):
+        return {str(key): _to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def _output_stem(path, input_dir):
+    """Nome base dos arquivos de saída (subpastas viram prefixo com '__')"""
+    relative = Path(path).relative_to(input_dir).with_suffix('')
+    return '__'.join(relative.parts)
+
+
+def process_file(path, input_dir, output_dir, formats, crossing_workers=1):
+    """
+    Processa um CSV e grava as saídas (executado em um processo do pool)
+    
+    Args:
+        path (str): CSV da pesquisa
+        input_dir (str): Pasta de entrada (para nomear as saídas)
+        output_dir (str): Pasta de saída
+        formats (tuple): Formatos a gravar ('json' e/ou 'parquet')
+        crossing_workers (int): Threads dos cruzamentos; 1 dentro do pool de
+            processos, que já ocupa todos os núcleos
+    
+    Returns:
+        dict: Linha do índice (arquivo, status, erro, métricas principais e saídas)
+    """
+    start = time.perf_counter()
+    entry = {'arquivo': str(path), 'status': 'ok', 'erro': None}
+    stem = _output_stem(path, input_dir)
+    
+    try:
+        analyzer = INJuniorSurveyAnalyzer(pd.read_csv(path), keep_raw=False)
+        report = analyzer.generate_summary_report()
+        crossing = analyze_satisfaction_vs_workload(analyzer, max_workers=crossing_workers)
+        
+        entry['total_respostas'] = report['info_geral']['total_respostas']
+        satisfaction = report.get('satisfacao', {}).get('satisfacao_geral')
+        entry['satisfacao_media'] = satisfaction['media'] if satisfaction else None
+        
+        if 'json' in formats:
+            json_path = Path(output_dir) / f'{stem}.json'
+            with open(json_path, 'w', encoding='utf-8') as handle:
+                json.dump(
+                    _to_jsonable({'relatorio': report, 'cruzamento_satisfacao_carga': crossing}),
+                    handle, ensure_ascii=False, indent=2
+                )
+            entry['saida_json'] = str(json_path)
+        
+        if 'parquet' in formats:
+            parquet_path = Path(output_dir) / f'{stem}_metricas.parquet'
+            metrics = pd.DataFrame(
+                list(report_aggregates(report)),
+                columns=['secao', 'chave', 'estatistica', 'valor']
+            )
+            metrics.to_parquet(parquet_path, index=False)
+            entry['saida_parquet'] = str(parquet_path)
+    
+    except Exception as e:
+        entry['status'] = 'erro'
+        entry['erro'] = f'{type(e).__name__}: {e}'
+        entry['traceback'] = traceback.format_exc()
+    
+    entry['segundos'] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def run_batch(input_dir, output_dir, workers=None, formats=AVAILABLE_FORMATS, recursive=False):
+    """
+    Processa todos os CSVs de uma pasta em paralelo
+    
+    Args:
+        input_dir (str): Pasta com os CSVs
+        output_dir (str): Pasta de saída (criada se não existir)
+        workers (int, optional): Número de processos (padrão: número de núcleos)
+        formats (tuple): Formatos a gravar por arquivo
+        recursive (bool): Incluir subpastas
+    
+    Returns:
+        DataFrame: Índice com uma linha por arquivo, na ordem dos nomes
+    """
+    if 'parquet' in formats and importlib.util.find_spec('pyarrow') is None:
+        print("⚠️ pyarrow não instalado: saída Parquet desativada.", file=sys.stderr)
+        formats = tuple(fmt for fmt in formats if fmt != 'parquet')
+    
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    files = sorted(input_dir.rglob('*.csv') if recursive else input_dir.glob('*.csv'))
+    workers = workers or os.cpu_count() or 1
+    entries = []
+    
+    if workers == 1 or len(files) <= 1:
+        for path in files:
+            entries.append(process_file(path, input_dir, output_dir, formats, crossing_workers=DEFAULT_MAX_WORKERS))
+            _print_progress(entries[-1], len(entries), len(files))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+            futures = {
+                executor.submit(process_file, path, input_dir, output_dir, formats): path
+                for path in files
+            }
+            for future in as_completed(futures):
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    # Falha do próprio processo (ex: falta de memória), não do processamento
+                    entry = {'arquivo': str(futures[future]), 'status': 'erro', 'erro': f'{type(e).__name__}: {e}'}
+                entries.append(entry)
+                _print_progress(entry, len(entries), len(files))
+    
+    index = pd.DataFrame(entries)
+    if not index.empty:
+        index = index.sort_values('arquivo').reset_index(drop=True)
+    if 'total_respostas' in index.columns:
+        index['total_respostas'] = index['total_respostas'].astype('Int64')
+    
+    with open(output_dir / 'indice.json', 'w', encoding='utf-8') as handle:
+        json.dump(_to_jsonable(index.to_dict('records')), handle, ensure_ascii=False, indent=2)
+    index.drop(columns=['traceback'], errors='ignore').to_csv(output_dir / 'indice.csv', index=False)
+    
+    return index
+
+
+def _print_progress(entry, done, total):
+    status = '✅' if entry['status'] == 'ok' else f"❌ {entry['erro']}"
+    print(f"[{done}/{total}] {entry['arquivo']} {status}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Relatórios em lote da pesquisa IN Junior')
+    parser.add_argument('entrada', help='Pasta com os arquivos CSV')
+    parser.add_argument('saida', help='Pasta onde os relatórios serão gravados')
+    parser.add_argument('--workers', type=int, default=None, help='Número de processos (padrão: núcleos da máquina)')
+    parser.add_argument('--formato', nargs='+', choices=AVAILABLE_FORMATS, default=list(AVAILABLE_FORMATS),
+                        help='Formatos de saída por arquivo')
+    parser.add_argument('--recursivo', action='store_true', help='Incluir CSVs das subpastas')
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    index = run_batch(args.entrada, args.saida, args.workers, tuple(args.formato), args.recursivo)
+    failures = int((index['status'] != 'ok').sum()) if not index.empty else 0
+    
+    print(f"\n{len(index)} arquivo(s) em {time.perf_counter() - start:.1f}s — {failures} falha(s). "
+          f"Índice: {Path(args.saida) / 'indice.csv'}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Benchmark do pipeline de análise com dados sintéticos (tempo e memória por etapa)
+
+Uso:
+    python benchmark.py executar [--tamanhos 1000 100000 1000000] [--ausentes 0.05] [--saida PASTA] [--comparar ANTERIOR.json]
+    python benchmark.py gerar N_LINHAS ARQUIVO.csv [--ausentes 0.05] [--semente 42]
+
+Cada tamanho gera um CSV sintético (cabeçalhos e vocabulários reais) e
+executa as etapas do pipeline duas vezes: uma medindo o tempo e outra, com
+tracemalloc, o pico de memória alocada em cada etapa. Os resultados são
+gravados em JSON; com --comparar, as variações em relação a uma execução
+anterior são listadas para evidenciar regressões.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_analysis.survey_analyzer import INJuniorSurveyAnalyzer
+from data_analysis.streaming import StreamingSurveyAnalyzer
+from data_analysis.synthetic import DEFAULT_MISSING_RATE, DEFAULT_SEED, write_survey_csv
+from data_analysis.cruzamentos.satisfacao_vs_carga import (
+    analyze_satisfaction_vs_workload, create_satisfaction_workload_charts
+)
+from data_analysis.cruzamentos.matriz_correlacao import create_correlation_matrix_charts
+from charts.satisfaction_charts import create_satisfaction_charts
+from charts.workload_charts import create_workload_charts
+from charts.organizational_charts import create_organizational_charts
+from charts.feedback_charts import create_feedback_charts
+from charts.segment_charts import create_segment_charts
+from utils.figure_cache import get_figure_cache
+
+# Os gráficos rodam fora de uma sessão do Streamlit ("bare mode"); os avisos
+# emitidos a cada comando (e por widgets com chave) não interessam aqui. Um
+# filtro é usado porque o Streamlit redefine o nível dos seus loggers ao
+# carregar a configuração
+logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').addFilter(
+    lambda record: 'missing ScriptRunContext' not in record.getMessage()
+)
+logging.getLogger('streamlit.runtime.state.session_state_proxy').addFilter(
+    lambda record: 'Session state does not function' not in record.getMessage()
+)
+
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+
+DEFAULT_OUTPUT_DIR = 'resultados_benchmark'
+
+# Variação relativa de tempo a partir da qual a comparação marca regressão
+REGRESSION_THRESHOLD = 0.2
+
+# Filtro medido na etapa 'filtro' (mesmo tipo de seleção do painel de filtros)
+BENCHMARK_FILTER = {
+    'horas_semanais_diretoria': ['Mais de 15 horas'],
+    'projetos_simultaneos': ['Dois', 'Três', 'Mais de três']
+}
+
+
+def _build_charts(analyzer):
+    """Constrói todos os gráficos do dashboard (sem reaproveitar figuras em cache)"""
+    get_figure_cache().clear()
+    create_satisfaction_charts(analyzer)
+    create_workload_charts(analyzer)
+    create_organizational_charts(analyzer)
+    create_feedback_charts(analyzer)
+    create_satisfaction_workload_charts(analyzer)
+    create_correlation_matrix_charts(analyzer)
+    create_segment_charts(analyzer)
+
+
+def pipeline_stages(csv_path):
+    """
+    Etapas do pipeline, na ordem em que o dashboard as executa
+    
+    Cada etapa recebe o estado produzido pelas anteriores (dict) e grava nele
+    o que as seguintes precisam.
+    
+    Returns:
+        list: Pares (nome da etapa, função(state))
+    """
+    def read_csv(state):
+        state['df'] = pd.read_csv(csv_path)
+    
+    def process(state):
+        state['analyzer'] = INJuniorSurveyAnalyzer(state.pop('df'), keep_raw=False)
+    
+    return [
+        ('leitura_csv', read_csv),
+        ('processamento', process),
+        ('relatorio_resumo', lambda state: state['analyzer'].generate_summary_report()),
+        ('cruzamento_satisfacao_carga', lambda state: analyze_satisfaction_vs_workload(state['analyzer'])),
+        ('correlacoes', lambda state: state['analyzer'].analyze_correlations()),
+        ('associacoes', lambda state: state['analyzer'].analyze_associations()),
+        ('intervalos_confianca', lambda state: state['analyzer'].confidence_intervals()),
+        ('segmentos', lambda state: state['analyzer'].segment_report('diretoria')),
+        ('graficos', lambda state: _build_charts(state['analyzer'])),
+        ('indice_bitmap', lambda state: state['analyzer'].bitmap_index()),
+        ('filtro', lambda state: state['analyzer'].filtered(BENCHMARK_FILTER).generate_summary_report()),
+        ('modo_streaming', lambda state: StreamingSurveyAnalyzer.from_csv(csv_path).generate_summary_report())
+    ]
+
+
+def run_stages(csv_path, measure_memory=False):
+    """
+    Executa todas as etapas uma vez
+    
+    Args:
+        csv_path (str): CSV sintético
+        measure_memory (bool): Medir o pico de memória (tracemalloc) em vez do tempo
+    
+    Returns:
+        dict: Etapa -> segundos ou pico de memória em MB
+    """
+    state = {}
+    measurements = {}
+    if measure_memory:
+        tracemalloc.start()
+    
+    try:
+        for name, stage in pipeline_stages(csv_path):
+            gc.collect()
+            if measure_memory:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                stage(state)
+                measurements[name] = round((tracemalloc.get_traced_memory()[1] - before) / 1024 ** 2, 2)
+            else:
+                start = time.perf_counter()
+                stage(state)
+                measurements[name] = round(time.perf_counter() - start, 4)
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+    
+    return measurements
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, missing_rate=DEFAULT_MISSING_RATE, seed=DEFAULT_SEED):
+    """
+    Executa o benchmark para cada tamanho
+    
+    Returns:
+        dict: Ambiente de execução e uma linha por (tamanho, etapa)
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in sizes:
+            csv_path = os.path.join(tmp_dir, f'pesquisa_{n_rows}.csv')
+            start = time.perf_counter()
+            write_survey_csv(csv_path, n_rows, missing_rate, seed)
+            print(f"[{n_rows:,} linhas] CSV gerado em {time.perf_counter() - start:.1f}s", flush=True)
+            
+            times = run_stages(csv_path)
+            memory = run_stages(csv_path, measure_memory=True)
+            for stage, seconds in times.items():
+                results.append({
+                    'linhas': n_rows,
+                    'etapa': stage,
+                    'segundos': seconds,
+                    'pico_memoria_mb': memory.get(stage)
+                })
+                print(f"  {stage:<30} {seconds:>9.3f}s {memory.get(stage):>10.1f} MB", flush=True)
+    
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'ambiente': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'processador': platform.processor() or platform.machine()
+        },
+        'parametros': {'tamanhos': list(sizes), 'ausentes': missing_rate, 'semente': seed},
+        'resultados': results
+    }
+
+
+def compare_results(current, previous, threshold=REGRESSION_THRESHOLD):
+    """
+    Compara duas execuções etapa a etapa
+    
+    Args:
+        current (dict): Resultado de `run_benchmark`
+        previous (dict): Resultado anterior (mesmo formato)
+        threshold (float): Aumento relativo de tempo considerado regressão
+    
+    Returns:
+        DataFrame: linhas, etapa, tempos e memória antes/depois, variação e 'regressao'
+    """
+    columns = ['linhas', 'etapa', 'segundos', 'pico_memoria_mb']
+    merged = pd.DataFrame(current['resultados'])[columns].merge(
+        pd.DataFrame(previous['resultados'])[columns],
+        on=['linhas', 'etapa'], suffixes=('', '_anterior')
+    )
+    merged['variacao_tempo'] = (merged['segundos'] / merged['segundos_anterior'] - 1).round(3)
+    merged['regressao'] = merged['variacao_tempo'] > threshold
+    return merged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark do pipeline de análise da pesquisa IN Junior')
+    commands = parser.add_subparsers(dest='comando', required=True)
+    
+    run = commands.add_parser('executar', help='Mede tempo e memória de cada etapa')
+    run.add_argument('--tamanhos', type=int, nargs='+', default=DEFAULT_SIZES, help='Números de linhas')
+    run.add_argument('--ausentes', type=float, default=DEFAULT_MISSING_RATE, help='Fração de respostas em branco')
+    run.add_argument('--semente', type=int, default=DEFAULT_SEED)
+    run.add_argument('--saida', default=DEFAULT_OUTPUT_DIR, help='Pasta dos resultados JSON')
+    run.add_argument('--comparar', help='JSON de uma execução anterior')
+    
+    generate = commands.add_parser('gerar', help='Grava um CSV sintético')
+    generate.add_argument('linhas', type=int)
+    generate.add_argument('arquivo')
+    generate.add_argument('--ausentes', type=float, default=DEFAULT_MISSING_RATE)
+    generate.add_argument('--semente', type=int, default=DEFAULT_SEED)
+    
+    args = parser.parse_args(argv)
+    
+    if args.comando == 'gerar':
+        write_survey_csv(args.arquivo, args.linhas, args.ausentes, args.semente)
+        print(f"{args.linhas:,} respostas gravadas em {args.arquivo}")
+        return 0
+    
+    result = run_benchmark(args.tamanhos, args.ausentes, args.semente)
+    output_dir = Path(args.saida)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    with open(output_path, 'w', encoding='utf-8') as handle:
+        json.dump(result, handle, ensure_ascii=False, indent=2)
+    print(f"\nResultados: {output_path}")
+    
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as handle:
+            comparison = compare_results(result, json.load(handle))
+        print(comparison.to_string(index=False))
+        regressions = int(comparison['regressao'].sum())
+        print(f"\n{regressions} etapa(s) mais de {REGRESSION_THRESHOLD:.0%} mais lenta(s)")
+        return 1 if regressions else 0
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,10 +6,14 @@ from .satisfaction_charts import create_satisfaction_charts
 from .workload_charts import create_workload_charts
 from .organizational_charts import create_organizational_charts
 from .feedback_charts import create_feedback_charts
+from .history_charts import create_history_charts
+from .segment_charts import create_segment_charts
 
 __all__ = [
     'create_satisfaction_charts',
     'create_workload_charts', 
     'create_organizational_charts',
-    'create_feedback_charts'
+    'create_feedback_charts',
+    'create_history_charts',
+    'create_segment_charts'
 ]
@@ -4,11 +4,14 @@ Gráficos da cultura de feedback
 
 import streamlit as st
 import plotly.express as px
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
 
 
+@profiled('graficos.feedback')
 def create_feedback_charts(analyzer):
     """Cria gráficos da cultura de feedback"""
-    feedback_data = analyzer.analyze_feedback_culture()
+    feedback_data = analyzer.results.get('cultura_feedback')
     
     if feedback_data:
         metrics_names = []
@@ -25,13 +28,16 @@ def create_feedback_charts(analyzer):
             metrics_values.append(data['media'])
         
         if metrics_names:
-            fig = px.bar(
-                x=metrics_names,
-                y=metrics_values,
-                title="Cultura de Feedback (Médias)",
-                labels={'x': 'Aspecto', 'y': 'Média (1-5)'},
-                color=metrics_values,
-                color_continuous_scale='plasma'
-            )
-            fig.update_layout(showlegend=False)
+            def _build():
+                fig = px.bar(
+                    x=metrics_names,
+                    y=metrics_values,
+                    title="Cultura de Feedback (Médias)",
+                    labels={'x': 'Aspecto', 'y': 'Média (1-5)'},
+                    color=metrics_values,
+                    color_continuous_scale='plasma'
+                )
+                fig.update_layout(showlegend=False)
+                return fig
+            fig = cached_figure(analyzer, 'feedback_medias', _build)
             st.plotly_chart(fig, width="stretch")
@@ -0,0 +1,55 @@
+"""
+Gráficos de tendência entre ondas da pesquisa
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from data_analysis.history import AGGREGATE_STATISTICS
+from utils.profiling import profiled
+
+
+@profiled('graficos.historico')
+def create_history_charts(store):
+    """Cria os gráficos de tendência a partir dos agregados do histórico"""
+    waves = store.waves()
+    
+    if waves.empty:
+        st.info("Nenhuma onda salva ainda. Use \"Salvar como onda\" na barra lateral para registrar a pesquisa atual.")
+        return
+    
+    st.dataframe(waves, width="stretch")
+    
+    metrics = store.available_metrics()
+    keys = list(dict.fromkeys(metrics['chave']))
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected = st.multiselect(
+            "Métricas:",
+            keys,
+            default=[key for key in ['satisfacao_geral'] if key in keys]
+        )
+    with col2:
+        statistic = st.selectbox("Estatística:", AGGREGATE_STATISTICS, index=AGGREGATE_STATISTICS.index('media'))
+    
+    if not selected:
+        return
+    
+    trend = store.trend(selected, statistic)
+    if trend.empty:
+        st.warning("Nenhum dado para as métricas selecionadas.")
+        return
+    
+    long_format = trend.reset_index().melt(id_vars='onda', var_name='Métrica', value_name='Valor')
+    fig = px.line(
+        long_format,
+        x='onda',
+        y='Valor',
+        color='Métrica',
+        markers=True,
+        title=f"Evolução por Onda - {statistic.replace('_', ' ').title()}",
+        labels={'onda': 'Onda'}
+    )
+    fig.update_xaxes(type='category')
+    st.plotly_chart(fig, width="stretch")
@@ -4,11 +4,14 @@ Gráficos da estrutura organizacional
 
 import streamlit as st
 import plotly.express as px
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
 
 
+@profiled('graficos.estrutura')
 def create_organizational_charts(analyzer):
     """Cria gráficos da estrutura organizacional"""
-    org_data = analyzer.analyze_organizational_structure()
+    org_data = analyzer.results.get('estrutura_organizacional')
     
     if org_data:
         # Gráfico de barras com as médias
@@ -26,13 +29,16 @@ def create_organizational_charts(analyzer):
             metrics_values.append(data['media'])
         
         if metrics_names:
-            fig = px.bar(
-                x=metrics_names,
-                y=metrics_values,
-                title="Avaliação da Estrutura Organizacional (Médias)",
-                labels={'x': 'Aspecto', 'y': 'Média (1-5)'},
-                color=metrics_values,
-                color_continuous_scale='viridis'
-            )
-            fig.update_layout(showlegend=False)
+            def _build():
+                fig = px.bar(
+                    x=metrics_names,
+                    y=metrics_values,
+                    title="Avaliação da Estrutura Organizacional (Médias)",
+                    labels={'x': 'Aspecto', 'y': 'Média (1-5)'},
+                    color=metrics_values,
+                    color_continuous_scale='viridis'
+                )
+                fig.update_layout(showlegend=False)
+                return fig
+            fig = cached_figure(analyzer, 'estrutura_medias', _build)
             st.plotly_chart(fig, width="stretch")
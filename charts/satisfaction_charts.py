@@ -4,11 +4,14 @@ Gráficos de satisfação
 
 import streamlit as st
 import plotly.express as px
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
 
 
+@profiled('graficos.satisfacao')
 def create_satisfaction_charts(analyzer):
     """Cria gráficos de satisfação usando Plotly"""
-    satisfaction_data = analyzer.calculate_satisfaction_metrics()
+    satisfaction_data = analyzer.results.get('satisfacao')
     
     if 'satisfacao_geral' in satisfaction_data:
         data = satisfaction_data['satisfacao_geral']['data']
@@ -17,22 +20,28 @@ def create_satisfaction_charts(analyzer):
         
         with col1:
             # Histograma
-            fig_hist = px.histogram(
-                x=data, 
-                nbins=5,
-                title="Distribuição da Satisfação Geral",
-                labels={'x': 'Nível de Satisfação', 'count': 'Frequência'},
-                color_discrete_sequence=['#1f77b4']
-            )
-            fig_hist.update_layout(showlegend=False)
+            def _build():
+                fig_hist = px.histogram(
+                    x=data, 
+                    nbins=5,
+                    title="Distribuição da Satisfação Geral",
+                    labels={'x': 'Nível de Satisfação', 'count': 'Frequência'},
+                    color_discrete_sequence=['#1f77b4']
+                )
+                fig_hist.update_layout(showlegend=False)
+                return fig_hist
+            fig_hist = cached_figure(analyzer, 'satisfacao_histograma', _build)
             st.plotly_chart(fig_hist, width="stretch")
         
         with col2:
             # Box plot
-            fig_box = px.box(
-                y=data,
-                title="Box Plot - Satisfação Geral",
-                labels={'y': 'Nível de Satisfação'}
-            )
-            fig_box.update_traces(marker_color='#ff7f0e')
+            def _build():
+                fig_box = px.box(
+                    y=data,
+                    title="Box Plot - Satisfação Geral",
+                    labels={'y': 'Nível de Satisfação'}
+                )
+                fig_box.update_traces(marker_color='#ff7f0e')
+                return fig_box
+            fig_box = cached_figure(analyzer, 'satisfacao_boxplot', _build)
             st.plotly_chart(fig_box, width="stretch")
@@ -0,0 +1,83 @@
+"""
+Gráficos das métricas por segmento
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from data_analysis.segmentation import DEFAULT_MIN_SEGMENT_SIZE
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
+
+
+def _label(key):
+    return key.replace('_', ' ').title()
+
+
+@profiled('graficos.segmentos')
+def create_segment_charts(analyzer):
+    """Cria a comparação de métricas entre segmentos (diretoria, projetos, faixas de horas)"""
+    options = list(analyzer.schema.columns_of_type('categorico', 'faixa'))
+    
+    if not options:
+        st.warning("Nenhuma coluna de segmentação (diretoria, faixas de horas, projetos) foi encontrada.")
+        return
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        by = st.multiselect(
+            "Segmentar por:",
+            options,
+            default=options[:1],
+            format_func=_label
+        )
+    with col2:
+        min_n = st.number_input(
+            "Mínimo de respostas:",
+            min_value=1,
+            value=DEFAULT_MIN_SEGMENT_SIZE,
+            help="Segmentos ou métricas com menos respostas têm as estatísticas ocultadas"
+        )
+    
+    if not by:
+        return
+    
+    # Agregação memoizada por agrupamento; mudar o mínimo ou a métrica não recalcula
+    table = analyzer.segment_report(by, min_n=int(min_n))
+    if table.empty:
+        st.warning("Sem dados para os segmentos escolhidos.")
+        return
+    
+    table = table.copy()
+    table['segmento'] = table[by].astype(str).agg(' / '.join, axis=1)
+    
+    metric = st.selectbox("Métrica:", list(table['chave'].cat.categories), format_func=_label)
+    data = table[(table['chave'] == metric) & ~table['suprimido']]
+    
+    if data.empty:
+        st.info("Todos os segmentos desta métrica estão abaixo do mínimo de respostas.")
+    else:
+        def _build():
+            fig = px.bar(
+                data,
+                x='segmento',
+                y='media',
+                text='media',
+                hover_data=['n_respostas', 'mediana', 'desvio_padrao'],
+                title=f"{_label(metric)} por {' / '.join(_label(key) for key in by)}",
+                labels={'segmento': 'Segmento', 'media': 'Média'}
+            )
+            return fig
+        fig = cached_figure(analyzer, 'segmentos_barras', _build, by=tuple(by), min_n=int(min_n), metric=metric)
+        st.plotly_chart(fig, width="stretch")
+    
+    suppressed = table.loc[table['suprimido'], 'segmento'].nunique()
+    if suppressed:
+        st.caption(f"🔒 {suppressed} segmento(s) com menos de {int(min_n)} respostas em alguma métrica foram ocultados.")
+    
+    # Médias de todas as métricas por segmento
+    with st.expander("📋 Tabela de médias por segmento"):
+        st.dataframe(
+            table.pivot(index='segmento', columns='chave', values='media').rename(columns=_label),
+            width="stretch"
+        )
@@ -5,12 +5,15 @@ Gráficos de carga de trabalho
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
 
 
+@profiled('graficos.carga_trabalho')
 def create_workload_charts(analyzer):
     """Cria gráficos de carga de trabalho usando dados categóricos"""
     try:
-        workload_data = analyzer.analyze_workload_distribution()
+        workload_data = analyzer.results.get('carga_trabalho')
         
         # Debug: Verificar se há dados
         if not workload_data:
@@ -46,15 +49,18 @@ def create_workload_charts(analyzer):
                     value_counts = data['value_counts']
                     
                     if len(value_counts) > 0:
-                        fig_dir = px.bar(
-                            x=value_counts.index,
-                            y=value_counts.values,
-                            title="Distribuição - Horas Diretoria/Semana",
-                            labels={'x': 'Faixa de Horas', 'y': 'Quantidade de Respostas'},
-                            color=value_counts.values,
-                            color_continuous_scale='greens'
-                        )
-                        fig_dir.update_layout(showlegend=False)
+                        def _build():
+                            fig_dir = px.bar(
+                                x=value_counts.index,
+                                y=value_counts.values,
+                                title="Distribuição - Horas Diretoria/Semana",
+                                labels={'x': 'Faixa de Horas', 'y': 'Quantidade de Respostas'},
+                                color=value_counts.values,
+                                color_continuous_scale='greens'
+                            )
+                            fig_dir.update_layout(showlegend=False)
+                            return fig_dir
+                        fig_dir = cached_figure(analyzer, 'carga_horas_diretoria', _build)
                         st.plotly_chart(fig_dir, width="stretch")
                         
                         # Mostra estatísticas se disponíveis
@@ -76,15 +82,18 @@ def create_workload_charts(analyzer):
                     value_counts = data['value_counts']
                     
                     if len(value_counts) > 0:
-                        fig_proj = px.bar(
-                            x=value_counts.index,
-                            y=value_counts.values,
-                            title="Distribuição - Horas Projeto/Semana",
-                            labels={'x': 'Faixa de Horas', 'y': 'Quantidade de Respostas'},
-                            color=value_counts.values,
-                            color_continuous_scale='oranges'
-                        )
-                        fig_proj.update_layout(showlegend=False)
+                        def _build():
+                            fig_proj = px.bar(
+                                x=value_counts.index,
+                                y=value_counts.values,
+                                title="Distribuição - Horas Projeto/Semana",
+                                labels={'x': 'Faixa de Horas', 'y': 'Quantidade de Respostas'},
+                                color=value_counts.values,
+                                color_continuous_scale='oranges'
+                            )
+                            fig_proj.update_layout(showlegend=False)
+                            return fig_proj
+                        fig_proj = cached_figure(analyzer, 'carga_horas_projeto', _build)
                         st.plotly_chart(fig_proj, width="stretch")
                         
                         # Mostra estatísticas se disponíveis
@@ -109,12 +118,15 @@ def create_workload_charts(analyzer):
                     value_counts = data['value_counts']
                     
                     if len(value_counts) > 0:
-                        fig_proj_num = px.pie(
-                            values=value_counts.values,
-                            names=value_counts.index,
-                            title="Distribuição - Número de Projetos",
-                            color_discrete_sequence=px.colors.qualitative.Set3
-                        )
+                        def _build():
+                            fig_proj_num = px.pie(
+                                values=value_counts.values,
+                                names=value_counts.index,
+                                title="Distribuição - Número de Projetos",
+                                color_discrete_sequence=px.colors.qualitative.Set3
+                            )
+                            return fig_proj_num
+                        fig_proj_num = cached_figure(analyzer, 'carga_numero_projetos', _build)
                         st.plotly_chart(fig_proj_num, width="stretch")
                         
                         if 'media' in data:
@@ -138,13 +150,16 @@ def create_workload_charts(analyzer):
                     proj_data = workload_data['horas_semanais_projeto']['numeric_data']
                     
                     if len(dir_data) > 0 and len(proj_data) > 0:
-                        fig_compare = go.Figure()
-                        fig_compare.add_trace(go.Box(y=dir_data, name='Diretoria', marker_color='green'))
-                        fig_compare.add_trace(go.Box(y=proj_data, name='Projeto', marker_color='orange'))
-                        fig_compare.update_layout(
-                            title="Comparação de Carga de Trabalho",
-                            yaxis_title="Horas/Semana (estimativa)"
-                        )
+                        def _build():
+                            fig_compare = go.Figure()
+                            fig_compare.add_trace(go.Box(y=dir_data, name='Diretoria', marker_color='green'))
+                            fig_compare.add_trace(go.Box(y=proj_data, name='Projeto', marker_color='orange'))
+                            fig_compare.update_layout(
+                                title="Comparação de Carga de Trabalho",
+                                yaxis_title="Horas/Semana (estimativa)"
+                            )
+                            return fig_compare
+                        fig_compare = cached_figure(analyzer, 'carga_comparativo', _build)
                         st.plotly_chart(fig_compare, width="stretch")
                     else:
                         st.info("Dados insuficientes para gráfico comparativo")
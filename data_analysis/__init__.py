@@ -3,5 +3,44 @@ Módulo de análise de dados da pesquisa IN Junior
 """
 
 from .survey_analyzer import INJuniorSurveyAnalyzer
+from .analysis_results import AnalysisResults
+from .metric_registry import METRIC_GROUPS, register_metric_group
+from .metric_results import MetricResult
+from .schema import QUESTION_CATALOG, SchemaResolver, get_schema_resolver, register_question
+from .correlation_engine import correlation_matrix, correlation_pairs
+from .bitmap_index import BitmapIndex, filter_signature
+from .contingency import association_matrix, association_pairs, contingency_table, crosstab_frame
+from .resampling import bootstrap_intervals, permutation_test_correlation
+from .segmentation import segment_metrics, suppress_small_segments
+from .history import SurveyHistoryStore, get_history_store, normalized_responses, report_aggregates
+from .synthetic import generate_survey, write_survey_csv
 
-__all__ = ['INJuniorSurveyAnalyzer']
+__all__ = [
+    'INJuniorSurveyAnalyzer',
+    'AnalysisResults',
+    'METRIC_GROUPS',
+    'register_metric_group',
+    'MetricResult',
+    'QUESTION_CATALOG',
+    'SchemaResolver',
+    'get_schema_resolver',
+    'register_question',
+    'correlation_matrix',
+    'correlation_pairs',
+    'association_matrix',
+    'association_pairs',
+    'contingency_table',
+    'crosstab_frame',
+    'BitmapIndex',
+    'filter_signature',
+    'bootstrap_intervals',
+    'permutation_test_correlation',
+    'segment_metrics',
+    'suppress_small_segments',
+    'SurveyHistoryStore',
+    'get_history_store',
+    'normalized_responses',
+    'report_aggregates',
+    'generate_survey',
+    'write_survey_csv'
+]
@@ -0,0 +1,141 @@
+"""
+Resultados memoizados do analisador, com rastreamento de dependências
+"""
+
+import threading
+
+from utils.profiling import span
+
+
+class AnalysisResults:
+    """
+    Plano de análise "calcula uma vez" compartilhado por relatório e gráficos
+
+    Cada resultado é registrado com um nome e uma função sem argumentos. O
+    valor é calculado na primeira leitura e reaproveitado até que a versão
+    dos dados do analisador mude. As dependências são registradas
+    automaticamente: se, durante o cálculo de A, a função lê o resultado B,
+    então invalidar B também invalida A.
+
+    O lock geral protege só o estado do cache. Cada resultado é calculado
+    sob um lock próprio, então threads diferentes calculam resultados
+    diferentes ao mesmo tempo (ex: cruzamentos no pool) e esperam apenas
+    quando pedem o mesmo resultado.
+    """
+
+    def __init__(self, analyzer):
+        """
+        Args:
+            analyzer: Instância do INJuniorSurveyAnalyzer dona dos resultados
+        """
+        self._analyzer = analyzer
+        self._producers = {}
+        self._values = {}
+        self._dependents = {}
+        self._version = analyzer.data_version
+        self._lock = threading.RLock()
+        # Resultado -> lock do seu cálculo
+        self._compute_locks = {}
+        # Incrementado a cada invalidação: um valor calculado durante uma
+        # invalidação é devolvido, mas não guardado
+        self._generation = 0
+        # Pilha dos resultados em cálculo, por thread
+        self._local = threading.local()
+        self.compute_counts = {}
+
+    def register(self, name, producer):
+        """
+        Registra um resultado calculável
+
+        Args:
+            name (str): Nome do resultado (ex: 'satisfacao')
+            producer (callable): Função sem argumentos que calcula o valor
+        """
+        with self._lock:
+            self._producers[name] = producer
+            self.invalidate(name)
+
+    def _computing(self):
+        stack = getattr(self._local, 'computing', None)
+        if stack is None:
+            stack = self._local.computing = []
+        return stack
+
+    def get(self, name):
+        """Retorna o resultado, calculando-o apenas se ainda não estiver em cache"""
+        computing = self._computing()
+        with self._lock:
+            self._sync_version()
+
+            # Quem está sendo calculado agora (nesta thread) depende deste resultado
+            if computing:
+                self._dependents.setdefault(name, set()).add(computing[-1])
+
+            if name in self._values:
+                return self._values[name]
+            if name not in self._producers:
+                raise KeyError(f"Resultado não registrado: {name}")
+            if name in computing:
+                raise RuntimeError(f"Dependência circular ao calcular: {name}")
+            compute_lock = self._compute_locks.setdefault(name, threading.Lock())
+
+        with compute_lock:
+            with self._lock:
+                # Outra thread pode ter calculado enquanto esta esperava
+                self._sync_version()
+                if name in self._values:
+                    return self._values[name]
+                producer = self._producers[name]
+                generation = self._generation
+
+            computing.append(name)
+            try:
+                with span(f'resultado.{name}'):
+                    value = producer()
+            finally:
+                computing.pop()
+
+            with self._lock:
+                self._sync_version()
+                if self._generation == generation:
+                    self._values[name] = value
+                self.compute_counts[name] = self.compute_counts.get(name, 0) + 1
+            return value
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __contains__(self, name):
+        return name in self._producers
+
+    def invalidate(self, name=None):
+        """
+        Descarta um resultado e tudo que depende dele
+
+        Args:
+            name (str, optional): Resultado a invalidar. Se omitido, limpa tudo.
+        """
+        with self._lock:
+            self._generation += 1
+            if name is None:
+                self._values.clear()
+                self._dependents.clear()
+                return
+
+            pending = [name]
+            while pending:
+                current = pending.pop()
+                self._values.pop(current, None)
+                pending.extend(self._dependents.pop(current, ()))
+
+    def is_cached(self, name):
+        """Indica se o resultado já está calculado para a versão atual dos dados"""
+        with self._lock:
+            self._sync_version()
+            return name in self._values
+
+    def _sync_version(self):
+        """Limpa o cache se os dados do analisador mudaram desde o último cálculo"""
+        if self._version != self._analyzer.data_version:
+            self.invalidate()
+            self._version = self._analyzer.data_version
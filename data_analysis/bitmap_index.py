@@ -0,0 +1,161 @@
+"""
+Índice bitmap por valor de resposta: filtros resolvidos com AND/OR bit a bit
+"""
+
+import hashlib
+
+import numpy as np
+
+from utils.profiling import profiled
+
+
+# Número de bits 1 de cada byte (contagem de linhas sem desempacotar o bitmap)
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+# Combinação entre perguntas: todas as condições (E) ou qualquer uma (OU)
+COMBINE_ALL = 'e'
+COMBINE_ANY = 'ou'
+
+
+class BitmapIndex:
+    """
+    Um bitmap empacotado (`np.packbits`, 1 bit por resposta) para cada valor
+    de cada pergunta categórica/Likert
+    
+    Montado uma única vez a partir dos códigos inteiros do analisador. Um
+    filtro é resolvido só com operações bit a bit sobre esses bitmaps: OU
+    entre os valores escolhidos de uma pergunta e E (ou OU) entre as
+    perguntas. Com 1M de respostas cada bitmap ocupa 125 KB, então combinar
+    dezenas deles custa poucos milissegundos.
+    """
+    
+    def __init__(self, bitmaps, n_rows):
+        """
+        Args:
+            bitmaps (dict): Chave canônica -> {valor: bitmap empacotado (uint8)}
+            n_rows (int): Número de respostas indexadas
+        """
+        self.bitmaps = bitmaps
+        self.n_rows = n_rows
+    
+    @classmethod
+    @profiled('filtros.indice_bitmap')
+    def from_codes(cls, codes, categories):
+        """
+        Monta o índice a partir dos códigos inteiros por pergunta
+        
+        Args:
+            codes (DataFrame): Códigos por chave canônica (-1 para ausentes)
+            categories (dict): Chave -> lista de categorias (na ordem dos códigos)
+        
+        Returns:
+            BitmapIndex: Índice com um bitmap por categoria (ausentes ficam de fora)
+        """
+        bitmaps = {}
+        for key in codes.columns:
+            values = codes[key].to_numpy()
+            bitmaps[key] = {
+                category: np.packbits(values == code)
+                for code, category in enumerate(categories[key])
+            }
+        return cls(bitmaps, len(codes))
+    
+    @property
+    def columns(self):
+        """Perguntas indexadas"""
+        return list(self.bitmaps)
+    
+    def values(self, key):
+        """Valores (categorias) indexados de uma pergunta"""
+        return list(self.bitmaps[key])
+    
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos bitmaps"""
+        return sum(bitmap.nbytes for column in self.bitmaps.values() for bitmap in column.values())
+    
+    def select(self, selections, combine=COMBINE_ALL):
+        """
+        Bitmap empacotado das respostas que atendem ao filtro
+        
+        Args:
+            selections (dict): Chave -> valores aceitos (perguntas sem valores são ignoradas)
+            combine (str): COMBINE_ALL (E entre perguntas) ou COMBINE_ANY (OU)
+        
+        Returns:
+            ndarray: Bitmap empacotado, ou None se o filtro estiver vazio (todas as respostas)
+        """
+        result = None
+        for key, values in selections.items():
+            if not values:
+                continue
+            column = self.bitmaps[key]
+            selected = np.zeros_like(next(iter(column.values())))
+            for value in values:
+                np.bitwise_or(selected, column[value], out=selected)
+            
+            if result is None:
+                result = selected
+            elif combine == COMBINE_ANY:
+                np.bitwise_or(result, selected, out=result)
+            else:
+                np.bitwise_and(result, selected, out=result)
+        return result
+    
+    def mask(self, selections, combine=COMBINE_ALL):
+        """Máscara booleana por resposta (tudo True se o filtro estiver vazio)"""
+        selected = self.select(selections, combine)
+        if selected is None:
+            return np.ones(self.n_rows, dtype=bool)
+        return np.unpackbits(selected, count=self.n_rows).view(bool)
+    
+    def count(self, selections, combine=COMBINE_ALL):
+        """Número de respostas que atendem ao filtro, sem desempacotar o bitmap"""
+        selected = self.select(selections, combine)
+        if selected is None:
+            return self.n_rows
+        return int(_POPCOUNT[selected].sum(dtype=np.int64))
+    
+    def value_counts(self, key, selected=None):
+        """
+        Contagem de cada valor de uma pergunta dentro de um bitmap de respostas
+        
+        Args:
+            key (str): Chave canônica da pergunta
+            selected (ndarray, optional): Bitmap empacotado de `select` (None = todas)
+        
+        Returns:
+            tuple: (lista de valores, ndarray de contagens)
+        """
+        column = self.bitmaps[key]
+        counts = np.empty(len(column), dtype=np.int64)
+        for position, bitmap in enumerate(column.values()):
+            if selected is not None:
+                bitmap = bitmap & selected
+            counts[position] = _POPCOUNT[bitmap].sum(dtype=np.int64)
+        return list(column), counts
+
+
+def active_selections(selections):
+    """Somente as perguntas com algum valor escolhido"""
+    return {key: list(values) for key, values in selections.items() if values}
+
+
+def filter_signature(selections, combine=COMBINE_ALL):
+    """
+    Identificador estável de um filtro, usado nas chaves de cache
+    
+    Args:
+        selections (dict): Chave -> valores aceitos
+        combine (str): Combinação entre perguntas
+    
+    Returns:
+        str: Hash hexadecimal (vazio se o filtro não selecionar nada)
+    """
+    selections = active_selections(selections)
+    if not selections:
+        return ''
+    parts = [combine] + [
+        f"{key}={'|'.join(sorted(map(str, values)))}" for key, values in sorted(selections.items())
+    ]
+    return hashlib.blake2b('\x1f'.join(parts).encode(), digest_size=8).hexdigest()
@@ -0,0 +1,285 @@
+"""
+Tabelas de contingência por códigos inteiros (bincount) e associação qui-quadrado / V de Cramér
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .correlation_engine import DEFAULT_ALPHA, fdr_bh
+from utils.profiling import profiled
+
+
+# Perguntas com mais categorias que isto (ex: texto livre) ficam fora da matriz de associação
+MAX_CATEGORIES = 30
+
+# Mínimo de respostas completas de um par para calcular a associação
+MIN_PAIR_OBSERVATIONS = 5
+
+
+def category_codes(series):
+    """
+    Códigos inteiros de uma coluna (-1 para ausentes) e as categorias correspondentes
+    
+    Colunas categóricas reaproveitam os próprios códigos (inclusive categorias
+    sem respostas); as demais são fatoradas em ordem crescente dos valores.
+    
+    Args:
+        series (Series): Coluna de df_processed
+    
+    Returns:
+        tuple: (ndarray de int64, Index das categorias)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.int64), series.cat.categories
+    codes, categories = pd.factorize(series, sort=True)
+    return codes.astype(np.int64), categories
+
+
+def contingency_table(codes, sizes):
+    """
+    Tabela de contingência de N vias com um único `np.bincount`
+    
+    Os códigos de cada linha são combinados em um índice plano da tabela
+    (como `np.ravel_multi_index`); linhas com algum ausente (-1) ficam de fora.
+    
+    Args:
+        codes (list): Um array de códigos por variável, todos do mesmo tamanho
+        sizes (list): Número de categorias de cada variável
+    
+    Returns:
+        ndarray: Contagens com formato `sizes` (2 vias: linhas x colunas)
+    """
+    sizes = tuple(int(size) for size in sizes)
+    valid = np.ones(len(codes[0]), dtype=bool)
+    for variable_codes in codes:
+        valid &= variable_codes >= 0
+    
+    flat = np.zeros(int(valid.sum()), dtype=np.int64)
+    for variable_codes, size in zip(codes, sizes):
+        flat = flat * size + variable_codes[valid]
+    return np.bincount(flat, minlength=int(np.prod(sizes))).reshape(sizes)
+
+
+def chi_square_test(table):
+    """
+    Teste qui-quadrado de independência de uma tabela de 2 vias
+    
+    Linhas e colunas sem nenhuma resposta não contam nos graus de liberdade.
+    
+    Args:
+        table (ndarray): Contagens (linhas x colunas)
+    
+    Returns:
+        dict: 'qui2', 'gl', 'p_valor', 'v_cramer', 'n' e a matriz 'residuos'
+            (resíduos padronizados ajustados, NaN nas linhas/colunas vazias)
+    """
+    table = np.asarray(table, dtype=float)
+    n = table.sum()
+    rows = table.sum(axis=1)
+    cols = table.sum(axis=0)
+    n_rows = int((rows > 0).sum())
+    n_cols = int((cols > 0).sum())
+    dof = (n_rows - 1) * (n_cols - 1)
+    
+    residuals = np.full(table.shape, np.nan)
+    if n < MIN_PAIR_OBSERVATIONS or dof == 0:
+        return {'qui2': np.nan, 'gl': dof, 'p_valor': np.nan, 'v_cramer': np.nan, 'n': int(n), 'residuos': residuals}
+    
+    expected = np.outer(rows, cols) / n
+    observed = expected > 0
+    chi2 = float((((table - expected) ** 2)[observed] / expected[observed]).sum())
+    
+    # Resíduo ajustado: ~N(0, 1) sob independência (|r| > 2 indica célula que se destaca)
+    variance = expected * np.outer(1 - rows / n, 1 - cols / n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residuals = np.where(variance > 0, (table - expected) / np.sqrt(variance), np.nan)
+    
+    return {
+        'qui2': chi2,
+        'gl': dof,
+        'p_valor': float(stats.chi2.sf(chi2, dof)),
+        'v_cramer': float(np.sqrt(chi2 / (n * (min(n_rows, n_cols) - 1)))),
+        'n': int(n),
+        'residuos': residuals
+    }
+
+
+def crosstab_frame(first, second):
+    """
+    Equivalente a `pd.crosstab(first, second)` calculado por códigos inteiros
+    
+    Categorias sem nenhuma resposta no par não aparecem, como no `pd.crosstab`.
+    
+    Args:
+        first (Series): Variável das linhas
+        second (Series): Variável das colunas
+    
+    Returns:
+        DataFrame: Contagens com as categorias de cada variável nos eixos
+    """
+    first_codes, first_categories = category_codes(first)
+    second_codes, second_categories = category_codes(second)
+    table = contingency_table([first_codes, second_codes], [len(first_categories), len(second_categories)])
+    
+    rows = table.sum(axis=1) > 0
+    cols = table.sum(axis=0) > 0
+    return pd.DataFrame(
+        table[np.ix_(rows, cols)],
+        index=pd.Index(first_categories[rows], dtype=first.dtype, name=first.name),
+        columns=pd.Index(second_categories[cols], dtype=second.dtype, name=second.name)
+    )
+
+
+@profiled('associacoes.matriz')
+def association_matrix(codes, categories, alpha=DEFAULT_ALPHA):
+    """
+    Qui-quadrado e V de Cramér de todos os pares de variáveis categóricas
+    
+    Cada par é uma tabela de 2 vias montada com um `bincount` sobre os
+    códigos já calculados (exclusão por pares). A correção de
+    Benjamini-Hochberg é aplicada sobre os pares distintos.
+    
+    Args:
+        codes (DataFrame): Códigos inteiros por variável (-1 para ausentes)
+        categories (dict): Variável -> lista de categorias (na ordem dos códigos)
+        alpha (float): Nível de significância após a correção
+    
+    Returns:
+        dict: 'colunas', matrizes 'v_cramer', 'qui2', 'gl', 'p_valor',
+            'p_ajustado', 'significativo' e 'n', e por par (variavel_1, variavel_2)
+            as 'tabelas' de contagens e os 'residuos' padronizados ajustados
+    """
+    columns = list(codes.columns)
+    values = {column: codes[column].to_numpy() for column in columns}
+    size = len(columns)
+    
+    matrices = {name: np.full((size, size), np.nan) for name in ('v_cramer', 'qui2', 'gl', 'p_valor')}
+    n = np.zeros((size, size), dtype=int)
+    tables = {}
+    residuals = {}
+    
+    first, second = np.triu_indices(size, k=1)
+    for i, j in zip(first, second):
+        a, b = columns[i], columns[j]
+        table = contingency_table([values[a], values[b]], [len(categories[a]), len(categories[b])])
+        test = chi_square_test(table)
+        for name in matrices:
+            matrices[name][i, j] = matrices[name][j, i] = test[name]
+        n[i, j] = n[j, i] = test['n']
+        tables[(a, b)] = table
+        residuals[(a, b)] = test['residuos']
+    
+    for i, column in enumerate(columns):
+        n[i, i] = int((values[column] >= 0).sum())
+    np.fill_diagonal(matrices['v_cramer'], np.where(np.diag(n) > 0, 1.0, np.nan))
+    
+    adjusted = np.full((size, size), np.nan)
+    adjusted[first, second] = fdr_bh(matrices['p_valor'][first, second])
+    adjusted[second, first] = adjusted[first, second]
+    
+    def _as_frame(matrix):
+        return pd.DataFrame(matrix, index=columns, columns=columns)
+    
+    result = {'colunas': columns}
+    result.update({name: _as_frame(matrix) for name, matrix in matrices.items()})
+    result.update({
+        'p_ajustado': _as_frame(adjusted),
+        'significativo': _as_frame(adjusted < alpha),
+        'n': _as_frame(n),
+        'categorias': categories,
+        'tabelas': tables,
+        'residuos': residuals
+    })
+    return result
+
+
+def association_pairs(result):
+    """
+    Tabela longa com um par por linha, ordenada pelo V de Cramér
+    
+    Args:
+        result (dict): Saída de `association_matrix`
+    
+    Returns:
+        DataFrame: variavel_1, variavel_2, v_cramer, qui2, gl, p_valor,
+            p_ajustado, significativo e n_amostras
+    """
+    columns = result['colunas']
+    first, second = np.triu_indices(len(columns), k=1)
+    
+    pairs = pd.DataFrame({
+        'variavel_1': [columns[i] for i in first],
+        'variavel_2': [columns[j] for j in second],
+        **{
+            name: result[name].to_numpy()[first, second]
+            for name in ('v_cramer', 'qui2', 'gl', 'p_valor', 'p_ajustado', 'significativo')
+        },
+        'n_amostras': result['n'].to_numpy()[first, second]
+    })
+    pairs = pairs.dropna(subset=['v_cramer'])
+    return pairs.sort_values('v_cramer', ascending=False, ignore_index=True)
+
+
+def pair_table(result, first, second):
+    """
+    Contagens e resíduos de um par, com as categorias nos eixos
+    
+    Args:
+        result (dict): Saída de `association_matrix`
+        first (str): Variável das linhas
+        second (str): Variável das colunas
+    
+    Returns:
+        tuple: (contagens, resíduos) como DataFrames, sem categorias vazias
+    """
+    if (first, second) in result['tabelas']:
+        table, residuals = result['tabelas'][(first, second)], result['residuos'][(first, second)]
+    else:
+        table, residuals = result['tabelas'][(second, first)].T, result['residuos'][(second, first)].T
+    
+    rows = table.sum(axis=1) > 0
+    cols = table.sum(axis=0) > 0
+    index = pd.Index(np.asarray(result['categorias'][first], dtype=object)[rows], name=first)
+    columns = pd.Index(np.asarray(result['categorias'][second], dtype=object)[cols], name=second)
+    return (
+        pd.DataFrame(table[np.ix_(rows, cols)], index=index, columns=columns),
+        pd.DataFrame(residuals[np.ix_(rows, cols)], index=index, columns=columns)
+    )
+
+
+def stratified_association(codes, categories, first, second, strata):
+    """
+    Associação de um par dentro de cada categoria de uma terceira variável
+    
+    A tabela de 3 vias (estrato x linhas x colunas) sai de um único
+    `bincount`; cada fatia é testada separadamente.
+    
+    Args:
+        codes (DataFrame): Códigos inteiros por variável
+        categories (dict): Variável -> lista de categorias
+        first (str): Primeira variável do par
+        second (str): Segunda variável do par
+        strata (str): Variável de estratificação
+    
+    Returns:
+        DataFrame: Uma linha por estrato com v_cramer, qui2, gl, p_valor e n_amostras
+    """
+    variables = [strata, first, second]
+    table = contingency_table(
+        [codes[variable].to_numpy() for variable in variables],
+        [len(categories[variable]) for variable in variables]
+    )
+    
+    rows = []
+    for stratum, stratum_table in zip(categories[strata], table):
+        test = chi_square_test(stratum_table)
+        rows.append({
+            strata: stratum,
+            'v_cramer': test['v_cramer'],
+            'qui2': test['qui2'],
+            'gl': test['gl'],
+            'p_valor': test['p_valor'],
+            'n_amostras': test['n']
+        })
+    return pd.DataFrame(rows)
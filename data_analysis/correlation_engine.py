@@ -0,0 +1,293 @@
+"""
+Correlações de todos os pares de colunas (Pearson e Spearman) por operações matriciais
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from utils.profiling import profiled
+
+
+# Mínimo de respostas completas de um par para calcular a correlação
+MIN_PAIR_OBSERVATIONS = 3
+
+# Nível de significância usado na correção de múltiplas comparações
+DEFAULT_ALPHA = 0.05
+
+
+def pairwise_pearson(values):
+    """
+    Matriz de Pearson com exclusão por pares (pairwise-complete)
+    
+    Todas as somas por par são obtidas com produtos de matrizes entre os
+    valores (com ausentes zerados) e a máscara de presença, sem montar um
+    subconjunto por par.
+    
+    Args:
+        values (ndarray): Matriz n x p de floats, com NaN para ausentes
+    
+    Returns:
+        tuple: (r, n) — matrizes p x p de correlações e de respostas completas por par
+    """
+    present = ~np.isnan(values)
+    mask = present.astype(float)
+    
+    # Centraliza cada coluna pela própria média: não altera r e evita
+    # cancelamento numérico nas somas de quadrados
+    centered = np.where(present, values - np.nanmean(values, axis=0), 0.0)
+    
+    n = mask.T @ mask
+    sum_x = centered.T @ mask           # [i, j]: soma de x_i onde x_j também existe
+    sum_xx = (centered ** 2).T @ mask
+    sum_xy = centered.T @ centered
+    return pearson_from_sums(n, sum_x, sum_xx, sum_xy)
+
+
+def pearson_from_sums(n, sum_x, sum_xx, sum_xy):
+    """
+    Matriz de Pearson a partir das somas por par (ver `pairwise_pearson`)
+    
+    As somas são aditivas entre blocos de linhas, então também podem vir de
+    acumuladores atualizados incrementalmente (ver `streaming.PairwiseComoments`).
+    
+    Args:
+        n (ndarray): Respostas completas de cada par
+        sum_x (ndarray): [i, j] soma de x_i nas linhas onde x_j também existe
+        sum_xx (ndarray): [i, j] soma de x_i² nas mesmas linhas
+        sum_xy (ndarray): [i, j] soma de x_i * x_j
+    
+    Returns:
+        tuple: (r, n) — matrizes p x p de correlações e de respostas completas por par
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x * sum_x.T / n
+        var_i = sum_xx - sum_x ** 2 / n
+        var_j = var_i.T
+        r = cov / np.sqrt(var_i * var_j)
+    
+    r[n < MIN_PAIR_OBSERVATIONS] = np.nan
+    return np.clip(r, -1.0, 1.0), n.astype(int)
+
+
+def pairwise_spearman(values):
+    """
+    Matriz de Spearman com exclusão por pares
+    
+    Os postos de cada coluna são recalculados dentro do subconjunto completo
+    de cada par (postos médios nos empates), como no `DataFrame.corr`. Cada
+    coluna é codificada uma única vez pelos seus valores distintos; para
+    cada par, um `bincount` sobre os códigos combinados dá a tabela conjunta
+    de contagens, da qual saem os postos dos dois lados e a correlação,
+    sem matrizes intermediárias do tamanho dos dados. Quando a tabela teria
+    mais células que respostas (colunas com muitos valores distintos), o
+    par é calculado diretamente sobre as linhas completas.
+    
+    Args:
+        values (ndarray): Matriz n x p de floats, com NaN para ausentes
+    
+    Returns:
+        tuple: (r, n) — matrizes p x p de correlações e de respostas completas por par
+    """
+    n_rows, n_cols = values.shape
+    present = ~np.isnan(values)
+    mask = present.astype(float)
+    n = (mask.T @ mask).astype(int)
+    
+    # codes[i]: índice do valor distinto de cada resposta (ausentes recebem o código levels[i])
+    codes = []
+    levels = []
+    for i in range(n_cols):
+        valid = present[:, i]
+        uniques, inverse = np.unique(values[valid, i], return_inverse=True)
+        column_codes = np.full(n_rows, len(uniques), dtype=np.int64)
+        column_codes[valid] = inverse
+        codes.append(column_codes)
+        levels.append(len(uniques))
+    
+    r = np.full((n_cols, n_cols), np.nan)
+    np.fill_diagonal(r, 1.0)
+    for i in range(n_cols):
+        for j in range(i + 1, n_cols):
+            if (levels[i] + 1) * (levels[j] + 1) <= n_rows:
+                # Tabela conjunta; a última linha/coluna (ausentes) fica de fora
+                joint = np.bincount(
+                    codes[i] * (levels[j] + 1) + codes[j],
+                    minlength=(levels[i] + 1) * (levels[j] + 1)
+                ).reshape(levels[i] + 1, levels[j] + 1)[:-1, :-1]
+                r[i, j] = _rank_correlation(joint)
+            else:
+                both = present[:, i] & present[:, j]
+                r[i, j] = _rank_correlation_rows(codes[i][both], codes[j][both], levels[i], levels[j])
+            r[j, i] = r[i, j]
+    
+    r[n < MIN_PAIR_OBSERVATIONS] = np.nan
+    return np.clip(r, -1.0, 1.0), n
+
+
+def _average_ranks(counts):
+    """Posto médio de cada valor distinto, dadas as contagens por valor (em ordem crescente)"""
+    return np.cumsum(counts) - counts + (counts + 1) / 2
+
+
+def _rank_correlation(joint):
+    """Pearson dos postos a partir da tabela de contagens conjunta dos códigos de um par"""
+    counts_x = joint.sum(axis=1)
+    counts_y = joint.sum(axis=0)
+    total = counts_x.sum()
+    if total == 0:
+        return np.nan
+    dev_x = _average_ranks(counts_x) - (total + 1) / 2
+    dev_y = _average_ranks(counts_y) - (total + 1) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (dev_x @ joint @ dev_y) / np.sqrt((counts_x @ dev_x ** 2) * (counts_y @ dev_y ** 2))
+
+
+def _rank_correlation_rows(codes_x, codes_y, levels_x, levels_y):
+    """Pearson dos postos linha a linha (pares com muitos valores distintos)"""
+    if len(codes_x) == 0:
+        return np.nan
+    mean = (len(codes_x) + 1) / 2
+    dev_x = _average_ranks(np.bincount(codes_x, minlength=levels_x))[codes_x] - mean
+    dev_y = _average_ranks(np.bincount(codes_y, minlength=levels_y))[codes_y] - mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (dev_x @ dev_y) / np.sqrt((dev_x @ dev_x) * (dev_y @ dev_y))
+
+
+def correlation_pvalues(r, n):
+    """
+    P-valores bilaterais (teste t com n - 2 graus de liberdade) de uma matriz de correlações
+    
+    Args:
+        r (ndarray): Correlações
+        n (ndarray): Respostas completas de cada par
+    
+    Returns:
+        ndarray: P-valores (NaN onde r é NaN)
+    """
+    dof = n - 2.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = r * np.sqrt(dof / (1.0 - r ** 2))
+        pvalues = 2 * stats.t.sf(np.abs(t), dof)
+    pvalues[np.isnan(r)] = np.nan
+    return pvalues
+
+
+def fdr_bh(pvalues):
+    """
+    Correção de Benjamini-Hochberg (taxa de falsas descobertas)
+    
+    Args:
+        pvalues (ndarray): P-valores (NaN são ignorados)
+    
+    Returns:
+        ndarray: P-valores ajustados, no mesmo formato
+    """
+    pvalues = np.asarray(pvalues, dtype=float)
+    adjusted = np.full(pvalues.shape, np.nan)
+    valid = ~np.isnan(pvalues)
+    m = int(valid.sum())
+    if m == 0:
+        return adjusted
+    
+    order = np.argsort(pvalues[valid])
+    ranked = pvalues[valid][order] * m / np.arange(1, m + 1)
+    # Garante monotonicidade, do maior posto para o menor
+    ranked = np.minimum.accumulate(ranked[::-1])[::-1]
+    
+    values = np.empty(m)
+    values[order] = np.minimum(ranked, 1.0)
+    adjusted[valid] = values
+    return adjusted
+
+
+def correlation_tests(r, n, columns, alpha=DEFAULT_ALPHA):
+    """
+    P-valores, correção de Benjamini-Hochberg e significância de uma matriz de correlações
+    
+    A correção é aplicada sobre os pares distintos (triângulo superior).
+    
+    Args:
+        r (ndarray): Correlações (a diagonal é preenchida aqui)
+        n (ndarray): Respostas completas de cada par
+        columns (list): Nomes das colunas
+        alpha (float): Nível de significância após a correção
+    
+    Returns:
+        dict: Matrizes 'r', 'p_valor', 'p_ajustado' e 'significativo' (DataFrames)
+    """
+    def _as_frame(matrix):
+        return pd.DataFrame(matrix, index=columns, columns=columns)
+    
+    upper = np.triu_indices(len(columns), k=1)
+    np.fill_diagonal(r, np.where(np.diag(n) >= MIN_PAIR_OBSERVATIONS, 1.0, np.nan))
+    pvalues = correlation_pvalues(r, n)
+    np.fill_diagonal(pvalues, np.nan)
+    
+    adjusted = np.full(r.shape, np.nan)
+    adjusted[upper] = fdr_bh(pvalues[upper])
+    adjusted.T[upper] = adjusted[upper]
+    
+    return {
+        'r': _as_frame(r),
+        'p_valor': _as_frame(pvalues),
+        'p_ajustado': _as_frame(adjusted),
+        'significativo': _as_frame(adjusted < alpha)
+    }
+
+
+@profiled('correlacoes.matriz')
+def correlation_matrix(frame, alpha=DEFAULT_ALPHA):
+    """
+    Calcula Pearson e Spearman de todos os pares de colunas de um DataFrame numérico
+    
+    A correção de Benjamini-Hochberg é aplicada sobre os pares distintos
+    (triângulo superior) de cada método.
+    
+    Args:
+        frame (DataFrame): Colunas numéricas (ou ordinais já codificadas)
+        alpha (float): Nível de significância após a correção
+    
+    Returns:
+        dict: 'colunas', 'n' (respostas completas por par) e, para 'pearson' e
+            'spearman', as matrizes 'r', 'p_valor', 'p_ajustado' e 'significativo'
+    """
+    columns = list(frame.columns)
+    values = frame.to_numpy(dtype=float, na_value=np.nan)
+    result = {'colunas': columns}
+    
+    for method, compute in (('pearson', pairwise_pearson), ('spearman', pairwise_spearman)):
+        r, n = compute(values)
+        result['n'] = pd.DataFrame(n, index=columns, columns=columns)
+        result[method] = correlation_tests(r, n, columns, alpha)
+    
+    return result
+
+
+def correlation_pairs(result, method='pearson'):
+    """
+    Tabela longa com um par por linha, ordenada pela força da correlação
+    
+    Args:
+        result (dict): Saída de `correlation_matrix`
+        method (str): 'pearson' ou 'spearman'
+    
+    Returns:
+        DataFrame: variavel_1, variavel_2, correlacao, p_valor, p_ajustado,
+            significativo e n_amostras
+    """
+    columns = result['colunas']
+    first, second = np.triu_indices(len(columns), k=1)
+    matrices = result[method]
+    
+    pairs = pd.DataFrame({
+        'variavel_1': [columns[i] for i in first],
+        'variavel_2': [columns[j] for j in second],
+        'correlacao': matrices['r'].to_numpy()[first, second],
+        'p_valor': matrices['p_valor'].to_numpy()[first, second],
+        'p_ajustado': matrices['p_ajustado'].to_numpy()[first, second],
+        'significativo': matrices['significativo'].to_numpy()[first, second],
+        'n_amostras': result['n'].to_numpy()[first, second]
+    })
+    pairs = pairs.dropna(subset=['correlacao'])
+    return pairs.reindex(pairs['correlacao'].abs().sort_values(ascending=False).index).reset_index(drop=True)
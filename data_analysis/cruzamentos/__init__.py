@@ -2,4 +2,18 @@
 Módulo de cruzamentos de dados
 """
 
-__all__ = []
+from .registry import CROSSINGS, create_crossing_charts, register_crossing, run_crossings
+from .satisfacao_vs_carga import analyze_satisfaction_vs_workload, create_satisfaction_workload_charts
+from .matriz_correlacao import create_correlation_matrix_charts
+from .associacao_categorica import create_association_charts
+
+__all__ = [
+    'CROSSINGS',
+    'create_crossing_charts',
+    'register_crossing',
+    'run_crossings',
+    'analyze_satisfaction_vs_workload',
+    'create_satisfaction_workload_charts',
+    'create_correlation_matrix_charts',
+    'create_association_charts'
+]
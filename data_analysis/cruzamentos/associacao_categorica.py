@@ -0,0 +1,116 @@
+"""
+Cruzamento geral: associação (qui-quadrado / V de Cramér) entre todas as perguntas categóricas
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from ..contingency import association_pairs, pair_table, stratified_association
+from .registry import register_crossing
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
+
+
+def _label(column):
+    return column.replace('_', ' ').title()
+
+
+@profiled('graficos.associacao_categorica')
+def create_association_charts(analyzer):
+    """Cria o mapa de calor do V de Cramér e o detalhamento de um par escolhido"""
+    
+    st.subheader("🔗 Associação entre Perguntas Categóricas")
+    
+    # Calculada uma única vez por versão dos dados, a partir dos códigos inteiros
+    result = analyzer.analyze_associations()
+    columns = result['colunas']
+    
+    if len(columns) < 2:
+        st.warning("São necessárias ao menos duas perguntas categóricas para a matriz de associação.")
+        return
+    
+    labels = [_label(column) for column in columns]
+    def _build():
+        fig = px.imshow(
+            result['v_cramer'].to_numpy(),
+            x=labels,
+            y=labels,
+            zmin=0,
+            zmax=1,
+            color_continuous_scale='Purples',
+            text_auto='.2f',
+            title="V de Cramér (qui-quadrado, exclusão por pares)"
+        )
+        fig.update_layout(height=max(450, 35 * len(columns)))
+        return fig
+    fig = cached_figure(analyzer, 'associacao_heatmap', _build)
+    st.plotly_chart(fig, width="stretch")
+    
+    # Detalhamento de um par
+    col1, col2 = st.columns(2)
+    with col1:
+        first = st.selectbox("Linhas:", columns, format_func=_label, key='associacao_linhas')
+    with col2:
+        second = st.selectbox(
+            "Colunas:", columns,
+            index=1 if columns[0] == first else 0,
+            format_func=_label, key='associacao_colunas'
+        )
+    
+    if first != second:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("V de Cramér", f"{result['v_cramer'].loc[first, second]:.3f}")
+        with col2:
+            st.metric("Qui-quadrado", f"{result['qui2'].loc[first, second]:.1f}")
+        with col3:
+            st.metric("P-valor ajustado (FDR)", f"{result['p_ajustado'].loc[first, second]:.3g}")
+        with col4:
+            st.metric("N° Amostras", int(result['n'].loc[first, second]))
+        
+        counts, residuals = pair_table(result, first, second)
+        def _build():
+            fig = px.imshow(
+                residuals.to_numpy(),
+                x=[str(value) for value in residuals.columns],
+                y=[str(value) for value in residuals.index],
+                zmin=-4,
+                zmax=4,
+                color_continuous_scale='RdBu_r',
+                text_auto='.1f',
+                labels={'x': _label(second), 'y': _label(first), 'color': 'Resíduo'},
+                title="Resíduos padronizados ajustados (|r| > 2: célula acima/abaixo do esperado)"
+            )
+            return fig
+        fig = cached_figure(analyzer, 'associacao_residuos', _build, first=first, second=second)
+        st.plotly_chart(fig, width="stretch")
+        
+        with st.expander("📋 Tabela de contingência"):
+            st.dataframe(counts, width="stretch")
+        
+        # Mesmo par dentro de cada categoria de uma terceira pergunta (tabela de 3 vias)
+        others = [column for column in columns if column not in (first, second)]
+        strata = st.selectbox(
+            "Estratificar por:", [None] + others,
+            format_func=lambda c: '—' if c is None else _label(c), key='associacao_estrato'
+        )
+        if strata is not None:
+            coded = analyzer.categorical_codes()
+            st.dataframe(
+                stratified_association(coded['codigos'], coded['categorias'], first, second, strata),
+                width="stretch"
+            )
+    
+    # Pares significativos após a correção de múltiplas comparações
+    pairs = association_pairs(result)
+    significant = pairs[pairs['significativo']]
+    with st.expander(f"📋 Pares associados após correção FDR ({len(significant)} de {len(pairs)})"):
+        st.dataframe(significant, width="stretch")
+
+
+def _compute_associations(analyzer, dados):
+    """Associações a partir dos códigos inteiros memoizados no analisador"""
+    return analyzer.analyze_associations()
+
+
+register_crossing('associacao_categorica', compute=_compute_associations, charts=create_association_charts)
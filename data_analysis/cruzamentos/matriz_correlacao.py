@@ -0,0 +1,82 @@
+"""
+Cruzamento geral: matriz de correlação entre todas as perguntas numéricas/ordinais
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from ..correlation_engine import correlation_pairs
+from .registry import register_crossing
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
+
+
+@profiled('graficos.matriz_correlacao')
+def create_correlation_matrix_charts(analyzer):
+    """Cria o mapa de calor das correlações e o detalhamento de um par escolhido"""
+    
+    st.subheader("🧮 Matriz de Correlação")
+    
+    # Calculada uma única vez por versão dos dados; trocar método ou par não recalcula
+    result = analyzer.analyze_correlations()
+    columns = result['colunas']
+    
+    if len(columns) < 2:
+        st.warning("São necessárias ao menos duas perguntas numéricas para a matriz de correlação.")
+        return
+    
+    method = st.radio("Método:", ['pearson', 'spearman'], format_func=str.title, horizontal=True)
+    matrices = result[method]
+    
+    labels = [column.replace('_', ' ').title() for column in columns]
+    def _build():
+        fig = px.imshow(
+            matrices['r'].to_numpy(),
+            x=labels,
+            y=labels,
+            zmin=-1,
+            zmax=1,
+            color_continuous_scale='RdBu',
+            text_auto='.2f',
+            title=f"Correlação de {method.title()} (exclusão por pares)"
+        )
+        fig.update_layout(height=max(450, 35 * len(columns)))
+        return fig
+    fig = cached_figure(analyzer, 'correlacao_heatmap', _build, method=method)
+    st.plotly_chart(fig, width="stretch")
+    
+    # Detalhamento de um par
+    col1, col2 = st.columns(2)
+    with col1:
+        first = st.selectbox("Variável 1:", columns, format_func=lambda c: c.replace('_', ' ').title())
+    with col2:
+        second = st.selectbox(
+            "Variável 2:", columns,
+            index=1 if columns[0] == first else 0,
+            format_func=lambda c: c.replace('_', ' ').title()
+        )
+    
+    if first != second:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Correlação", f"{matrices['r'].loc[first, second]:.3f}")
+        with col2:
+            st.metric("P-valor", f"{matrices['p_valor'].loc[first, second]:.3g}")
+        with col3:
+            st.metric("P-valor ajustado (FDR)", f"{matrices['p_ajustado'].loc[first, second]:.3g}")
+        with col4:
+            st.metric("N° Amostras", int(result['n'].loc[first, second]))
+    
+    # Pares significativos após a correção de múltiplas comparações
+    pairs = correlation_pairs(result, method)
+    significant = pairs[pairs['significativo']]
+    with st.expander(f"📋 Pares significativos após correção FDR ({len(significant)} de {len(pairs)})"):
+        st.dataframe(significant, width="stretch")
+
+
+def _compute_correlations(analyzer, dados):
+    """Matriz memoizada no analisador; pelo registro ela é calculada no pool, junto com os demais cruzamentos"""
+    return analyzer.analyze_correlations()
+
+
+register_crossing('matriz_correlacao', compute=_compute_correlations, charts=create_correlation_matrix_charts)
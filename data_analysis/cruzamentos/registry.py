@@ -0,0 +1,150 @@
+"""
+Registro de cruzamentos: colunas declaradas, dados codificados compartilhados e execução em paralelo
+"""
+
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import streamlit as st
+
+from utils.profiling import span
+
+
+# Nome -> definição do cruzamento (na ordem de registro)
+#   colunas: chaves canônicas usadas (None = todas as perguntas codificadas)
+#   calcular: função(analyzer, dados) -> resultado (None se não houver dados suficientes)
+#   graficos: função(analyzer) que desenha o cruzamento na aba Cruzamentos
+CROSSINGS = {}
+
+# Nome do contêiner de resultados em analyzer.results
+CACHE_NAME = 'cruzamentos'
+
+# Threads usadas para calcular os cruzamentos pendentes (limitadas: há poucos
+# cruzamentos e cada um já usa rotinas vetorizadas do NumPy)
+MAX_CROSSING_WORKERS = 4
+DEFAULT_MAX_WORKERS = min(os.cpu_count() or 1, MAX_CROSSING_WORKERS)
+
+# Uma execução por vez para cada analisador: evita que duas sessões com a
+# mesma pesquisa calculem o mesmo cruzamento, sem bloquear outras pesquisas
+_run_locks = weakref.WeakKeyDictionary()
+_run_locks_guard = threading.Lock()
+
+
+def register_crossing(name, columns=None, compute=None, charts=None):
+    """
+    Registra (ou substitui) um cruzamento
+    
+    `compute` recebe o analisador e `dados`: as colunas declaradas do
+    DataFrame codificado compartilhado (`analyzer.encoded_numeric_frame()`,
+    chaves canônicas, faixas já convertidas nos pontos médios), só com as
+    respostas completas. Ela roda em uma thread do pool, então não deve usar
+    `st.*`. Cruzamentos que compartilham a mesma função de gráficos a têm
+    desenhada uma única vez.
+    
+    Args:
+        name (str): Nome do cruzamento (chave do resultado)
+        columns (list, optional): Chaves canônicas das perguntas usadas
+        compute (callable, optional): Função(analyzer, dados) que calcula o resultado
+        charts (callable, optional): Função(analyzer) que desenha os gráficos
+    """
+    CROSSINGS[name] = {
+        'colunas': tuple(columns) if columns is not None else None,
+        'calcular': compute,
+        'graficos': charts
+    }
+
+
+def _crossing_cache(analyzer):
+    """Contêiner dos resultados de uma versão dos dados"""
+    # Lê os dados codificados para herdar a dependência: quando eles são
+    # invalidados, os cruzamentos também são
+    analyzer.encoded_numeric_frame()
+    return {}
+
+
+def _run_lock(analyzer):
+    """Lock das execuções de um analisador (criado no primeiro uso)"""
+    with _run_locks_guard:
+        lock = _run_locks.get(analyzer)
+        if lock is None:
+            lock = _run_locks[analyzer] = threading.Lock()
+        return lock
+
+
+def _run_crossing(analyzer, encoded, name):
+    """Calcula um cruzamento a partir do DataFrame codificado"""
+    crossing = CROSSINGS[name]
+    columns = crossing['colunas']
+    if columns is None:
+        dados = encoded
+    else:
+        if any(analyzer.schema.column(key) is None for key in columns):
+            return None
+        # Perguntas sem codificação numérica viram colunas vazias (sem linhas completas)
+        dados = encoded.reindex(columns=list(columns)).dropna()
+    
+    with span(f'cruzamento.{name}', linhas=len(dados)):
+        return crossing['calcular'](analyzer, dados)
+
+
+def run_crossings(analyzer, names=None, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Resultados dos cruzamentos, calculando em paralelo os que ainda não estão em cache
+    
+    Os resultados ficam em `analyzer.results` e valem enquanto a versão dos
+    dados não mudar. O DataFrame codificado compartilhado é montado antes
+    do pool; cada cruzamento roda fora do lock geral dos resultados, então
+    cruzamentos que leem outros resultados (ex: correlações, associações)
+    só esperam uns pelos outros quando pedem o mesmo resultado.
+    
+    Args:
+        analyzer: Instância do INJuniorSurveyAnalyzer
+        names (list, optional): Cruzamentos desejados (padrão: todos os registrados)
+        max_workers (int): Número máximo de threads
+    
+    Returns:
+        dict: Nome -> resultado, apenas dos cruzamentos com dados suficientes
+    """
+    names = list(CROSSINGS) if names is None else list(names)
+    if CACHE_NAME not in analyzer.results:
+        analyzer.results.register(CACHE_NAME, partial(_crossing_cache, analyzer))
+    
+    with _run_lock(analyzer):
+        cache = analyzer.results.get(CACHE_NAME)
+        pending = [
+            name for name in names
+            if name not in cache and CROSSINGS[name]['calcular'] is not None
+        ]
+        
+        if pending:
+            # Intermediário compartilhado: codificado uma vez para todos os cruzamentos
+            encoded = analyzer.encoded_numeric_frame()
+            with span('cruzamentos.execucao', pendentes=len(pending)):
+                if len(pending) == 1 or max_workers <= 1:
+                    for name in pending:
+                        cache[name] = _run_crossing(analyzer, encoded, name)
+                else:
+                    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                        futures = {name: pool.submit(_run_crossing, analyzer, encoded, name) for name in pending}
+                    for name, future in futures.items():
+                        cache[name] = future.result()
+        
+        return {name: cache[name] for name in names if cache.get(name) is not None}
+
+
+def create_crossing_charts(analyzer):
+    """Calcula todos os cruzamentos registrados e desenha seus gráficos, na ordem de registro"""
+    run_crossings(analyzer)
+    
+    drawn = []
+    for crossing in CROSSINGS.values():
+        charts = crossing['graficos']
+        if charts is None or charts in drawn:
+            continue
+        if drawn:
+            st.markdown("---")
+        charts(analyzer)
+        drawn.append(charts)
@@ -7,183 +7,185 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
+from functools import partial
 from scipy import stats
 
+from ..contingency import crosstab_frame
+from ..metric_results import MetricResult, complete_rows
+from ..resampling import permutation_test_correlation
+from .registry import DEFAULT_MAX_WORKERS, register_crossing, run_crossings
+from utils.figure_cache import cached_figure
+from utils.profiling import profiled
 
-def _convert_workload_to_numeric(workload_series, tipo='diretoria'):
-    """Converte dados categóricos de workload para numéricos"""
-    mapping = {}
+
+# Cruzamento -> (cargas como pares (nome no resultado, chave canônica), coluna correlacionada)
+CROSSING_WORKLOADS = {
+    'satisfacao_vs_diretoria': ((('workload', 'horas_semanais_diretoria'),), 'workload'),
+    'satisfacao_vs_projeto': ((('workload', 'horas_semanais_projeto'),), 'workload'),
+    # Análise combinada (carga total)
+    'satisfacao_vs_carga_total': (
+        (('workload_dir', 'horas_semanais_diretoria'), ('workload_proj', 'horas_semanais_projeto')),
+        'carga_total'
+    )
+}
+
+CROSSING_NAMES = list(CROSSING_WORKLOADS)
+
+# Até este número de respostas o modo automático mostra os pontos individuais;
+# acima dele, a grade de contagens (tamanho fixo, independente do número de linhas)
+MAX_SCATTER_POINTS = 300
+
+# Modos de visualização dos gráficos de dispersão (pontos individuais só no
+# modo automático, para não enviar um ponto por resposta em arquivos grandes)
+VIEW_MODES = ['Automática', 'Bolhas', 'Mapa de calor']
+
+
+def _count_grid(valid_data, x):
+    """
+    Agrega os pares (carga, satisfação) em uma grade de contagens
+    
+    As duas escalas são discretas, então a grade tem no máximo algumas
+    dezenas de células, qualquer que seja o número de respostas.
+    """
+    return valid_data.groupby([x, 'satisfaction']).size().reset_index(name='n_respostas')
+
+
+def _numeric_crossing_figure(resultado, x, x_label, title, color, color_scale, mode):
+    """
+    Gráfico de um cruzamento numérico: pontos, bolhas ou mapa de calor
     
-    if tipo == 'diretoria':
-        mapping = {
-            '1 a 5 horas': 3,
-            '6 a 10 horas': 8,
-            '11 a 15 horas': 13,
-            'Mais de 15 horas': 18
-        }
-    elif tipo == 'projeto':
-        mapping = {
-            '1 a 5 horas': 3,
-            '6 a 10 horas': 8,
-            '11 a 15 horas': 13,
-            'Mais de 10 horas': 15,
-            'Mais de 15 horas': 18
-        }
-    elif tipo == 'projetos':
-        mapping = {
-            'Nenhum': 0,
-            'Um': 1,
-            'Dois': 2,
-            'Três': 3,
-            'Mais de três': 4
-        }
+    Args:
+        resultado (dict): Entrada do resultado de `analyze_satisfaction_vs_workload`
+        x (str): Coluna de carga em 'data_numerica' / 'contagens'
+        x_label (str): Rótulo do eixo x
+        title (str): Título do gráfico
+        color (str): Cor dos pontos e bolhas (None para a cor padrão)
+        color_scale (str): Escala de cores do mapa de calor
+        mode (str): Um dos VIEW_MODES
+    """
+    labels = {x: x_label, 'satisfaction': 'Satisfação Geral', 'n_respostas': 'Respostas'}
+    if mode == 'Automática' and resultado['n_amostras'] <= MAX_SCATTER_POINTS:
+        fig = px.scatter(resultado['data_numerica'], x=x, y='satisfaction', title=title, labels=labels)
+        fig.update_traces(marker_size=8)
+    elif mode in ('Automática', 'Bolhas'):
+        grid = resultado['contagens']
+        fig = px.scatter(
+            grid, x=x, y='satisfaction', size='n_respostas', hover_data=['n_respostas'],
+            size_max=40, title=title, labels=labels
+        )
+    else:
+        grid = resultado['contagens'].pivot(index='satisfaction', columns=x, values='n_respostas')
+        fig = px.imshow(
+            grid.fillna(0).to_numpy(),
+            x=[f'{value:g}' for value in grid.columns],
+            y=[f'{value:g}' for value in grid.index],
+            origin='lower',
+            aspect='auto',
+            text_auto=True,
+            color_continuous_scale=color_scale,
+            title=title,
+            labels={'x': x_label, 'y': 'Satisfação Geral', 'color': 'Respostas'}
+        )
     
-    return workload_series.map(mapping)
+    if color and mode != 'Mapa de calor':
+        fig.update_traces(marker_color=color)
+    return fig
 
 
-def analyze_satisfaction_vs_workload(analyzer):
+def analyze_satisfaction_vs_workload(analyzer, max_workers=DEFAULT_MAX_WORKERS):
     """
     Analisa a correlação entre satisfação geral e carga de trabalho
     
+    Cada cruzamento (incluindo os testes de permutação) é calculado pelo
+    registro de cruzamentos, em paralelo com os demais, e fica em cache até
+    que os dados mudem.
+    
     Args:
         analyzer: Instância do INJuniorSurveyAnalyzer
+        max_workers (int): Threads usadas nos cruzamentos pendentes
         
     Returns:
         dict: Resultados da análise de cruzamento
     """
-    df = analyzer.df_processed
+    return run_crossings(analyzer, CROSSING_NAMES, max_workers=max_workers)
+
+
+def _numeric_crossing_data(analyzer, workloads, dados=None):
+    """
+    Pares (satisfação, carga) numéricos, sem respostas incompletas
     
-    # Colunas de interesse
-    satisfaction_col = 'O quão satisfeito(a) você está com a IN Junior?'
-    workload_dir_col = 'Quantas horas por semana você gasta com tarefas de diretoria?'
-    workload_proj_col = 'Quantas horas semanalmente você gasta com tarefas de projeto?'
+    Args:
+        analyzer: Instância do INJuniorSurveyAnalyzer
+        workloads (tuple): Pares (nome no resultado, chave canônica da carga);
+            com mais de uma carga, a soma entra em 'carga_total'
+        dados (DataFrame, optional): Linhas completas do DataFrame codificado
     
-    results = {}
+    Returns:
+        DataFrame: Colunas 'satisfaction' e uma por carga
+    """
+    if dados is None:
+        keys = ['satisfacao_geral'] + [key for _, key in workloads]
+        dados = analyzer.encoded_numeric_frame().reindex(columns=keys).dropna()
     
-    # Verificar se as colunas existem
-    if satisfaction_col in df.columns:
-        # Análise Satisfação vs Horas Diretoria
-        if workload_dir_col in df.columns:
-            data_dir = df[[satisfaction_col, workload_dir_col]].dropna()
-            if len(data_dir) > 5:  # Mínimo de dados para análise
-                
-                # Converter dados categóricos para numéricos quando possível
-                satisfaction_numeric = pd.to_numeric(data_dir[satisfaction_col], errors='coerce')
-                workload_numeric = _convert_workload_to_numeric(data_dir[workload_dir_col], 'diretoria')
-                
-                # Remover valores que não puderam ser convertidos
-                valid_data = pd.DataFrame({
-                    'satisfaction': satisfaction_numeric,
-                    'workload': workload_numeric
-                }).dropna()
-                
-                if len(valid_data) > 5:
-                    correlation_dir, p_value_dir = stats.pearsonr(
-                        valid_data['satisfaction'], 
-                        valid_data['workload']
-                    )
-                    
-                    results['satisfacao_vs_diretoria'] = {
-                        'correlacao': round(correlation_dir, 3),
-                        'p_value': round(p_value_dir, 3),
-                        'significativo': p_value_dir < 0.05,
-                        'data': data_dir,  # Dados originais para visualização
-                        'data_numerica': valid_data,  # Dados numéricos para correlação
-                        'n_amostras': len(valid_data)
-                    }
-                else:
-                    # Se não conseguir converter para numérico, fazer análise categórica
-                    results['satisfacao_vs_diretoria'] = {
-                        'tipo_analise': 'categorica',
-                        'crosstab': pd.crosstab(data_dir[satisfaction_col], data_dir[workload_dir_col]),
-                        'data': data_dir,
-                        'n_amostras': len(data_dir)
-                    }
-        
-        # Análise Satisfação vs Horas Projeto
-        if workload_proj_col in df.columns:
-            data_proj = df[[satisfaction_col, workload_proj_col]].dropna()
-            if len(data_proj) > 5:
-                
-                # Converter dados categóricos para numéricos quando possível
-                satisfaction_numeric = pd.to_numeric(data_proj[satisfaction_col], errors='coerce')
-                workload_numeric = _convert_workload_to_numeric(data_proj[workload_proj_col], 'projeto')
-                
-                # Remover valores que não puderam ser convertidos
-                valid_data = pd.DataFrame({
-                    'satisfaction': satisfaction_numeric,
-                    'workload': workload_numeric
-                }).dropna()
-                
-                if len(valid_data) > 5:
-                    correlation_proj, p_value_proj = stats.pearsonr(
-                        valid_data['satisfaction'], 
-                        valid_data['workload']
-                    )
-                    
-                    results['satisfacao_vs_projeto'] = {
-                        'correlacao': round(correlation_proj, 3),
-                        'p_value': round(p_value_proj, 3),
-                        'significativo': p_value_proj < 0.05,
-                        'data': data_proj,  # Dados originais para visualização
-                        'data_numerica': valid_data,  # Dados numéricos para correlação
-                        'n_amostras': len(valid_data)
-                    }
-                else:
-                    # Se não conseguir converter para numérico, fazer análise categórica
-                    results['satisfacao_vs_projeto'] = {
-                        'tipo_analise': 'categorica',
-                        'crosstab': pd.crosstab(data_proj[satisfaction_col], data_proj[workload_proj_col]),
-                        'data': data_proj,
-                        'n_amostras': len(data_proj)
-                    }
+    valid_data = pd.DataFrame({
+        'satisfaction': dados['satisfacao_geral'],
+        **{name: dados[key] for name, key in workloads}
+    })
+    
+    if len(workloads) > 1:
+        valid_data['carga_total'] = sum(valid_data[name] for name, _ in workloads)
+    return valid_data
+
+
+def _compute_crossing(analyzer, dados, workloads, x):
+    """
+    Cruzamento de satisfação com uma carga (ou com a soma de várias)
+    
+    As faixas chegam convertidas nos pontos médios pelo DataFrame codificado
+    compartilhado. O resultado guarda só os agregados; as linhas usadas
+    ('data') e os pares numéricos ('data_numerica') são refeitos quando
+    algum gráfico pede (MetricResult).
+    
+    Returns:
+        MetricResult: Resultado do cruzamento, ou None com até 5 respostas completas
+    """
+    columns = tuple(analyzer.schema.column(key) for key in ['satisfacao_geral'] + [key for _, key in workloads])
+    lazy = {'data': partial(complete_rows, columns=columns)}
+    valid_data = _numeric_crossing_data(analyzer, workloads, dados)
+    
+    if len(valid_data) <= 5:
+        data = complete_rows(analyzer, columns)
+        if len(data) <= 5:  # Mínimo de dados para análise
+            return None
         
-        # Análise combinada (carga total)
-        if workload_dir_col in df.columns and workload_proj_col in df.columns:
-            data_combined = df[[satisfaction_col, workload_dir_col, workload_proj_col]].dropna()
-            if len(data_combined) > 5:
-                
-                # Converter dados categóricos para numéricos quando possível
-                satisfaction_numeric = pd.to_numeric(data_combined[satisfaction_col], errors='coerce')
-                workload_dir_numeric = _convert_workload_to_numeric(data_combined[workload_dir_col], 'diretoria')
-                workload_proj_numeric = _convert_workload_to_numeric(data_combined[workload_proj_col], 'projeto')
-                
-                # Criar carga total apenas se ambos forem numéricos
-                valid_data = pd.DataFrame({
-                    'satisfaction': satisfaction_numeric,
-                    'workload_dir': workload_dir_numeric,
-                    'workload_proj': workload_proj_numeric
-                }).dropna()
-                
-                if len(valid_data) > 5:
-                    # Criar carga total
-                    valid_data['carga_total'] = valid_data['workload_dir'] + valid_data['workload_proj']
-                    
-                    correlation_total, p_value_total = stats.pearsonr(
-                        valid_data['satisfaction'], 
-                        valid_data['carga_total']
-                    )
-                    
-                    results['satisfacao_vs_carga_total'] = {
-                        'correlacao': round(correlation_total, 3),
-                        'p_value': round(p_value_total, 3),
-                        'significativo': p_value_total < 0.05,
-                        'data': data_combined,  # Dados originais
-                        'data_numerica': valid_data,  # Dados numéricos
-                        'n_amostras': len(valid_data)
-                    }
-                else:
-                    # Se não conseguir converter, fazer análise categórica básica
-                    results['satisfacao_vs_carga_total'] = {
-                        'tipo_analise': 'categorica_combinada',
-                        'data': data_combined,
-                        'n_amostras': len(data_combined),
-                        'nota': 'Análise categórica - sem conversão numérica possível'
-                    }
+        # Se não conseguir converter para numérico, fazer análise categórica
+        if len(workloads) > 1:
+            return MetricResult({
+                'tipo_analise': 'categorica_combinada',
+                'n_amostras': len(data),
+                'nota': 'Análise categórica - sem conversão numérica possível'
+            }, analyzer, lazy=lazy)
+        return MetricResult({
+            'tipo_analise': 'categorica',
+            'crosstab': crosstab_frame(data[columns[0]], data[columns[1]]),
+            'n_amostras': len(data)
+        }, analyzer, lazy=lazy)
     
-    return results
+    correlation, p_value = stats.pearsonr(valid_data['satisfaction'], valid_data[x])
+    lazy['data_numerica'] = partial(_numeric_crossing_data, workloads=workloads)
+    return MetricResult({
+        'correlacao': round(correlation, 3),
+        'p_value': round(p_value, 3),
+        'p_value_permutacao': round(permutation_test_correlation(
+            valid_data['satisfaction'], valid_data[x]
+        ), 4),
+        'significativo': p_value < 0.05,
+        'contagens': _count_grid(valid_data, x),  # Grade para os gráficos agregados
+        'n_amostras': len(valid_data)
+    }, analyzer, lazy=lazy)
 
 
+@profiled('graficos.cruzamento_satisfacao_carga')
 def create_satisfaction_workload_charts(analyzer):
     """Cria gráficos do cruzamento satisfação vs carga de trabalho"""
     
@@ -196,6 +198,13 @@ def create_satisfaction_workload_charts(analyzer):
         st.warning("Dados insuficientes para análise de correlação.")
         return
     
+    # Com muitas respostas, os pontos se sobrepõem e o gráfico cresce com o
+    # número de linhas: a grade de contagens tem tamanho fixo
+    mode = st.radio(
+        "Visualização:", VIEW_MODES, horizontal=True,
+        help=f"Automática: pontos individuais até {MAX_SCATTER_POINTS} respostas, bolhas acima disso"
+    )
+    
     # Layout com 2 colunas
     col1, col2 = st.columns(2)
     
@@ -206,31 +215,25 @@ def create_satisfaction_workload_charts(analyzer):
             corr = resultado['correlacao']
             sig = resultado['significativo']
             
-            # Usar dados numéricos se disponíveis, senão fazer gráfico categórico
-            if 'data_numerica' in resultado:
-                data_num = resultado['data_numerica']
-                fig = px.scatter(
-                    data_num,
-                    x='workload',
-                    y='satisfaction',
-                    title=f"Satisfação vs Horas Diretoria<br>Correlação: {corr} {'*' if sig else ''}",
-                    labels={
-                        'workload': 'Horas Diretoria/Semana (mapeamento numérico)',
-                        'satisfaction': 'Satisfação Geral'
-                    }
-                )
-                fig.update_traces(marker_size=8)
-            else:
-                # Análise categórica - criar gráfico de barras agrupadas
-                data = resultado['data']
-                crosstab = pd.crosstab(data['O quão satisfeito(a) você está com a IN Junior?'], 
-                                     data['Quantas horas por semana você gasta com tarefas de diretoria?'])
-                fig = px.bar(
-                    x=crosstab.columns,
-                    y=crosstab.loc[crosstab.index[0]] if len(crosstab.index) > 0 else [],
-                    title="Satisfação vs Horas Diretoria (Análise Categórica)",
-                    labels={'x': 'Horas Diretoria/Semana', 'y': 'Quantidade de Respostas'}
-                )
+            def _build():
+                # Usar dados numéricos se disponíveis, senão fazer gráfico categórico
+                if 'data_numerica' in resultado:
+                    fig = _numeric_crossing_figure(
+                        resultado, 'workload', 'Horas Diretoria/Semana (mapeamento numérico)',
+                        f"Satisfação vs Horas Diretoria<br>Correlação: {corr} {'*' if sig else ''}",
+                        None, 'Blues', mode
+                    )
+                else:
+                    # Análise categórica - gráfico de barras da tabela já calculada
+                    crosstab = resultado['crosstab']
+                    fig = px.bar(
+                        x=crosstab.columns,
+                        y=crosstab.loc[crosstab.index[0]] if len(crosstab.index) > 0 else [],
+                        title="Satisfação vs Horas Diretoria (Análise Categórica)",
+                        labels={'x': 'Horas Diretoria/Semana', 'y': 'Quantidade de Respostas'}
+                    )
+                return fig
+            fig = cached_figure(analyzer, 'cruzamento_horas_diretoria', _build, mode=mode)
             st.plotly_chart(fig, width="stretch")
     
     # Gráfico: Satisfação vs Horas Projeto
@@ -240,31 +243,25 @@ def create_satisfaction_workload_charts(analyzer):
             corr = resultado['correlacao']
             sig = resultado['significativo']
             
-            # Usar dados numéricos se disponíveis, senão fazer gráfico categórico
-            if 'data_numerica' in resultado:
-                data_num = resultado['data_numerica']
-                fig = px.scatter(
-                    data_num,
-                    x='workload',
-                    y='satisfaction',
-                    title=f"Satisfação vs Horas Projeto<br>Correlação: {corr} {'*' if sig else ''}",
-                    labels={
-                        'workload': 'Horas Projeto/Semana (mapeamento numérico)',
-                        'satisfaction': 'Satisfação Geral'
-                    }
-                )
-                fig.update_traces(marker_size=8, marker_color='orange')
-            else:
-                # Análise categórica - criar gráfico de barras agrupadas
-                data = resultado['data']
-                crosstab = pd.crosstab(data['O quão satisfeito(a) você está com a IN Junior?'], 
-                                     data['Quantas horas semanalmente você gasta com tarefas de projeto?'])
-                fig = px.bar(
-                    x=crosstab.columns,
-                    y=crosstab.loc[crosstab.index[0]] if len(crosstab.index) > 0 else [],
-                    title="Satisfação vs Horas Projeto (Análise Categórica)",
-                    labels={'x': 'Horas Projeto/Semana', 'y': 'Quantidade de Respostas'}
-                )
+            def _build():
+                # Usar dados numéricos se disponíveis, senão fazer gráfico categórico
+                if 'data_numerica' in resultado:
+                    fig = _numeric_crossing_figure(
+                        resultado, 'workload', 'Horas Projeto/Semana (mapeamento numérico)',
+                        f"Satisfação vs Horas Projeto<br>Correlação: {corr} {'*' if sig else ''}",
+                        'orange', 'Oranges', mode
+                    )
+                else:
+                    # Análise categórica - gráfico de barras da tabela já calculada
+                    crosstab = resultado['crosstab']
+                    fig = px.bar(
+                        x=crosstab.columns,
+                        y=crosstab.loc[crosstab.index[0]] if len(crosstab.index) > 0 else [],
+                        title="Satisfação vs Horas Projeto (Análise Categórica)",
+                        labels={'x': 'Horas Projeto/Semana', 'y': 'Quantidade de Respostas'}
+                    )
+                return fig
+            fig = cached_figure(analyzer, 'cruzamento_horas_projeto', _build, mode=mode)
             st.plotly_chart(fig, width="stretch")
     
     # Gráfico: Satisfação vs Carga Total
@@ -273,29 +270,25 @@ def create_satisfaction_workload_charts(analyzer):
         corr = resultado['correlacao']
         sig = resultado['significativo']
         
-        # Usar dados numéricos se disponíveis
-        if 'data_numerica' in resultado:
-            data_num = resultado['data_numerica']
-            fig = px.scatter(
-                data_num,
-                x='carga_total',
-                y='satisfaction',
-                title=f"Satisfação vs Carga Total de Trabalho<br>Correlação: {corr} {'*' if sig else ''}",
-                labels={
-                    'carga_total': 'Carga Total (Horas/Semana)',
-                    'satisfaction': 'Satisfação Geral'
-                }
-            )
-            fig.update_traces(marker_size=8, marker_color='red')
-        else:
-            # Fallback para dados originais se necessário
-            data = resultado['data']
-            fig = px.histogram(
-                data,
-                x='carga_total',
-                title="Distribuição da Carga Total de Trabalho",
-                labels={'carga_total': 'Carga Total (Horas/Semana)'}
-            )
+        def _build():
+            # Usar dados numéricos se disponíveis
+            if 'data_numerica' in resultado:
+                fig = _numeric_crossing_figure(
+                    resultado, 'carga_total', 'Carga Total (Horas/Semana)',
+                    f"Satisfação vs Carga Total de Trabalho<br>Correlação: {corr} {'*' if sig else ''}",
+                    'red', 'Reds', mode
+                )
+            else:
+                # Fallback para dados originais se necessário
+                data = resultado['data']
+                fig = px.histogram(
+                    data,
+                    x='carga_total',
+                    title="Distribuição da Carga Total de Trabalho",
+                    labels={'carga_total': 'Carga Total (Horas/Semana)'}
+                )
+            return fig
+        fig = cached_figure(analyzer, 'cruzamento_carga_total', _build, mode=mode)
         st.plotly_chart(fig, width="stretch")
     
     # Resumo estatístico
@@ -307,6 +300,7 @@ def create_satisfaction_workload_charts(analyzer):
             'Análise': analysis_name.replace('_', ' ').title(),
             'Correlação': analysis_data['correlacao'],
             'P-valor': analysis_data['p_value'],
+            'P-valor (permutação)': analysis_data.get('p_value_permutacao'),
             'Significativo (p<0.05)': '✅' if analysis_data['significativo'] else '❌',
             'N° Amostras': analysis_data['n_amostras']
         })
@@ -330,6 +324,7 @@ def create_satisfaction_workload_charts(analyzer):
             **Significância estatística:**
             - ✅ p < 0.05: A correlação é estatisticamente significativa
             - ❌ p ≥ 0.05: A correlação pode ser devido ao acaso
+            - O p-valor de permutação (10.000 embaralhamentos) não supõe normalidade e é mais confiável em amostras pequenas
             
             **(*) indica correlação estatisticamente significativa**
             """)
@@ -367,3 +362,12 @@ def get_correlation_insights(results):
             insights.append(insight)
     
     return insights
+
+
+for _name, (_workloads, _x) in CROSSING_WORKLOADS.items():
+    register_crossing(
+        _name,
+        columns=['satisfacao_geral'] + [key for _, key in _workloads],
+        compute=partial(_compute_crossing, workloads=_workloads, x=_x),
+        charts=create_satisfaction_workload_charts
+    )
@@ -0,0 +1,281 @@
+"""
+Histórico de ondas da pesquisa (SQLite) com consultas de tendência indexadas
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .schema import QUESTION_CATALOG
+
+
+# Arquivo padrão do histórico (pode ser alterado pela variável de ambiente)
+DEFAULT_HISTORY_PATH = os.environ.get(
+    'DASHBOARD_HISTORY_DB',
+    os.path.join('dados', 'historico_pesquisas.sqlite3')
+)
+
+# Estatísticas numéricas de cada métrica guardadas como agregados da onda
+AGGREGATE_STATISTICS = [
+    'n_respostas', 'media', 'mediana', 'desvio_padrao',
+    'percentil_25', 'percentil_75', 'minimo', 'maximo'
+]
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS ondas (
+    id INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL UNIQUE,
+    ordem REAL NOT NULL,
+    criado_em TEXT NOT NULL,
+    hash_conteudo TEXT,
+    total_respostas INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS respostas (
+    onda_id INTEGER NOT NULL REFERENCES ondas(id) ON DELETE CASCADE,
+    linha INTEGER NOT NULL,
+    chave TEXT NOT NULL,
+    valor_numerico REAL,
+    valor_texto TEXT,
+    PRIMARY KEY (onda_id, chave, linha)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS agregados (
+    onda_id INTEGER NOT NULL REFERENCES ondas(id) ON DELETE CASCADE,
+    secao TEXT NOT NULL,
+    chave TEXT NOT NULL,
+    estatistica TEXT NOT NULL,
+    valor REAL,
+    PRIMARY KEY (chave, estatistica, onda_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_agregados_onda ON agregados (onda_id, chave);
+"""
+
+
+class SurveyHistoryStore:
+    """
+    Armazena várias ondas (semestres) da pesquisa em um banco SQLite local
+    
+    Cada onda é processada pelo INJuniorSurveyAnalyzer e gravada em duas
+    formas: as respostas normalizadas (uma linha por respondente e pergunta,
+    pela chave canônica) e os agregados do relatório por métrica. As
+    consultas de tendência leem apenas os agregados, indexados por pergunta e
+    onda, sem recarregar respostas.
+    """
+    
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        """
+        Args:
+            path (str): Arquivo SQLite do histórico (criado se não existir)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA_SQL)
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute('PRAGMA foreign_keys = ON')
+        return conn
+    
+    def ingest_wave(self, name, analyzer, content_hash=None, order=None):
+        """
+        Grava (ou substitui) uma onda a partir de um analisador já processado
+        
+        Args:
+            name (str): Nome da onda (ex: '2025.1')
+            analyzer: Instância do INJuniorSurveyAnalyzer
+            content_hash (str, optional): Hash do CSV de origem
+            order (float, optional): Posição da onda nas tendências (padrão: após a última)
+        
+        Returns:
+            int: Identificador da onda
+        """
+        report = analyzer.generate_summary_report()
+        responses = normalized_responses(analyzer)
+        aggregates = report_aggregates(report)
+        
+        with closing(self._connect()) as conn, conn:
+            existing = conn.execute('SELECT ordem FROM ondas WHERE nome = ?', (name,)).fetchone()
+            if order is None:
+                if existing is not None:
+                    order = existing[0]
+                else:
+                    order = conn.execute('SELECT COALESCE(MAX(ordem), 0) + 1 FROM ondas').fetchone()[0]
+            
+            conn.execute('DELETE FROM ondas WHERE nome = ?', (name,))
+            cursor = conn.execute(
+                'INSERT INTO ondas (nome, ordem, criado_em, hash_conteudo, total_respostas) VALUES (?, ?, ?, ?, ?)',
+                (name, order, datetime.now().isoformat(timespec='seconds'), content_hash,
+                 report['info_geral']['total_respostas'])
+            )
+            wave_id = cursor.lastrowid
+            
+            # Valores Python (sqlite3 não aceita inteiros do NumPy) e None no lugar de NaN
+            responses.insert(0, 'onda_id', wave_id)
+            records = responses.astype(object).where(responses.notna(), None)
+            conn.executemany(
+                'INSERT INTO respostas (onda_id, linha, chave, valor_numerico, valor_texto) VALUES (?, ?, ?, ?, ?)',
+                records.itertuples(index=False, name=None)
+            )
+            conn.executemany(
+                'INSERT INTO agregados (onda_id, secao, chave, estatistica, valor) VALUES (?, ?, ?, ?, ?)',
+                ((wave_id,) + row for row in aggregates)
+            )
+        
+        return wave_id
+    
+    def delete_wave(self, name):
+        """Remove uma onda e todos os seus dados"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM ondas WHERE nome = ?', (name,))
+    
+    def waves(self):
+        """Lista as ondas gravadas, na ordem das tendências"""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                'SELECT nome, ordem, criado_em, total_respostas FROM ondas ORDER BY ordem',
+                conn
+            )
+    
+    def available_metrics(self):
+        """Lista as métricas (seção e chave) que têm agregados em alguma onda"""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                'SELECT DISTINCT secao, chave FROM agregados ORDER BY secao, chave',
+                conn
+            )
+    
+    def trend(self, keys, statistic='media'):
+        """
+        Série histórica de uma ou mais métricas, a partir dos agregados
+        
+        Args:
+            keys (list): Chaves das métricas (ex: ['satisfacao_geral'])
+            statistic (str): Estatística (ex: 'media', 'mediana', 'contagem:Um')
+        
+        Returns:
+            DataFrame: Uma linha por onda (na ordem) e uma coluna por métrica
+        """
+        keys = list(keys)
+        if not keys:
+            return pd.DataFrame()
+        
+        placeholders = ', '.join('?' for _ in keys)
+        query = f"""
+            SELECT o.nome AS onda, o.ordem, a.chave, a.valor
+            FROM agregados a
+            JOIN ondas o ON o.id = a.onda_id
+            WHERE a.chave IN ({placeholders}) AND a.estatistica = ?
+        """
+        with closing(self._connect()) as conn:
+            rows = pd.read_sql_query(query, conn, params=keys + [statistic])
+        
+        if rows.empty:
+            return pd.DataFrame(columns=keys)
+        
+        table = rows.pivot_table(index=['ordem', 'onda'], columns='chave', values='valor')
+        return table.reset_index(level='ordem', drop=True).reindex(columns=[k for k in keys if k in table.columns])
+    
+    def responses(self, wave, keys=None):
+        """
+        Recupera as respostas normalizadas de uma onda
+        
+        Args:
+            wave (str): Nome da onda
+            keys (list, optional): Chaves a recuperar (padrão: todas)
+        
+        Returns:
+            DataFrame: Uma linha por respondente e uma coluna por chave
+        """
+        query = """
+            SELECT r.linha, r.chave, COALESCE(r.valor_texto, r.valor_numerico) AS valor
+            FROM respostas r
+            JOIN ondas o ON o.id = r.onda_id
+            WHERE o.nome = ?
+        """
+        params = [wave]
+        if keys:
+            query += f" AND r.chave IN ({', '.join('?' for _ in keys)})"
+            params += list(keys)
+        
+        with closing(self._connect()) as conn:
+            rows = pd.read_sql_query(query, conn, params=params)
+        return rows.pivot(index='linha', columns='chave', values='valor')
+
+
+def normalized_responses(analyzer):
+    """
+    Respostas das perguntas conhecidas em formato longo (uma linha por respondente e pergunta)
+    
+    Monta uma tabela larga por chave canônica e a empilha com `melt`, sem
+    percorrer as respostas em Python.
+    
+    Args:
+        analyzer: Instância do INJuniorSurveyAnalyzer
+    
+    Returns:
+        DataFrame: linha, chave, valor_numerico e valor_texto das respostas válidas
+            (None onde não se aplica)
+    """
+    df = analyzer.df_processed
+    numeric = {}
+    text = {}
+    valid = {}
+    
+    for key, col in analyzer.schema.columns_of_type('likert', 'numerico', 'faixa', 'categorico').items():
+        series = df[col]
+        if QUESTION_CATALOG[key]['tipo'] == 'faixa' and col in df.attrs.get('band_midpoints', {}):
+            numeric[key] = analyzer.band_to_numeric(series).to_numpy()
+            text[key] = series.astype(str).to_numpy(dtype=object)
+        elif pd.api.types.is_numeric_dtype(series):
+            numeric[key] = series.to_numpy(dtype=float, na_value=np.nan)
+            text[key] = np.full(len(df), None, dtype=object)
+        else:
+            numeric[key] = np.full(len(df), np.nan)
+            text[key] = series.astype(str).to_numpy(dtype=object)
+        valid[key] = series.notna().to_numpy()
+    
+    def _long(wide, name):
+        frame = pd.DataFrame(wide, index=pd.RangeIndex(len(df), name='linha'), columns=list(valid))
+        return frame.reset_index().melt(id_vars='linha', var_name='chave', value_name=name)
+    
+    responses = _long(numeric, 'valor_numerico')
+    responses['valor_texto'] = _long(text, 'valor_texto')['valor_texto'].to_numpy()
+    responses = responses[_long(valid, 'valida')['valida'].to_numpy(dtype=bool)]
+    return responses.reset_index(drop=True)
+
+
+def report_aggregates(report):
+    """Gera (secao, chave, estatistica, valor) a partir do relatório resumo"""
+    for section, metrics in report.items():
+        if section == 'info_geral':
+            continue
+        for key, metric in metrics.items():
+            for statistic in AGGREGATE_STATISTICS:
+                value = metric.get(statistic)
+                if value is not None and not pd.isna(value):
+                    yield (section, key, statistic, float(value))
+            
+            # Contagem por categoria (ex: faixas de horas)
+            if 'value_counts' in metric:
+                for label, count in metric['value_counts'].items():
+                    yield (section, key, f'contagem:{label}', float(count))
+
+
+_history_store = None
+
+
+def get_history_store():
+    """Retorna o histórico global (criado no primeiro uso)"""
+    global _history_store
+    if _history_store is None:
+        _history_store = SurveyHistoryStore()
+    return _history_store
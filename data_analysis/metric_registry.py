@@ -0,0 +1,118 @@
+"""
+Registro declarativo das métricas de escala (Likert) do relatório
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Grupo do relatório -> chaves canônicas das perguntas (ver schema.QUESTION_CATALOG).
+# A chave canônica também é a chave da métrica no relatório.
+METRIC_GROUPS = {
+    'satisfacao': ['satisfacao_geral'],
+    'estrutura_organizacional': ['organizacao_de', 'acessibilidade_diretor', 'comunicacao_interna'],
+    'cultura_feedback': ['preparacao_feedback', 'frequencia_feedback_dado', 'frequencia_feedback_recebido'],
+    'engajamento': ['importancia_eventos', 'sentimento_ouvido']
+}
+
+
+def register_metric_group(group, keys):
+    """
+    Registra (ou amplia) um grupo de métricas do relatório
+
+    Args:
+        group (str): Nome da seção do relatório (ex: 'engajamento')
+        keys (list): Chaves canônicas das perguntas (devem existir no catálogo)
+    """
+    metrics = METRIC_GROUPS.setdefault(group, [])
+    metrics.extend(key for key in keys if key not in metrics)
+
+
+def registered_keys():
+    """Retorna todas as chaves registradas, sem repetição e na ordem do registro"""
+    keys = []
+    for metrics in METRIC_GROUPS.values():
+        for key in metrics:
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def aggregate_likert(df, columns):
+    """
+    Calcula as estatísticas de todas as perguntas em uma única agregação
+
+    Args:
+        df (DataFrame): Dados processados
+        columns (list): Colunas numéricas a agregar
+
+    Returns:
+        DataFrame: Uma linha por coluna com n_respostas, media, mediana,
+            desvio_padrao, percentil_25 e percentil_75
+    """
+    if not columns:
+        return pd.DataFrame(
+            columns=['n_respostas', 'media', 'mediana', 'desvio_padrao', 'percentil_25', 'percentil_75']
+        )
+
+    data = df[columns]
+    stats = data.agg(['count', 'mean', 'median', 'std']).T
+    quartiles = data.quantile([0.25, 0.75]).T
+
+    return pd.DataFrame({
+        'n_respostas': stats['count'].astype(int),
+        'media': _as_float(stats['mean']),
+        'mediana': _as_float(stats['median']),
+        'desvio_padrao': _as_float(stats['std']),
+        'percentil_25': _as_float(quartiles[0.25]),
+        'percentil_75': _as_float(quartiles[0.75])
+    })
+
+
+def _as_float(values):
+    """Converte para float, com NaN no lugar de pd.NA (colunas anuláveis sem respostas)"""
+    return pd.Series(values.astype('Float64').to_numpy(dtype=float, na_value=np.nan), index=values.index)
+
+
+def _quantile_from_counts(values, cumulative, q):
+    """Quantil com interpolação linear (como o pandas) a partir das contagens acumuladas"""
+    position = (cumulative[-1] - 1) * q
+    lower = values[np.searchsorted(cumulative, np.floor(position), side='right')]
+    upper = values[np.searchsorted(cumulative, np.ceil(position), side='right')]
+    return float(lower + (upper - lower) * (position - np.floor(position)))
+
+
+def aggregate_likert_counts(counts):
+    """
+    Mesmas estatísticas de `aggregate_likert`, calculadas a partir das
+    contagens de cada valor (sem percorrer as respostas)
+
+    Args:
+        counts (dict): Coluna -> (valores em ordem crescente, contagens)
+
+    Returns:
+        DataFrame: Uma linha por coluna, no formato de `aggregate_likert`
+    """
+    rows = {}
+    for column, (values, column_counts) in counts.items():
+        values = np.asarray(values, dtype=float)
+        column_counts = np.asarray(column_counts, dtype=np.int64)
+        n = int(column_counts.sum())
+        row = {'n_respostas': n, 'media': np.nan, 'mediana': np.nan, 'desvio_padrao': np.nan,
+               'percentil_25': np.nan, 'percentil_75': np.nan}
+        if n > 0:
+            mean = float((values * column_counts).sum() / n)
+            cumulative = np.cumsum(column_counts)
+            row.update({
+                'media': mean,
+                'mediana': _quantile_from_counts(values, cumulative, 0.5),
+                'percentil_25': _quantile_from_counts(values, cumulative, 0.25),
+                'percentil_75': _quantile_from_counts(values, cumulative, 0.75)
+            })
+            if n > 1:
+                row['desvio_padrao'] = float(np.sqrt(((values - mean) ** 2 * column_counts).sum() / (n - 1)))
+        rows[column] = row
+
+    columns = ['n_respostas', 'media', 'mediana', 'desvio_padrao', 'percentil_25', 'percentil_75']
+    result = pd.DataFrame.from_dict(rows, orient='index', columns=columns)
+    return result.astype({'n_respostas': int})
@@ -0,0 +1,96 @@
+"""
+Resultados compactos de métricas: agregados guardados, séries reconstruídas sob demanda
+"""
+
+from collections.abc import Mapping
+
+
+class MetricResult(Mapping):
+    """
+    Resultado de uma métrica ou cruzamento com a interface de um dict
+    
+    Guarda apenas os agregados (médias, contagens...) e, para os campos com
+    dados linha a linha ('data', 'numeric_data', 'data_numerica'), uma
+    receita que os reconstrói a partir de `analyzer.df_processed` quando um
+    gráfico pede o campo. Assim o relatório não duplica colunas do
+    DataFrame e fica barato de guardar em cache, serializar (pickle) e
+    enviar para outros processos.
+    
+    O analisador fica referenciado enquanto o resultado existir, mas não é
+    serializado: depois de um pickle, ler um campo linha a linha levanta
+    RuntimeError até que o resultado seja associado com `bind(analyzer)`.
+    """
+    
+    __slots__ = ('_values', '_lazy', '_analyzer')
+    
+    def __init__(self, values, analyzer=None, lazy=None):
+        """
+        Args:
+            values (dict): Agregados da métrica
+            analyzer: INJuniorSurveyAnalyzer de onde vêm os dados linha a linha
+            lazy (dict, optional): Campo -> função(analyzer) que monta o valor;
+                use funções de módulo ou `functools.partial` (serializáveis)
+        """
+        self._values = dict(values)
+        self._lazy = dict(lazy or {})
+        self._analyzer = None
+        if analyzer is not None:
+            self.bind(analyzer)
+    
+    def bind(self, analyzer):
+        """Associa o resultado a um analisador com os mesmos dados (ex: após pickle)"""
+        self._analyzer = analyzer
+        return self
+    
+    def __getitem__(self, key):
+        if key in self._values:
+            return self._values[key]
+        if key in self._lazy:
+            if self._analyzer is None:
+                raise RuntimeError(
+                    f"O campo '{key}' é reconstruído a partir dos dados processados; "
+                    "associe o resultado a um analisador com bind(analyzer)"
+                )
+            return self._lazy[key](self._analyzer)
+        raise KeyError(key)
+    
+    def __contains__(self, key):
+        # Não materializa os campos linha a linha
+        return key in self._values or key in self._lazy
+    
+    def __iter__(self):
+        yield from self._values
+        yield from (key for key in self._lazy if key not in self._values)
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+    
+    def to_dict(self):
+        """Somente os agregados, como um dict comum"""
+        return dict(self._values)
+    
+    def __getstate__(self):
+        return self._values, self._lazy
+    
+    def __setstate__(self, state):
+        self._values, self._lazy = state
+        self._analyzer = None
+    
+    def __repr__(self):
+        lazy = [key for key in self._lazy if key not in self._values]
+        return f"MetricResult({self._values!r}, sob_demanda={lazy!r})"
+
+
+def column_data(analyzer, column):
+    """Respostas válidas de uma coluna de df_processed"""
+    return analyzer.df_processed[column].dropna()
+
+
+def band_numeric_data(analyzer, column):
+    """Pontos médios numéricos das respostas válidas de uma coluna de faixas"""
+    return analyzer.band_to_numeric(column_data(analyzer, column)).dropna()
+
+
+def complete_rows(analyzer, columns):
+    """Linhas de df_processed com todas as colunas respondidas"""
+    return analyzer.df_processed[list(columns)].dropna()
@@ -0,0 +1,226 @@
+"""
+Reamostragem vetorizada: intervalos de confiança bootstrap e testes de permutação
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.profiling import profiled
+
+
+# Número padrão de reamostragens e semente fixa (resultados reprodutíveis)
+DEFAULT_RESAMPLES = 10000
+DEFAULT_SEED = 42
+
+# Nível de confiança dos intervalos
+DEFAULT_CONFIDENCE = 0.95
+
+# Máximo de elementos de uma matriz de índices por bloco (limita a memória)
+MAX_BLOCK_ELEMENTS = 2 ** 22
+
+# Acima deste total de índices (n x B), o teste de permutação sorteia tabelas de
+# contingência em vez de permutar índices, se houver até MAX_PERMUTATION_CELLS células
+MAX_INDEX_ELEMENTS = 2 ** 25
+MAX_PERMUTATION_CELLS = 400
+
+
+def _quantile_from_counts(values, cumulative, n, q):
+    """
+    Quantil (interpolação linear, como `Series.quantile`) de cada linha de contagens
+    
+    Args:
+        values (ndarray): Valores distintos ordenados (K)
+        cumulative (ndarray): Contagens acumuladas por reamostragem (B x K)
+        n (int): Tamanho de cada reamostragem
+        q (float): Quantil entre 0 e 1
+    """
+    position = (n - 1) * q
+    lower = values[(cumulative <= np.floor(position)).sum(axis=1)]
+    upper = values[(cumulative <= np.ceil(position)).sum(axis=1)]
+    return lower + (upper - lower) * (position - np.floor(position))
+
+
+def _bootstrap_by_indices(values, n_resamples, rng):
+    """
+    Média, mediana e desvio padrão de reamostragens de índices, em blocos
+    
+    Usado quando a matriz B x K de contagens seria grande demais (colunas
+    com muitos valores distintos): cada bloco tem até MAX_BLOCK_ELEMENTS índices.
+    
+    Returns:
+        tuple: (médias, medianas, desvios), um valor por reamostragem
+    """
+    n = len(values)
+    means = np.empty(n_resamples)
+    medians = np.empty(n_resamples)
+    stds = np.empty(n_resamples)
+    
+    block = max(1, MAX_BLOCK_ELEMENTS // n)
+    for start in range(0, n_resamples, block):
+        stop = min(start + block, n_resamples)
+        samples = values[rng.integers(0, n, size=(stop - start, n))]
+        means[start:stop] = samples.mean(axis=1)
+        stds[start:stop] = samples.std(axis=1, ddof=1)
+        medians[start:stop] = np.median(samples, axis=1, overwrite_input=True)
+    return means, medians, stds
+
+
+def bootstrap_column(values, n_resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE, rng=None):
+    """
+    Intervalos bootstrap (percentil) da média, mediana e desvio padrão de uma coluna
+    
+    Reamostrar n índices com reposição equivale a sortear quantas vezes cada
+    valor distinto aparece (distribuição multinomial). Como as perguntas têm
+    poucos valores distintos (escala 1-5, faixas), todas as reamostragens
+    são geradas de uma vez como uma matriz B x K de contagens, sem montar a
+    matriz B x n de índices nem laços em Python. Colunas com muitos valores
+    distintos (B x K acima de MAX_BLOCK_ELEMENTS) voltam a sortear índices,
+    em blocos de reamostragens como no teste de permutação.
+    
+    Args:
+        values (array): Valores da coluna (NaN são ignorados)
+        n_resamples (int): Número de reamostragens (B)
+        confidence (float): Nível de confiança
+        rng (Generator, optional): Gerador aleatório (padrão: semente fixa)
+    
+    Returns:
+        dict: Estimativas e limites 'ic_<estatistica>_inf' / 'ic_<estatistica>_sup'
+    """
+    rng = np.random.default_rng(DEFAULT_SEED) if rng is None else rng
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n < 2:
+        return {'n_respostas': n}
+    
+    distinct, counts = np.unique(values, return_counts=True)
+    if len(distinct) * n_resamples > MAX_BLOCK_ELEMENTS:
+        means, medians, stds = _bootstrap_by_indices(values, n_resamples, rng)
+    else:
+        resampled = rng.multinomial(n, counts / n, size=n_resamples)
+        
+        sums = resampled @ distinct
+        means = sums / n
+        variances = (resampled @ distinct ** 2 - n * means ** 2) / (n - 1)
+        stds = np.sqrt(np.maximum(variances, 0.0))
+        medians = _quantile_from_counts(distinct, np.cumsum(resampled, axis=1), n, 0.5)
+    
+    tail = (1 - confidence) / 2 * 100
+    result = {
+        'n_respostas': n,
+        'media': float(values.mean()),
+        'mediana': float(np.median(values)),
+        'desvio_padrao': float(values.std(ddof=1))
+    }
+    for name, samples in (('media', means), ('mediana', medians), ('desvio', stds)):
+        low, high = np.percentile(samples, [tail, 100 - tail])
+        result[f'ic_{name}_inf'] = float(low)
+        result[f'ic_{name}_sup'] = float(high)
+    return result
+
+
+@profiled('reamostragem.bootstrap')
+def bootstrap_intervals(frame, n_resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE, seed=DEFAULT_SEED):
+    """
+    Intervalos bootstrap de todas as colunas de um DataFrame numérico
+    
+    Args:
+        frame (DataFrame): Colunas numéricas (ex: `encoded_numeric_frame()` do analisador)
+        n_resamples (int): Número de reamostragens por coluna
+        confidence (float): Nível de confiança
+        seed (int): Semente do gerador aleatório
+    
+    Returns:
+        DataFrame: Uma linha por coluna com as estimativas e os limites dos intervalos
+    """
+    rng = np.random.default_rng(seed)
+    rows = {
+        column: bootstrap_column(frame[column].to_numpy(dtype=float, na_value=np.nan), n_resamples, confidence, rng)
+        for column in frame.columns
+    }
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def _random_permutation_tables(x_counts, y_counts, n_resamples, rng):
+    """
+    Tabelas de contingência de permutações aleatórias, com margens fixas
+    
+    Permutar y em relação a x só altera quantas vezes cada par (valor de x,
+    valor de y) aparece. As tabelas são sorteadas célula a célula por
+    hipergeométricas condicionais, vetorizadas sobre as B reamostragens.
+    
+    Returns:
+        ndarray: Tabelas B x Kx x Ky
+    """
+    remaining = np.tile(x_counts, (n_resamples, 1))
+    tables = np.zeros((n_resamples, len(x_counts), len(y_counts)), dtype=np.int64)
+    
+    for b, needed in enumerate(y_counts[:-1]):
+        left = np.full(n_resamples, needed)
+        for a in range(len(x_counts) - 1):
+            draw = rng.hypergeometric(remaining[:, a], remaining[:, a + 1:].sum(axis=1), left)
+            tables[:, a, b] = draw
+            remaining[:, a] -= draw
+            left -= draw
+        tables[:, -1, b] = left
+        remaining[:, -1] -= left
+    
+    tables[:, :, -1] = remaining
+    return tables
+
+
+@profiled('reamostragem.permutacao')
+def permutation_test_correlation(x, y, n_resamples=DEFAULT_RESAMPLES, seed=DEFAULT_SEED):
+    """
+    P-valor bilateral da correlação de Pearson por teste de permutação
+    
+    As permutações de y são geradas como uma matriz de índices (em blocos,
+    para limitar a memória) e todas as correlações de um bloco saem de um
+    único produto matriz-vetor. Em arquivos grandes com poucos valores
+    distintos (escalas e faixas), as permutações são sorteadas diretamente
+    como tabelas de contingência, com custo independente do número de respostas.
+    
+    Args:
+        x, y (array): Pares completos (sem NaN), de mesmo tamanho
+        n_resamples (int): Número de permutações
+        seed (int): Semente do gerador aleatório
+    
+    Returns:
+        float: P-valor, com correção (k + 1) / (B + 1) para nunca ser zero
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n < 3 or x.std() == 0 or y.std() == 0:
+        return np.nan
+    
+    x_std = (x - x.mean()) / x.std()
+    y_std = (y - y.mean()) / y.std()
+    observed = abs(x_std @ y_std) / n
+    # Tolerância numérica para empates com o valor observado
+    threshold = observed - 1e-12
+    
+    rng = np.random.default_rng(seed)
+    x_values, x_codes = np.unique(x_std, return_inverse=True)
+    y_values, y_codes = np.unique(y_std, return_inverse=True)
+    use_tables = (
+        n * n_resamples > MAX_INDEX_ELEMENTS
+        and len(x_values) * len(y_values) <= MAX_PERMUTATION_CELLS
+    )
+    
+    if use_tables:
+        tables = _random_permutation_tables(
+            np.bincount(x_codes), np.bincount(y_codes), n_resamples, rng
+        )
+        permuted = np.abs(np.einsum('a,bac,c->b', x_values, tables, y_values)) / n
+        extreme = int((permuted >= threshold).sum())
+    else:
+        block = max(1, MAX_BLOCK_ELEMENTS // n)
+        extreme = 0
+        for start in range(0, n_resamples, block):
+            size = min(block, n_resamples - start)
+            indices = rng.permuted(np.broadcast_to(np.arange(n), (size, n)), axis=1)
+            permuted = np.abs(y_std[indices] @ x_std) / n
+            extreme += int((permuted >= threshold).sum())
+    
+    return (extreme + 1) / (n_resamples + 1)
@@ -0,0 +1,313 @@
+"""
+Catálogo das perguntas da pesquisa e resolução de colunas por chave canônica
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+import pandas as pd
+
+
+# Chave canônica -> definição da pergunta
+#   texto: cabeçalho atual do formulário
+#   tipo: 'likert' (escala 1-5), 'numerico', 'faixa' (resposta em faixas) ou 'categorico'
+#   aliases: outros cabeçalhos já usados para a mesma pergunta
+#   palavras_chave: grupos de palavras que, todas presentes, identificam a pergunta
+#   excluir: palavras que impedem a identificação por palavras-chave
+#   pontos_medios: valor numérico de cada faixa (apenas tipo 'faixa')
+QUESTION_CATALOG = {
+    'organizacao_de': {
+        'texto': 'O quão organizada você considera a DE?',
+        'tipo': 'likert',
+    },
+    'acessibilidade_diretor': {
+        'texto': 'O quão acessível é o seu/sua diretor(a)?',
+        'tipo': 'likert',
+    },
+    'comunicacao_interna': {
+        'texto': 'Quão bem os integrantes de sua diretoria se comunicam entre si?',
+        'tipo': 'likert',
+    },
+    'relacao_outras_diretorias': {
+        'texto': 'Quanto você se relaciona com membros de outras diretorias?',
+        'tipo': 'likert',
+    },
+    'delegacao_tarefas': {
+        'texto': 'O quão satisfatória é a delegação de tarefas na sua diretoria?',
+        'tipo': 'likert',
+    },
+    'preparo_tarefas_diretoria': {
+        'texto': 'O quão você se sente preparado para realizar as suas tarefas de diretoria?',
+        'tipo': 'likert',
+    },
+    'compartilhamento_responsabilidades': {
+        'texto': 'Quão bem os integrantes da sua diretoria compartilham as responsabilidades pelas tarefas?',
+        'tipo': 'likert',
+    },
+    'preparacao_feedback': {
+        'texto': 'O quanto você se sente preparado(a) para conceder feedback para os membros da sua equipe?',
+        'tipo': 'likert',
+    },
+    'frequencia_feedback_dado': {
+        'texto': 'O quanto você concede feedback para os membros da sua equipe?',
+        'tipo': 'likert',
+    },
+    'escuta_assessores': {
+        'texto': 'Com que frequência seu/sua diretor(a) ouve seus assessores para tomar decisões?',
+        'tipo': 'likert',
+    },
+    'frequencia_feedback_recebido': {
+        'texto': 'Com que frequência você recebe feedback de seu/sua diretor(a)?',
+        'tipo': 'likert',
+    },
+    'satisfacao_gerente': {
+        'texto': 'De forma geral, o quanto você está satisfeito(a) com seu/sua gerente?',
+        'tipo': 'likert',
+    },
+    'satisfacao_equipe_projeto': {
+        'texto': 'O quão satisfeito(a) você está com a atuação da sua equipe no(s) projeto(s) que você participa?',
+        'tipo': 'likert',
+    },
+    'desempenho_projeto': {
+        'texto': 'O quão satisfeito(a) você está com o seu desempenho nas tarefas de projeto?',
+        'tipo': 'likert',
+    },
+    'relevancia_plantoes': {
+        'texto': 'O quanto você acha os plantões relevantes para a realização de um projeto?',
+        'tipo': 'likert',
+    },
+    'organizacao_salinha': {
+        'texto': 'Quão organizada é a nossa salinha?',
+        'tipo': 'likert',
+    },
+    'importancia_eventos': {
+        'texto': 'O quanto você acha importante participar dos eventos da empresa? (RG\'s, reuniões, p{IN}zza...)',
+        'tipo': 'likert',
+    },
+    'sentimento_ouvido': {
+        'texto': 'O quanto você se sente ouvido(a) dentro da empresa?',
+        'tipo': 'likert',
+    },
+    'satisfacao_geral': {
+        'texto': 'O quão satisfeito(a) você está com a IN Junior?',
+        'tipo': 'likert',
+        'palavras_chave': [['satisfeito', 'in junior']],
+    },
+    'carga_horaria_estagio': {
+        'texto': 'Qual a carga horária diária do seu estágio/trabalho?',
+        'tipo': 'numerico',
+        'palavras_chave': [['carga horaria', 'estagio'], ['carga horaria', 'trabalho']],
+    },
+    'horas_semanais_diretoria': {
+        'texto': 'Quantas horas por semana você gasta com tarefas de diretoria?',
+        'tipo': 'faixa',
+        'aliases': [
+            'Horas diretoria',
+            'Horas por semana - diretoria',
+            'Quantas horas você dedica semanalmente às tarefas de diretoria?'
+        ],
+        'palavras_chave': [['hora', 'diretoria']],
+        'pontos_medios': {
+            '1 a 5 horas': 3,
+            '6 a 10 horas': 8,
+            '11 a 15 horas': 13,
+            'Mais de 15 horas': 18
+        },
+    },
+    'horas_semanais_projeto': {
+        'texto': 'Quantas horas semanalmente você gasta com tarefas de projeto?',
+        'tipo': 'faixa',
+        'aliases': [
+            'Horas projeto',
+            'Horas por semana - projeto',
+            'Quantas horas você dedica semanalmente aos projetos?'
+        ],
+        'palavras_chave': [['hora', 'projeto']],
+        'pontos_medios': {
+            '1 a 5 horas': 3,
+            '6 a 10 horas': 8,
+            '11 a 15 horas': 13,
+            'Mais de 10 horas': 15,
+            'Mais de 15 horas': 18
+        },
+    },
+    'projetos_simultaneos': {
+        'texto': 'Quantos projetos você está realizando na IN Junior atualmente?',
+        'tipo': 'faixa',
+        'aliases': [
+            'Número de projetos',
+            'Projetos atuais',
+            'Quantos projetos você está realizando atualmente?'
+        ],
+        'palavras_chave': [['projeto', 'quantos'], ['projeto', 'numero'], ['projeto', 'atual'], ['projeto', 'junior']],
+        'excluir': ['hora', 'satisfeito'],
+        'pontos_medios': {
+            'Nenhum': 0,
+            'Um': 1,
+            'Dois': 2,
+            'Três': 3,
+            'Mais de três': 4
+        },
+    },
+    'diretoria': {
+        'texto': 'Qual a sua diretoria?',
+        'tipo': 'categorico',
+        'aliases': ['Diretoria', 'Em qual diretoria você está?', 'De qual diretoria você faz parte?'],
+    },
+}
+
+
+def normalize_header(text):
+    """
+    Normaliza um cabeçalho para comparação
+
+    Remove acentos, ignora maiúsculas/minúsculas, troca pontuação por espaço e
+    colapsa espaços repetidos.
+
+    Args:
+        text: Cabeçalho original
+
+    Returns:
+        str: Cabeçalho normalizado (ex: 'O quão organizada...?' -> 'o quao organizada ...')
+    """
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r'[^0-9a-z]+', ' ', text.lower())
+    return text.strip()
+
+
+def _build_alias_index(catalog):
+    """Monta o índice cabeçalho normalizado -> chave canônica"""
+    index = {}
+    for key, question in catalog.items():
+        for header in [question['texto']] + list(question.get('aliases', [])):
+            index.setdefault(normalize_header(header), key)
+    return index
+
+
+_ALIAS_INDEX = _build_alias_index(QUESTION_CATALOG)
+
+
+def register_question(key, texto, tipo, aliases=None, palavras_chave=None, excluir=None, pontos_medios=None):
+    """
+    Registra (ou substitui) uma pergunta no catálogo
+
+    Args:
+        key (str): Chave canônica
+        texto (str): Cabeçalho atual da pergunta
+        tipo (str): 'likert', 'numerico', 'faixa' ou 'categorico'
+        aliases (list, optional): Outros cabeçalhos conhecidos
+        palavras_chave (list, optional): Grupos de palavras que identificam a pergunta
+        excluir (list, optional): Palavras que impedem a identificação por palavras-chave
+        pontos_medios (dict, optional): Valor numérico de cada faixa
+    """
+    global _ALIAS_INDEX
+
+    question = {'texto': texto, 'tipo': tipo}
+    if aliases:
+        question['aliases'] = list(aliases)
+    if palavras_chave:
+        question['palavras_chave'] = [list(group) for group in palavras_chave]
+    if excluir:
+        question['excluir'] = list(excluir)
+    if pontos_medios:
+        question['pontos_medios'] = dict(pontos_medios)
+
+    QUESTION_CATALOG[key] = question
+    _ALIAS_INDEX = _build_alias_index(QUESTION_CATALOG)
+    get_schema_resolver.cache_clear()
+
+
+class SchemaResolver:
+    """
+    Índice pré-compilado chave canônica -> coluna real do DataFrame
+
+    A resolução é feita uma única vez por conjunto de colunas: primeiro por
+    cabeçalho normalizado (texto ou alias) e, para perguntas ainda não
+    encontradas, por palavras-chave. Depois disso toda consulta é O(1).
+    """
+
+    def __init__(self, columns, catalog=None):
+        """
+        Args:
+            columns: Colunas do DataFrame da pesquisa
+            catalog (dict, optional): Catálogo de perguntas (padrão: QUESTION_CATALOG)
+        """
+        self.catalog = QUESTION_CATALOG if catalog is None else catalog
+        alias_index = _ALIAS_INDEX if catalog is None else _build_alias_index(catalog)
+
+        self._columns = {}
+        self._methods = {}
+        normalized = [(col, normalize_header(col)) for col in columns]
+
+        # 1) Cabeçalho normalizado idêntico ao texto ou a um alias
+        for col, norm in normalized:
+            key = alias_index.get(norm)
+            if key is not None and key not in self._columns:
+                self._columns[key] = col
+                self._methods[key] = 'exata' if col == self.catalog[key]['texto'] else 'alias'
+
+        # 2) Palavras-chave, apenas entre as colunas ainda não associadas
+        claimed = set(self._columns.values())
+        for key, question in self.catalog.items():
+            if key in self._columns or not question.get('palavras_chave'):
+                continue
+            for col, norm in normalized:
+                if col in claimed or any(word in norm for word in question.get('excluir', [])):
+                    continue
+                if any(all(word in norm for word in group) for group in question['palavras_chave']):
+                    self._columns[key] = col
+                    self._methods[key] = 'palavras-chave'
+                    claimed.add(col)
+                    break
+
+        self._keys_by_column = {col: key for key, col in self._columns.items()}
+        self.unmatched_columns = [col for col, _ in normalized if col not in self._keys_by_column]
+
+    def column(self, key):
+        """Retorna a coluna real da chave canônica (ou None se a pergunta não existe no arquivo)"""
+        return self._columns.get(key)
+
+    def key(self, column):
+        """Retorna a chave canônica de uma coluna real (ou None)"""
+        return self._keys_by_column.get(column)
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def columns_of_type(self, *tipos):
+        """Retorna {chave: coluna} das perguntas encontradas dos tipos informados"""
+        return {
+            key: col for key, col in self._columns.items()
+            if self.catalog[key]['tipo'] in tipos
+        }
+
+    def match_report(self):
+        """
+        Relatório das associações feitas
+
+        Returns:
+            DataFrame: Chave canônica, coluna encontrada e método de associação
+                ('exata', 'alias' ou 'palavras-chave') de cada pergunta do catálogo
+        """
+        return pd.DataFrame([
+            {
+                'chave': key,
+                'tipo': question['tipo'],
+                'coluna': self._columns.get(key),
+                'metodo': self._methods.get(key, 'não encontrada')
+            }
+            for key, question in self.catalog.items()
+        ])
+
+
+@lru_cache(maxsize=32)
+def get_schema_resolver(columns):
+    """
+    Retorna o resolvedor (em cache) para um conjunto de colunas
+
+    Args:
+        columns (tuple): Colunas do DataFrame, como tupla
+    """
+    return SchemaResolver(columns)
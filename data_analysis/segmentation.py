@@ -0,0 +1,93 @@
+"""
+Métricas por segmento (diretoria, número de projetos, faixa de horas...) em um único group-by
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.profiling import profiled
+
+
+# Tamanho mínimo de um segmento (e de respostas por métrica) para exibir estatísticas
+DEFAULT_MIN_SEGMENT_SIZE = 5
+
+# Estatísticas calculadas por segmento e métrica (mesmos nomes do relatório)
+SEGMENT_STATISTICS = ['n_respostas', 'media', 'mediana', 'desvio_padrao', 'percentil_25', 'percentil_75']
+
+
+@profiled('segmentos.metricas')
+def segment_metrics(values, segments):
+    """
+    Calcula todas as métricas para todos os segmentos de uma vez
+    
+    Os valores são empilhados em formato longo (segmento, chave, valor) e
+    agregados por um único group-by sobre (segmento..., chave). Nenhuma
+    supressão é aplicada aqui (ver `suppress_small_segments`).
+    
+    Args:
+        values (DataFrame): Uma coluna numérica por métrica (chave canônica)
+        segments (DataFrame): Colunas de agrupamento, com o mesmo índice
+    
+    Returns:
+        DataFrame: Uma linha por (segmento, chave) com as colunas de
+            agrupamento, 'chave', 'n_segmento' e as SEGMENT_STATISTICS
+    """
+    group_names = list(segments.columns)
+    keys = list(values.columns)
+    columns = group_names + ['chave', 'n_segmento'] + SEGMENT_STATISTICS
+    if not keys or not group_names:
+        return pd.DataFrame(columns=columns)
+    
+    # Formato longo sem passar pelo melt: repete os códigos inteiros dos
+    # segmentos p vezes (sem copiar os textos das categorias)
+    n_rows = len(values)
+    long_format = pd.DataFrame(index=pd.RangeIndex(n_rows * len(keys)))
+    for name in group_names:
+        segment = segments[name]
+        if not isinstance(segment.dtype, pd.CategoricalDtype):
+            segment = segment.astype('category')
+        long_format[name] = pd.Categorical.from_codes(
+            np.tile(segment.cat.codes.to_numpy(), len(keys)), dtype=segment.dtype
+        )
+    long_format['chave'] = pd.Categorical.from_codes(np.repeat(np.arange(len(keys)), n_rows), categories=keys)
+    long_format['valor'] = values.to_numpy(dtype=float, na_value=np.nan).ravel(order='F')
+    
+    grouped = long_format.groupby(group_names + ['chave'], observed=True, sort=True)['valor']
+    stats = grouped.agg(['count', 'mean', 'median', 'std'])
+    quartiles = grouped.quantile([0.25, 0.75]).unstack()
+    
+    sizes = segments.groupby(group_names, observed=True, sort=True).size().rename('n_segmento')
+    
+    table = pd.DataFrame({
+        'n_respostas': stats['count'].astype(int),
+        'media': stats['mean'],
+        'mediana': stats['median'],
+        'desvio_padrao': stats['std'],
+        'percentil_25': quartiles[0.25],
+        'percentil_75': quartiles[0.75]
+    }).reset_index()
+    table = table.merge(sizes.reset_index(), on=group_names, how='left')
+    table[SEGMENT_STATISTICS[1:]] = table[SEGMENT_STATISTICS[1:]].round(2)
+    
+    return table[columns]
+
+
+def suppress_small_segments(table, min_n=DEFAULT_MIN_SEGMENT_SIZE):
+    """
+    Oculta as estatísticas de segmentos e métricas com poucas respostas
+    
+    Segmentos com menos de `min_n` respostas, ou métricas com menos de
+    `min_n` respostas dentro do segmento, ficam com as estatísticas em NaN
+    para não expor grupos pequenos nem induzir leituras de amostras minúsculas.
+    
+    Args:
+        table (DataFrame): Saída de `segment_metrics`
+        min_n (int): Tamanho mínimo para exibir estatísticas
+    
+    Returns:
+        DataFrame: Cópia da tabela com a coluna 'suprimido'
+    """
+    table = table.copy()
+    table['suprimido'] = (table['n_segmento'] < min_n) | (table['n_respostas'] < min_n)
+    table.loc[table['suprimido'], SEGMENT_STATISTICS[1:]] = np.nan
+    return table
@@ -0,0 +1,525 @@
+"""
+Ingestão em blocos (streaming) com agregadores online para arquivos muito grandes
+"""
+
+import numpy as np
+import pandas as pd
+
+from .correlation_engine import DEFAULT_ALPHA, correlation_tests, pearson_from_sums
+from .metric_registry import METRIC_GROUPS, registered_keys
+from .schema import QUESTION_CATALOG
+from .survey_analyzer import INJuniorSurveyAnalyzer, _plain_number
+
+
+# Linhas lidas por bloco no modo streaming
+DEFAULT_CHUNKSIZE = 50000
+
+# Colunas de carimbo de data/hora do formulário: quando presentes, identificam
+# a resposta no modo incremental no lugar do conteúdo da linha inteira
+TIMESTAMP_COLUMNS = ('Carimbo de data/hora', 'Timestamp', 'Data/hora')
+
+
+class OnlineMoments:
+    """Contagem, média, variância, mínimo e máximo atualizados bloco a bloco"""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+    
+    def update(self, values):
+        """
+        Incorpora um bloco de valores (já sem NaN)
+        
+        Usa a combinação de Chan et al. entre as estatísticas acumuladas e as
+        do bloco, o que é numericamente estável e não guarda os valores.
+        """
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        if n == 0:
+            return
+        
+        batch_mean = values.mean()
+        batch_m2 = ((values - batch_mean) ** 2).sum()
+        self.merge_stats(n, batch_mean, batch_m2, values.min(), values.max())
+    
+    def merge(self, other):
+        """Combina com outro acumulador (ex: de outro bloco ou processo)"""
+        if other.count:
+            self.merge_stats(other.count, other.mean, other.m2, other.minimum, other.maximum)
+    
+    def merge_stats(self, n, mean, m2, minimum, maximum):
+        """Combina estatísticas já resumidas (n, média, soma dos quadrados dos desvios)"""
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+    
+    @property
+    def std(self):
+        """Desvio padrão amostral (ddof=1), como o do pandas"""
+        if self.count < 2:
+            return np.nan
+        return float(np.sqrt(self.m2 / (self.count - 1)))
+
+
+class QuantileSketch:
+    """
+    Resumo de quantis com tamanho limitado
+    
+    Guarda pares (valor, peso) ordenados. Enquanto há no máximo `max_centroids`
+    valores distintos (sempre o caso em escalas Likert e faixas), o resumo é um
+    histograma exato e os quantis coincidem com os do pandas. Acima disso,
+    centróides vizinhos são fundidos e os quantis passam a ser aproximados.
+    """
+    
+    def __init__(self, max_centroids=256):
+        self.max_centroids = max_centroids
+        self.values = np.empty(0, dtype=float)
+        self.weights = np.empty(0, dtype=float)
+        self.exact = True
+    
+    def update(self, values):
+        """Incorpora um bloco de valores (já sem NaN)"""
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        unique, counts = np.unique(values, return_counts=True)
+        self._merge_centroids(unique, counts.astype(float))
+    
+    def merge(self, other):
+        """Combina com outro resumo"""
+        self.exact = self.exact and other.exact
+        self._merge_centroids(other.values, other.weights)
+    
+    def _merge_centroids(self, values, weights):
+        all_values = np.concatenate([self.values, values])
+        all_weights = np.concatenate([self.weights, weights])
+        unique, inverse = np.unique(all_values, return_inverse=True)
+        merged = np.bincount(inverse, weights=all_weights)
+        
+        if len(unique) > self.max_centroids:
+            # Agrupa em faixas de peso aproximadamente igual
+            self.exact = False
+            cumulative = np.cumsum(merged)
+            groups = np.minimum(
+                (cumulative - merged / 2) * self.max_centroids // cumulative[-1],
+                self.max_centroids - 1
+            ).astype(int)
+            group_weights = np.bincount(groups, weights=merged)
+            group_values = np.bincount(groups, weights=unique * merged)
+            keep = group_weights > 0
+            unique = group_values[keep] / group_weights[keep]
+            merged = group_weights[keep]
+        
+        self.values = unique
+        self.weights = merged
+    
+    def quantile(self, q):
+        """
+        Quantil com interpolação linear (mesma definição de `Series.quantile`)
+        
+        Args:
+            q (float): Quantil entre 0 e 1
+        """
+        total = self.weights.sum()
+        if total == 0:
+            return np.nan
+        
+        position = (total - 1) * q
+        cumulative = np.cumsum(self.weights)
+        lower = self.values[np.searchsorted(cumulative, np.floor(position), side='right')]
+        upper = self.values[np.searchsorted(cumulative, np.ceil(position), side='right')]
+        return float(lower + (upper - lower) * (position - np.floor(position)))
+    
+    def counts(self):
+        """Retorna o histograma (valor -> contagem) como Series"""
+        return pd.Series(self.weights.astype(int) if self.exact else self.weights, index=self.values)
+
+
+class NumericAccumulator:
+    """Momentos online + resumo de quantis de uma coluna numérica"""
+    
+    def __init__(self):
+        self.moments = OnlineMoments()
+        self.sketch = QuantileSketch()
+    
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.moments.update(values)
+        self.sketch.update(values)
+    
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+    
+    @property
+    def count(self):
+        return self.moments.count
+
+
+class PairwiseComoments:
+    """
+    Somas por par (n, Σx, Σx², Σxy) para a correlação de Pearson, acumuladas bloco a bloco
+    
+    São as mesmas somas de `correlation_engine.pairwise_pearson` (exclusão por
+    pares), que são aditivas entre blocos. Os valores são deslocados pela
+    média de cada coluna no primeiro bloco, o que evita o cancelamento
+    numérico nas somas de quadrados sem precisar revisitar linhas antigas.
+    """
+    
+    def __init__(self, columns):
+        """
+        Args:
+            columns (list): Colunas acompanhadas (chaves canônicas)
+        """
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.shift = None
+        self.n = np.zeros((size, size))
+        self.sum_x = np.zeros((size, size))
+        self.sum_xx = np.zeros((size, size))
+        self.sum_xy = np.zeros((size, size))
+    
+    def update(self, frame):
+        """
+        Incorpora um bloco de linhas
+        
+        Args:
+            frame (DataFrame): Colunas numéricas codificadas (as ausentes contam como NaN)
+        """
+        values = frame.reindex(columns=self.columns).to_numpy(dtype=float, na_value=np.nan)
+        present = ~np.isnan(values)
+        mask = present.astype(float)
+        
+        if self.shift is None:
+            counts = mask.sum(axis=0)
+            self.shift = np.divide(
+                np.where(present, values, 0.0).sum(axis=0), counts,
+                out=np.zeros(len(self.columns)), where=counts > 0
+            )
+        
+        centered = np.where(present, values - self.shift, 0.0)
+        self.n += mask.T @ mask
+        self.sum_x += centered.T @ mask
+        self.sum_xx += (centered ** 2).T @ mask
+        self.sum_xy += centered.T @ centered
+    
+    def correlation(self):
+        """Retorna (r, n) como em `pairwise_pearson`"""
+        return pearson_from_sums(self.n, self.sum_x, self.sum_xx, self.sum_xy)
+
+
+def row_fingerprints(frame):
+    """
+    Impressão digital (hash de 64 bits) de cada resposta bruta
+    
+    Se houver uma coluna de carimbo de data/hora (TIMESTAMP_COLUMNS), só ela
+    identifica a resposta: uma resposta editada mantém a impressão. Sem ela,
+    a linha inteira é usada; colunas numéricas são comparadas como float,
+    para que a mesma resposta tenha a mesma impressão mesmo quando o pandas
+    lê a coluna como inteiro em um arquivo e como float (por ter células
+    vazias) em outro.
+    
+    Args:
+        frame (DataFrame): Respostas brutas
+    
+    Returns:
+        ndarray: Um uint64 por linha
+    """
+    columns = [col for col in TIMESTAMP_COLUMNS if col in frame.columns][:1] or list(frame.columns)
+    normalized = {}
+    for col in columns:
+        series = frame[col]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            normalized[col] = series.astype('float64')
+        else:
+            normalized[col] = series.astype(object).where(series.notna(), None)
+    return pd.util.hash_pandas_object(pd.DataFrame(normalized), index=False).to_numpy()
+
+
+def _occurrence_ranks(fingerprints):
+    """Posição (1, 2, ...) de cada linha entre as linhas com a mesma impressão, na ordem do bloco"""
+    order = np.argsort(fingerprints, kind='stable')
+    ordered = fingerprints[order]
+    positions = np.arange(len(ordered))
+    starts = np.ones(len(ordered), dtype=bool)
+    starts[1:] = ordered[1:] != ordered[:-1]
+    group_start = np.maximum.accumulate(np.where(starts, positions, 0))
+    ranks = np.empty(len(ordered), dtype=np.int64)
+    ranks[order] = positions - group_start + 1
+    return ranks
+
+
+class FingerprintCounts:
+    """
+    Multiconjunto compacto de impressões digitais: arrays ordenados de
+    valores (uint64) e contagens (16 bytes por resposta distinta)
+    """
+    
+    def __init__(self):
+        self.values = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+    
+    def count_of(self, fingerprints):
+        """Quantas vezes cada impressão já foi vista"""
+        if len(self.values) == 0:
+            return np.zeros(len(fingerprints), dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.values, fingerprints), len(self.values) - 1)
+        return np.where(self.values[positions] == fingerprints, self.counts[positions], 0)
+    
+    def add(self, fingerprints):
+        """Soma uma ocorrência para cada impressão (com repetição)"""
+        if len(fingerprints) == 0:
+            return
+        values, inverse = np.unique(
+            np.concatenate([self.values, np.asarray(fingerprints, dtype=np.uint64)]), return_inverse=True
+        )
+        weights = np.concatenate([self.counts, np.ones(len(fingerprints), dtype=np.int64)])
+        self.values = values
+        self.counts = np.bincount(inverse, weights=weights, minlength=len(values)).astype(np.int64)
+    
+    def __len__(self):
+        return int(self.counts.sum())
+    
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.counts.nbytes
+
+
+class StreamingSurveyAnalyzer:
+    """
+    Analisador que processa a pesquisa em blocos, sem materializar o arquivo inteiro
+    
+    Cada bloco passa pela mesma limpeza do INJuniorSurveyAnalyzer e atualiza
+    acumuladores online. O relatório gerado tem a mesma estrutura do
+    `generate_summary_report`, mas sem as séries de dados brutos ('data',
+    'numeric_data').
+    
+    Os acumuladores são estatísticas suficientes (contagens, somas, somas de
+    quadrados, histogramas e somas por par para as correlações), então
+    respostas novas podem ser incorporadas com `append`/`append_csv` a um
+    custo proporcional apenas às linhas novas. Só nesse modo as impressões
+    digitais das respostas são guardadas; `from_csv`/`consume` mantêm a
+    memória limitada.
+    """
+    
+    def __init__(self):
+        self.total_respostas = 0
+        self.columns = None
+        self.n_chunks = 0
+        self.likert = {}
+        self.band_counts = {}
+        self.band_numeric = {}
+        self.band_columns = {}
+        self.comoments = None
+        # Impressões digitais das respostas incorporadas (só no modo incremental)
+        self.fingerprints = None
+    
+    @classmethod
+    def from_csv(cls, source, chunksize=DEFAULT_CHUNKSIZE, **read_csv_kwargs):
+        """
+        Lê um CSV em blocos e acumula as métricas
+        
+        Args:
+            source: Caminho ou objeto de arquivo do CSV
+            chunksize (int): Linhas por bloco
+            **read_csv_kwargs: Repassados ao `pd.read_csv`
+        
+        Returns:
+            StreamingSurveyAnalyzer: Analisador com todos os blocos consumidos
+        """
+        analyzer = cls()
+        with pd.read_csv(source, chunksize=chunksize, **read_csv_kwargs) as reader:
+            for chunk in reader:
+                analyzer.consume(chunk)
+        return analyzer
+    
+    def append(self, frame):
+        """
+        Incorpora apenas as respostas ainda não vistas
+        
+        As respostas são reconhecidas pela impressão digital
+        (`row_fingerprints`) contada com repetição: se o arquivo reenviado tem
+        k respostas com a mesma impressão e c já foram incorporadas, só as
+        k - c últimas são novas. Assim o arquivo completo pode ser reenviado e
+        respostas idênticas legítimas não são descartadas.
+        
+        Args:
+            frame (DataFrame): Respostas brutas (novas ou o arquivo inteiro)
+        
+        Returns:
+            int: Número de respostas novas incorporadas
+        """
+        return self._append_chunks([frame])
+    
+    def append_csv(self, source, chunksize=DEFAULT_CHUNKSIZE, **read_csv_kwargs):
+        """
+        Lê um CSV em blocos e incorpora apenas as respostas novas (ver `append`)
+        
+        Returns:
+            int: Número de respostas novas incorporadas
+        """
+        with pd.read_csv(source, chunksize=chunksize, **read_csv_kwargs) as reader:
+            return self._append_chunks(reader)
+    
+    def _append_chunks(self, chunks):
+        """Incorpora as respostas novas de um envio (um arquivo ou DataFrame, em blocos)"""
+        if self.fingerprints is None:
+            if self.total_respostas:
+                raise ValueError(
+                    "Este analisador consumiu blocos sem guardar as impressões das respostas; "
+                    "use append/append_csv desde o primeiro envio"
+                )
+            self.fingerprints = FingerprintCounts()
+        
+        # Ocorrências de cada impressão neste envio, comparadas com as já
+        # incorporadas antes dele (que só são atualizadas no final)
+        sent = FingerprintCounts()
+        added = []
+        for chunk in chunks:
+            fingerprints = row_fingerprints(chunk)
+            ranks = _occurrence_ranks(fingerprints) + sent.count_of(fingerprints)
+            new = ranks > self.fingerprints.count_of(fingerprints)
+            sent.add(fingerprints)
+            if new.any():
+                self.consume(chunk[new])
+                added.append(fingerprints[new])
+        
+        added = np.concatenate(added) if added else np.empty(0, dtype=np.uint64)
+        self.fingerprints.add(added)
+        return len(added)
+    
+    def consume(self, chunk):
+        """
+        Processa um bloco de linhas e atualiza os acumuladores
+        
+        Args:
+            chunk (DataFrame): Bloco de respostas brutas
+        """
+        processed = INJuniorSurveyAnalyzer(chunk, keep_raw=False)
+        df = processed.df_processed
+        schema = processed.schema
+        
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        self.total_respostas += len(df)
+        self.n_chunks += 1
+        
+        encoded = processed.encoded_numeric_frame()
+        if self.comoments is None:
+            self.comoments = PairwiseComoments(encoded.columns)
+        self.comoments.update(encoded)
+        
+        for key in registered_keys():
+            col = schema.column(key)
+            if col is not None and pd.api.types.is_numeric_dtype(df[col]):
+                values = df[col].to_numpy(dtype=float, na_value=np.nan)
+                self.likert.setdefault(key, NumericAccumulator()).update(values)
+        
+        for key, col in processed.band_columns.items():
+            self.band_columns[key] = col
+            counts = df[col].value_counts()
+            counts = counts[counts > 0]
+            totals = self.band_counts.setdefault(key, {})
+            for label, count in counts.items():
+                totals[label] = totals.get(label, 0) + int(count)
+            self.band_numeric.setdefault(key, NumericAccumulator()).update(
+                processed.band_to_numeric(df[col]).to_numpy()
+            )
+    
+    def _likert_metric(self, key):
+        accumulator = self.likert.get(key)
+        if accumulator is None or accumulator.count == 0:
+            return None
+        
+        moments, sketch = accumulator.moments, accumulator.sketch
+        return {
+            'n_respostas': moments.count,
+            'media': round(moments.mean, 2),
+            'mediana': round(sketch.quantile(0.5), 2),
+            'desvio_padrao': round(moments.std, 2),
+            'percentil_75': round(sketch.quantile(0.75), 2),
+            'percentil_25': round(sketch.quantile(0.25), 2),
+            'histograma': sketch.counts(),
+        }
+    
+    def _workload_metric(self, key):
+        counts = self.band_counts.get(key)
+        if not counts:
+            return None
+        
+        value_counts = pd.Series(counts, name='count').sort_values(ascending=False)
+        value_counts.index.name = self.band_columns[key]
+        metric = {
+            'n_respostas': int(value_counts.sum()),
+            'coluna_encontrada': self.band_columns[key],
+            'value_counts': value_counts,
+            'categorias': list(value_counts.index),
+            'tipo_dados': 'categorico'
+        }
+        
+        accumulator = self.band_numeric[key]
+        if accumulator.count > 0:
+            moments, sketch = accumulator.moments, accumulator.sketch
+            metric.update({
+                'media': round(moments.mean, 2),
+                'mediana': round(sketch.quantile(0.5), 2),
+                'desvio_padrao': round(moments.std, 2),
+                'maximo': _plain_number(moments.maximum),
+                'minimo': _plain_number(moments.minimum),
+                'tipo_dados': 'categorico_com_numerico'
+            })
+        return metric
+    
+    def generate_summary_report(self):
+        """Gera o relatório resumo a partir dos acumuladores"""
+        report = {
+            'info_geral': {
+                'total_respostas': self.total_respostas,
+                'colunas_analisadas': len(self.columns or [])
+            },
+            'carga_trabalho': {}
+        }
+        
+        for key, question in QUESTION_CATALOG.items():
+            if question['tipo'] == 'faixa':
+                metric = self._workload_metric(key)
+                if metric is not None:
+                    report['carga_trabalho'][key] = metric
+        
+        for group, keys in METRIC_GROUPS.items():
+            report[group] = {}
+            for key in keys:
+                metric = self._likert_metric(key)
+                if metric is not None:
+                    report[group][key] = metric
+        
+        return report
+    
+    def correlations(self, alpha=DEFAULT_ALPHA):
+        """
+        Correlações de Pearson entre as perguntas numéricas/ordinais, a partir das somas por par
+        
+        Coincidem com o 'pearson' de `INJuniorSurveyAnalyzer.analyze_correlations`
+        (Spearman depende dos postos de todas as linhas e não é acumulado).
+        
+        Returns:
+            dict: 'colunas', 'n' e 'pearson' (mesmo formato de `correlation_matrix`),
+                ou None antes do primeiro bloco
+        """
+        if self.comoments is None:
+            return None
+        columns = self.comoments.columns
+        r, n = self.comoments.correlation()
+        return {
+            'colunas': columns,
+            'n': pd.DataFrame(n, index=columns, columns=columns),
+            'pearson': correlation_tests(r, n, columns, alpha)
+        }
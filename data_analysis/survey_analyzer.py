@@ -2,188 +2,423 @@
 Classe para análise dos dados da pesquisa de satisfação da IN Junior
 """
 
+import contextlib
+import hashlib
+import tracemalloc
+from functools import partial
+
 import pandas as pd
 import numpy as np
 
+from .analysis_results import AnalysisResults
+from .bitmap_index import COMBINE_ALL, BitmapIndex, filter_signature
+from .contingency import MAX_CATEGORIES, association_matrix, category_codes
+from .correlation_engine import correlation_matrix
+from .resampling import bootstrap_intervals
+from .segmentation import DEFAULT_MIN_SEGMENT_SIZE, segment_metrics, suppress_small_segments
+from .metric_registry import METRIC_GROUPS, aggregate_likert, aggregate_likert_counts, registered_keys
+from .metric_results import MetricResult, band_numeric_data, column_data
+from .schema import QUESTION_CATALOG, get_schema_resolver
+from utils.profiling import profiled
+
+
+# pandas 3 já usa copy-on-write por padrão; no 2.x ele é ativado só durante
+# a limpeza (ver `_copy_on_write`), sem alterar a opção global de quem importa o módulo
+PANDAS_COPY_ON_WRITE_DEFAULT = int(pd.__version__.split('.')[0]) >= 3
+
+
+# Número de linhas convertidas por vez na conversão numérica em lote
+COERCE_CHUNK_ROWS = 16384
+
+
+def _copy_on_write():
+    """
+    Contexto em que df_processed pode compartilhar memória com o DataFrame original
+    
+    No pandas 2.x ativa `mode.copy_on_write` apenas dentro do bloco; no 3.x
+    não faz nada.
+    """
+    if PANDAS_COPY_ON_WRITE_DEFAULT:
+        return contextlib.nullcontext()
+    return pd.option_context('mode.copy_on_write', True)
+
+
+def _compact_numeric(series):
+    """
+    Reduz o tipo de uma coluna numérica já convertida
+    
+    Colunas só com inteiros (ex: escalas Likert 1-5) viram o menor inteiro
+    anulável que comporta os valores (Int8 na prática); as demais continuam float.
+    """
+    valid = series.dropna()
+    if len(valid) == 0 or not (valid % 1 == 0).all():
+        return series
+    
+    for dtype, info in (('Int8', np.iinfo(np.int8)), ('Int16', np.iinfo(np.int16)), ('Int32', np.iinfo(np.int32))):
+        if valid.min() >= info.min and valid.max() <= info.max:
+            return series.astype(dtype)
+    return series
+
+
+def _coerce_numeric_columns(frame, columns):
+    """
+    Converte várias colunas para numérico em uma única passada vetorizada
+    
+    Colunas que já são numéricas só são compactadas; as demais são achatadas
+    em um único array e convertidas por uma só chamada a `pd.to_numeric`.
+    
+    Args:
+        frame (DataFrame): Dados de entrada
+        columns (list): Colunas a converter
+    
+    Returns:
+        DataFrame: Colunas convertidas e compactadas, com o mesmo índice de `frame`
+    """
+    converted = {}
+    pending = []
+    for col in columns:
+        if pd.api.types.is_numeric_dtype(frame[col]) and not pd.api.types.is_bool_dtype(frame[col]):
+            converted[col] = frame[col]
+        else:
+            pending.append(col)
+    
+    if pending:
+        # Blocos de linhas limitam a memória temporária do `pd.to_numeric`
+        # (que cria objetos intermediários) sem repassar os dados mais de uma vez
+        block = np.empty((len(frame), len(pending)), dtype=float)
+        for start in range(0, len(frame), COERCE_CHUNK_ROWS):
+            stop = start + COERCE_CHUNK_ROWS
+            raw = frame[pending].iloc[start:stop].to_numpy(dtype=object).ravel()
+            numeric = pd.to_numeric(raw, errors='coerce')
+            block[start:stop] = np.asarray(numeric, dtype=float).reshape((-1, len(pending)))
+        for i, col in enumerate(pending):
+            converted[col] = pd.Series(block[:, i], index=frame.index, name=col)
+    
+    return pd.DataFrame({col: _compact_numeric(converted[col]) for col in columns}, index=frame.index)
+
+
+def _to_ordered_bands(series, mapping):
+    """
+    Converte respostas de faixa (ex: '1 a 5 horas') em categoria ordenada
+    
+    As categorias seguem a ordem dos pontos médios do mapeamento; respostas
+    fora do mapeamento são mantidas como categorias extras no final.
+    """
+    known = sorted(mapping, key=mapping.get)
+    extras = sorted(set(series.dropna().astype(str)) - set(known))
+    return series.astype(pd.CategoricalDtype(known + extras, ordered=True))
+
+
+def _plain_number(value):
+    """Converte floats inteiros (ex: 18.0) em int, mantendo os demais valores"""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return int(value)
+    return value
+
+
+def measure_ingest_memory(df, **kwargs):
+    """
+    Mede o pico de memória alocada durante o processamento de um DataFrame
+    
+    Args:
+        df (DataFrame): Dados brutos já carregados
+        **kwargs: Repassados ao INJuniorSurveyAnalyzer
+    
+    Returns:
+        dict: Tamanho dos dados, pico de alocação extra e razão pico/dados
+    """
+    data_bytes = int(df.memory_usage(deep=True).sum())
+    
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        analyzer = INJuniorSurveyAnalyzer(df, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    
+    extra_bytes = max(peak - baseline, 0)
+    return {
+        'dados_bytes': data_bytes,
+        'pico_extra_bytes': extra_bytes,
+        'razao_pico': round((data_bytes + extra_bytes) / data_bytes, 2) if data_bytes else None,
+        'processado_bytes': analyzer.memory_report()['processado_bytes']
+    }
+
 
 class INJuniorSurveyAnalyzer:
     """Classe para análise dos dados da pesquisa de satisfação da IN Junior"""
     
-    def __init__(self, df):
+    def __init__(self, df, keep_raw=True):
         """
         Inicializa o analisador com um DataFrame
         
         Args:
             df (DataFrame): DataFrame com os dados da pesquisa
+            keep_raw (bool): Se False, descarta a referência aos dados originais
+                após o processamento (self.df fica None)
         """
-        self.df = df.copy()
-        self.df_processed = None
-        self._clean_and_process_data()
+        self.df = df
+        self.data_version = 0
+        self._df_processed = None
+        self._dataset_key = None
+        self.results = AnalysisResults(self)
+        self._register_results()
+        with _copy_on_write():
+            self._clean_and_process_data()
         
-    def _clean_and_process_data(self):
-        """Limpa e processa os dados iniciais"""
-        self.df_processed = self.df.copy()
-        
-        # Remove linhas completamente vazias
-        self.df_processed = self.df_processed.dropna(how='all')
-        
-        # Converte colunas numéricas (escalas de 1-5, etc.) - EXCETO as de workload
-        numeric_columns = [
-            'O quão organizada você considera a DE?',
-            'O quão acessível é o seu/sua diretor(a)?',
-            'Quão bem os integrantes de sua diretoria se comunicam entre si?',
-            'Quanto você se relaciona com membros de outras diretorias?',
-            'O quão satisfatória é a delegação de tarefas na sua diretoria?',
-            'O quão você se sente preparado para realizar as suas tarefas de diretoria?',
-            'Quão bem os integrantes da sua diretoria compartilham as responsabilidades pelas tarefas?',
-            # 'Quantas horas por semana você gasta com tarefas de diretoria?',  # Mantém como string
-            'O quanto você se sente preparado(a) para conceder feedback para os membros da sua equipe?',
-            'O quanto você concede feedback para os membros da sua equipe?',
-            'Com que frequência seu/sua diretor(a) ouve seus assessores para tomar decisões?',
-            'Com que frequência você recebe feedback de seu/sua diretor(a)?',
-            'De forma geral, o quanto você está satisfeito(a) com seu/sua gerente?',
-            # 'Quantos projetos você está realizando na IN Junior atualmente?',  # Mantém como string
-            # 'Quantas horas semanalmente você gasta com tarefas de projeto?',  # Mantém como string
-            'O quão satisfeito(a) você está com a atuação da sua equipe no(s) projeto(s) que você participa?',
-            'O quão satisfeito(a) você está com o seu desempenho nas tarefas de projeto?',
-            'O quanto você acha os plantões relevantes para a realização de um projeto?',
-            'Quão organizada é a nossa salinha?',
-            'O quanto você acha importante participar dos eventos da empresa? (RG\'s, reuniões, p{IN}zza...)',
-            'O quanto você se sente ouvido(a) dentro da empresa?',
-            'O quão satisfeito(a) você está com a IN Junior?',
-            'Qual a carga horária diária do seu estágio/trabalho?'
-        ]
+        if not keep_raw:
+            self.df = None
+    
+    @classmethod
+    def from_processed(cls, df_processed):
+        """
+        Cria o analisador a partir de dados já limpos por `_clean_and_process_data`
         
-        # Converte para numérico, colocando NaN para valores inválidos
-        for col in numeric_columns:
-            if col in self.df_processed.columns:
-                self.df_processed[col] = pd.to_numeric(self.df_processed[col], errors='coerce')
+        Usado ao recarregar dados processados de um cache (ex: arquivo Arrow),
+        sem repetir a limpeza. Os pontos médios das faixas são lidos de
+        `df_processed.attrs['band_midpoints']`.
+        
+        Args:
+            df_processed (DataFrame): Dados processados
+        
+        Returns:
+            INJuniorSurveyAnalyzer: Analisador sem os dados originais (df é None)
+        """
+        analyzer = cls.__new__(cls)
+        analyzer.df = None
+        analyzer.data_version = 0
+        analyzer._df_processed = None
+        analyzer._dataset_key = None
+        analyzer.results = AnalysisResults(analyzer)
+        analyzer._register_results()
+        
+        analyzer.df_processed = df_processed
+        analyzer.schema = get_schema_resolver(tuple(df_processed.columns))
+        band_midpoints = df_processed.attrs.setdefault('band_midpoints', {})
+        analyzer.band_columns = {
+            key: col for key, col in analyzer.schema.columns_of_type('faixa').items()
+            if col in band_midpoints
+        }
+        return analyzer
     
-    def calculate_satisfaction_metrics(self):
-        """Calcula métricas de satisfação geral"""
-        metrics = {}
+    @property
+    def df_processed(self):
+        """DataFrame processado; atribuir um novo valor invalida os resultados em cache"""
+        return self._df_processed
+    
+    @df_processed.setter
+    def df_processed(self, value):
+        self._df_processed = value
+        self.data_version += 1
+    
+    @property
+    def dataset_key(self):
+        """
+        Identificador do conteúdo de df_processed, usado em caches externos (ex: figuras)
         
-        satisfaction_col = 'O quão satisfeito(a) você está com a IN Junior?'
-        if satisfaction_col in self.df_processed.columns:
-            valid_responses = self.df_processed[satisfaction_col].dropna()
-            if len(valid_responses) > 0:
-                metrics['satisfacao_geral'] = {
-                    'n_respostas': len(valid_responses),
-                    'data': valid_responses
-                }
-                
-                # Tenta calcular estatísticas se os dados são numéricos
-                try:
-                    numeric_responses = pd.to_numeric(valid_responses, errors='coerce').dropna()
-                    if len(numeric_responses) > 0:
-                        metrics['satisfacao_geral'].update({
-                            'media': round(numeric_responses.mean(), 2),
-                            'mediana': round(numeric_responses.median(), 2),
-                            'desvio_padrao': round(numeric_responses.std(), 2),
-                            'percentil_75': round(numeric_responses.quantile(0.75), 2),
-                            'percentil_25': round(numeric_responses.quantile(0.25), 2),
-                        })
-                    else:
-                        # Se não é numérico, apenas value_counts
-                        metrics['satisfacao_geral']['value_counts'] = valid_responses.value_counts()
-                except Exception as e:
-                    # Fallback para dados categóricos
-                    metrics['satisfacao_geral']['value_counts'] = valid_responses.value_counts()
+        Se não foi definido (ex: pelo hash do arquivo enviado), é calculado uma
+        vez a partir do hash das linhas. Vale apenas para a versão atual dos dados.
+        """
+        if self._dataset_key is None or self._dataset_key[0] != self.data_version:
+            row_hashes = pd.util.hash_pandas_object(self.df_processed, index=True).to_numpy()
+            digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+            digest.update('\x1f'.join(map(str, self.df_processed.columns)).encode())
+            self._dataset_key = (self.data_version, digest.hexdigest())
+        return self._dataset_key[1]
+    
+    @dataset_key.setter
+    def dataset_key(self, value):
+        self._dataset_key = (self.data_version, value)
+    
+    def invalidate_results(self):
+        """Invalida os resultados em cache após alterações in-place em df_processed"""
+        self.data_version += 1
+    
+    def _register_results(self):
+        """Registra os resultados memoizados compartilhados por relatório e gráficos"""
+        self.results.register('estatisticas_likert', self._compute_likert_statistics)
+        for group in METRIC_GROUPS:
+            self.results.register(group, partial(self._compute_metric_group, group))
+        self.results.register('carga_trabalho', self._compute_workload_distribution)
+        self.results.register('relatorio', self._build_summary_report)
+        self.results.register('dados_codificados', self._compute_encoded_frame)
+        self.results.register('correlacoes', self._compute_correlations)
+        self.results.register('codigos_categoricos', self._compute_categorical_codes)
+        self.results.register('associacoes', self._compute_associations)
+        self.results.register('indice_bitmap', self._compute_bitmap_index)
+        self.results.register('intervalos_confianca', self._compute_confidence_intervals)
         
-        return metrics
+    @profiled('analyzer.limpeza')
+    def _clean_and_process_data(self):
+        """
+        Limpa e processa os dados iniciais
+        
+        Com copy-on-write, df_processed compartilha memória com o DataFrame
+        original e só as colunas convertidas ocupam memória nova.
+        """
+        self.df_processed = self.df.copy(deep=False)
+        
+        # Remove linhas completamente vazias (só filtra se houver alguma)
+        non_empty = self.df_processed.notna().any(axis=1)
+        if not non_empty.all():
+            self.df_processed = self.df_processed[non_empty]
+        
+        # Resolve uma única vez as colunas de todas as perguntas conhecidas
+        self.schema = get_schema_resolver(tuple(self.df_processed.columns))
+        
+        # Converte todas as colunas numéricas de uma vez, colocando NaN para
+        # valores inválidos, e compacta o tipo (Likert 1-5 vira Int8 anulável).
+        # As faixas de workload ficam de fora (tratadas abaixo)
+        present_columns = list(self.schema.columns_of_type('likert', 'numerico').values())
+        if present_columns:
+            self.df_processed[present_columns] = _coerce_numeric_columns(self.df_processed, present_columns)
+        
+        # Converte as faixas de carga de trabalho em categorias ordenadas, com o
+        # ponto médio numérico de cada faixa guardado como metadado
+        self.band_columns = {}
+        band_midpoints = {}
+        for metric_key, col in self.schema.columns_of_type('faixa').items():
+            if pd.api.types.is_numeric_dtype(self.df_processed[col]):
+                continue
+            
+            mapping = self._get_numeric_mapping_for_workload(metric_key)
+            self.df_processed[col] = _to_ordered_bands(self.df_processed[col], mapping)
+            self.band_columns[metric_key] = col
+            band_midpoints[col] = mapping
+        
+        self.df_processed.attrs['band_midpoints'] = band_midpoints
     
-    def analyze_organizational_structure(self):
-        """Analisa métricas relacionadas à estrutura organizacional"""
-        metrics = {}
+    def memory_report(self):
+        """
+        Relatório de uso de memória dos dados originais e processados
+        
+        Returns:
+            dict: Bytes ocupados ('original_bytes' é None se os dados originais
+                foram descartados) e o detalhamento por coluna processada
+        """
+        processed_usage = self.df_processed.memory_usage(deep=True, index=False)
+        original_bytes = None
+        if self.df is not None:
+            original_bytes = int(self.df.memory_usage(deep=True).sum())
         
-        org_metrics = {
-            'organizacao_de': 'O quão organizada você considera a DE?',
-            'acessibilidade_diretor': 'O quão acessível é o seu/sua diretor(a)?',
-            'comunicacao_interna': 'Quão bem os integrantes de sua diretoria se comunicam entre si?'
+        return {
+            'original_bytes': original_bytes,
+            'processado_bytes': int(processed_usage.sum()),
+            'por_coluna': pd.DataFrame({
+                'tipo': self.df_processed.dtypes.astype(str),
+                'bytes': processed_usage
+            })
         }
+    
+    def band_to_numeric(self, series):
+        """
+        Converte uma coluna de faixas (categoria ordenada) nos pontos médios numéricos
         
-        for key, col in org_metrics.items():
-            if col in self.df_processed.columns:
+        A conversão é feita sobre os códigos inteiros da categoria, sem mapear
+        cada string individualmente.
+        
+        Args:
+            series (Series): Coluna categórica de faixas de df_processed
+        
+        Returns:
+            Series: Valores float com o ponto médio de cada faixa (NaN se não mapeável)
+        """
+        mapping = self.df_processed.attrs.get('band_midpoints', {}).get(series.name)
+        if mapping is None or not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.map(mapping or {}).astype(float)
+        
+        midpoints = np.array(
+            [mapping.get(category, np.nan) for category in series.cat.categories] + [np.nan],
+            dtype=float
+        )
+        # Código -1 (ausente) aponta para o NaN adicionado no final
+        return pd.Series(midpoints[series.cat.codes.to_numpy()], index=series.index, name=series.name)
+    
+    def _likert_columns(self):
+        """Colunas numéricas das perguntas registradas no relatório"""
+        columns = []
+        for key in registered_keys():
+            col = self.schema.column(key)
+            if col is not None and pd.api.types.is_numeric_dtype(self.df_processed[col]):
+                columns.append(col)
+        return columns
+    
+    def _compute_likert_statistics(self):
+        """Agrega todas as perguntas registradas em uma única passada sobre os dados"""
+        return aggregate_likert(self.df_processed, self._likert_columns())
+    
+    def _likert_statistics_from_counts(self, counts, version):
+        """Estatísticas a partir das contagens do índice bitmap, enquanto os dados não mudarem"""
+        if self.data_version != version:
+            return self._compute_likert_statistics()
+        return aggregate_likert_counts(counts)
+    
+    def _compute_metric_group(self, group):
+        """
+        Monta as métricas de um grupo do registro a partir da agregação única
+        
+        Args:
+            group (str): Nome do grupo em METRIC_GROUPS (ex: 'satisfacao')
+        
+        Returns:
+            dict: Métricas do grupo no formato do relatório (MetricResult com
+                a série de respostas em 'data' montada sob demanda)
+        """
+        stats = self.results.get('estatisticas_likert')
+        metrics = {}
+        
+        for key in METRIC_GROUPS[group]:
+            col = self.schema.column(key)
+            if col is None:
+                continue
+            
+            if col in stats.index:
+                row = stats.loc[col]
+                if row['n_respostas'] > 0:
+                    metrics[key] = MetricResult({
+                        'n_respostas': int(row['n_respostas']),
+                        'media': round(row['media'], 2),
+                        'mediana': round(row['mediana'], 2),
+                        'desvio_padrao': round(row['desvio_padrao'], 2),
+                        'percentil_75': round(row['percentil_75'], 2),
+                        'percentil_25': round(row['percentil_25'], 2),
+                    }, self, lazy={'data': partial(column_data, column=col)})
+            else:
+                # Coluna não numérica: apenas contagem das respostas
                 valid_responses = self.df_processed[col].dropna()
                 if len(valid_responses) > 0:
-                    metrics[key] = {
+                    metrics[key] = MetricResult({
                         'n_respostas': len(valid_responses),
-                        'data': valid_responses
-                    }
-                    
-                    # Tenta calcular estatísticas se os dados são numéricos
-                    try:
-                        numeric_responses = pd.to_numeric(valid_responses, errors='coerce').dropna()
-                        if len(numeric_responses) > 0:
-                            metrics[key].update({
-                                'media': round(numeric_responses.mean(), 2),
-                                'desvio_padrao': round(numeric_responses.std(), 2),
-                            })
-                        else:
-                            metrics[key]['value_counts'] = valid_responses.value_counts()
-                    except Exception as e:
-                        metrics[key]['value_counts'] = valid_responses.value_counts()
+                        'value_counts': valid_responses.value_counts()
+                    }, self, lazy={'data': partial(column_data, column=col)})
         
         return metrics
     
+    def calculate_satisfaction_metrics(self):
+        """Calcula métricas de satisfação geral (memoizado por versão dos dados)"""
+        return self.results.get('satisfacao')
+    
+    def analyze_organizational_structure(self):
+        """Analisa métricas relacionadas à estrutura organizacional (memoizado por versão dos dados)"""
+        return self.results.get('estrutura_organizacional')
+    
     def analyze_workload_distribution(self):
+        """Analisa distribuição de carga de trabalho com dados categóricos (memoizado por versão dos dados)"""
+        return self.results.get('carga_trabalho')
+    
+    def _compute_workload_distribution(self):
         """Analisa distribuição de carga de trabalho com dados categóricos"""
         metrics = {}
         
-        # Lista de possíveis nomes de colunas para cada métrica
-        workload_columns = {
-            'horas_semanais_diretoria': [
-                'Quantas horas por semana você gasta com tarefas de diretoria?',
-                'Horas diretoria',
-                'Horas por semana - diretoria',
-                'Quantas horas você dedica semanalmente às tarefas de diretoria?'
-            ],
-            'horas_semanais_projeto': [
-                'Quantas horas semanalmente você gasta com tarefas de projeto?',
-                'Horas projeto',
-                'Horas por semana - projeto',
-                'Quantas horas você dedica semanalmente aos projetos?'
-            ],
-            'projetos_simultaneos': [
-                'Quantos projetos você está realizando na IN Junior atualmente?',
-                'Número de projetos',
-                'Projetos atuais',
-                'Quantos projetos você está realizando atualmente?'
-            ]
-        }
-        
-        for metric_key, possible_columns in workload_columns.items():
-            found_column = None
-            
-            # Tenta encontrar uma coluna exata
-            for col_name in possible_columns:
-                if col_name in self.df_processed.columns:
-                    found_column = col_name
-                    break
-            
-            # Se não encontrou, tenta busca parcial (case-insensitive)
-            if not found_column:
-                for df_col in self.df_processed.columns:
-                    df_col_lower = df_col.lower()
-                    
-                    # Busca por palavras-chave específicas para cada métrica
-                    if metric_key == 'horas_semanais_diretoria':
-                        if ('hora' in df_col_lower and 'diretoria' in df_col_lower) or \
-                           ('hora' in df_col_lower and 'semana' in df_col_lower and 'diretoria' in df_col_lower):
-                            found_column = df_col
-                            break
-                    
-                    elif metric_key == 'horas_semanais_projeto':
-                        if ('hora' in df_col_lower and 'projeto' in df_col_lower) or \
-                           ('hora' in df_col_lower and 'semana' in df_col_lower and 'projeto' in df_col_lower):
-                            found_column = df_col
-                            break
-                    
-                    elif metric_key == 'projetos_simultaneos':
-                        if ('projeto' in df_col_lower and ('quantos' in df_col_lower or 'número' in df_col_lower or 'atual' in df_col_lower)) or \
-                           ('projeto' in df_col_lower and 'junior' in df_col_lower):
-                            found_column = df_col
-                            break
+        for metric_key in QUESTION_CATALOG:
+            if QUESTION_CATALOG[metric_key]['tipo'] != 'faixa':
+                continue
+            found_column = self.schema.column(metric_key)
             
             if found_column:
                 raw_data = self.df_processed[found_column]
@@ -191,144 +426,259 @@ class INJuniorSurveyAnalyzer:
                 
                 if len(valid_responses) > 0:
                     # Para dados categóricos, criamos contagens e outras estatísticas
+                    # (faixas sem nenhuma resposta não entram na contagem)
                     value_counts = valid_responses.value_counts()
+                    value_counts = value_counts[value_counts > 0]
                     
-                    metrics[metric_key] = {
+                    values = {
                         'n_respostas': len(valid_responses),
-                        'data': valid_responses,
                         'coluna_encontrada': found_column,
                         'value_counts': value_counts,
                         'categorias': list(value_counts.index),
                         'tipo_dados': 'categorico'
                     }
+                    lazy = {'data': partial(column_data, column=found_column)}
                     
                     # Se conseguir mapear para números (para estatísticas), faz isso também
                     numeric_mapping = self._get_numeric_mapping_for_workload(metric_key)
                     if numeric_mapping:
-                        numeric_data = valid_responses.map(numeric_mapping).dropna()
+                        numeric_data = self.band_to_numeric(valid_responses).dropna()
                         if len(numeric_data) > 0:
-                            metrics[metric_key].update({
+                            values.update({
                                 'media': round(numeric_data.mean(), 2),
                                 'mediana': round(numeric_data.median(), 2),
                                 'desvio_padrao': round(numeric_data.std(), 2),
-                                'maximo': numeric_data.max(),
-                                'minimo': numeric_data.min(),
-                                'numeric_data': numeric_data,
+                                'maximo': _plain_number(numeric_data.max()),
+                                'minimo': _plain_number(numeric_data.min()),
                                 'tipo_dados': 'categorico_com_numerico'
                             })
+                            lazy['numeric_data'] = partial(band_numeric_data, column=found_column)
+                    
+                    metrics[metric_key] = MetricResult(values, self, lazy=lazy)
         
         return metrics
     
     def _get_numeric_mapping_for_workload(self, metric_key):
         """Retorna mapeamento numérico apenas para estatísticas, sem alterar dados originais"""
-        
-        if metric_key == 'horas_semanais_diretoria':
-            return {
-                '1 a 5 horas': 3,
-                '6 a 10 horas': 8,
-                '11 a 15 horas': 13,
-                'Mais de 15 horas': 18
-            }
-        
-        elif metric_key == 'horas_semanais_projeto':
-            return {
-                '1 a 5 horas': 3,
-                '6 a 10 horas': 8,
-                '11 a 15 horas': 13,
-                'Mais de 10 horas': 15,
-                'Mais de 15 horas': 18
-            }
-        
-        elif metric_key == 'projetos_simultaneos':
-            return {
-                'Nenhum': 0,
-                'Um': 1,
-                'Dois': 2,
-                'Três': 3,
-                'Mais de três': 4
-            }
+        question = QUESTION_CATALOG.get(metric_key, {})
+        if 'pontos_medios' in question:
+            return dict(question['pontos_medios'])
         
         return None
     
     def analyze_feedback_culture(self):
-        """Analisa a cultura de feedback na empresa"""
-        metrics = {}
-        
-        feedback_metrics = {
-            'preparacao_feedback': 'O quanto você se sente preparado(a) para conceder feedback para os membros da sua equipe?',
-            'frequencia_feedback_dado': 'O quanto você concede feedback para os membros da sua equipe?',
-            'frequencia_feedback_recebido': 'Com que frequência você recebe feedback de seu/sua diretor(a)?'
-        }
-        
-        for key, col in feedback_metrics.items():
-            if col in self.df_processed.columns:
-                valid_responses = self.df_processed[col].dropna()
-                if len(valid_responses) > 0:
-                    metrics[key] = {
-                        'n_respostas': len(valid_responses),
-                        'data': valid_responses
-                    }
-                    
-                    # Tenta calcular estatísticas se os dados são numéricos
-                    try:
-                        numeric_responses = pd.to_numeric(valid_responses, errors='coerce').dropna()
-                        if len(numeric_responses) > 0:
-                            metrics[key].update({
-                                'media': round(numeric_responses.mean(), 2),
-                                'desvio_padrao': round(numeric_responses.std(), 2),
-                            })
-                        else:
-                            metrics[key]['value_counts'] = valid_responses.value_counts()
-                    except Exception as e:
-                        metrics[key]['value_counts'] = valid_responses.value_counts()
-        
-        return metrics
+        """Analisa a cultura de feedback na empresa (memoizado por versão dos dados)"""
+        return self.results.get('cultura_feedback')
     
     def analyze_engagement_metrics(self):
-        """Analisa métricas de engajamento"""
-        metrics = {}
-        
-        engagement_metrics = {
-            'importancia_eventos': 'O quanto você acha importante participar dos eventos da empresa? (RG\'s, reuniões, p{IN}zza...)',
-            'sentimento_ouvido': 'O quanto você se sente ouvido(a) dentro da empresa?'
-        }
-        
-        for key, col in engagement_metrics.items():
-            if col in self.df_processed.columns:
-                valid_responses = self.df_processed[col].dropna()
-                if len(valid_responses) > 0:
-                    metrics[key] = {
-                        'n_respostas': len(valid_responses),
-                        'data': valid_responses
-                    }
-                    
-                    # Tenta calcular estatísticas se os dados são numéricos
-                    try:
-                        numeric_responses = pd.to_numeric(valid_responses, errors='coerce').dropna()
-                        if len(numeric_responses) > 0:
-                            metrics[key].update({
-                                'media': round(numeric_responses.mean(), 2),
-                                'desvio_padrao': round(numeric_responses.std(), 2),
-                            })
-                        else:
-                            metrics[key]['value_counts'] = valid_responses.value_counts()
-                    except Exception as e:
-                        metrics[key]['value_counts'] = valid_responses.value_counts()
-        
-        return metrics
+        """Analisa métricas de engajamento (memoizado por versão dos dados)"""
+        return self.results.get('engajamento')
     
+    @profiled('analyzer.relatorio_resumo')
     def generate_summary_report(self):
-        """Gera relatório resumo com todas as métricas"""
+        """Gera relatório resumo com todas as métricas (memoizado por versão dos dados)"""
+        return self.results.get('relatorio')
+    
+    def _build_summary_report(self):
+        """Monta o relatório a partir dos resultados memoizados de cada seção"""
         report = {
             'info_geral': {
                 'total_respostas': len(self.df_processed),
                 'colunas_analisadas': len(self.df_processed.columns)
             },
-            'satisfacao': self.calculate_satisfaction_metrics(),
-            'estrutura_organizacional': self.analyze_organizational_structure(),
-            'carga_trabalho': self.analyze_workload_distribution(),
-            'cultura_feedback': self.analyze_feedback_culture(),
-            'engajamento': self.analyze_engagement_metrics()
+            'carga_trabalho': self.results.get('carga_trabalho')
         }
         
+        # Cada grupo do registro de métricas vira uma seção do relatório
+        for group in METRIC_GROUPS:
+            report[group] = self.results.get(group)
+        
         return report
+    
+    def encoded_numeric_frame(self):
+        """
+        Colunas numéricas e ordinais codificadas, nomeadas pela chave canônica
+        
+        Perguntas Likert e numéricas entram como float; faixas entram pelos
+        pontos médios. Resultado memoizado e compartilhado pelos cruzamentos.
+        
+        Returns:
+            DataFrame: Uma coluna float por pergunta encontrada
+        """
+        return self.results.get('dados_codificados')
+    
+    def _compute_encoded_frame(self):
+        """Monta o DataFrame numérico de todas as perguntas ordinais/numéricas"""
+        encoded = {}
+        for key, col in self.schema.columns_of_type('likert', 'numerico', 'faixa').items():
+            series = self.df_processed[col]
+            if key in self.band_columns:
+                encoded[key] = self.band_to_numeric(series).to_numpy()
+            elif pd.api.types.is_numeric_dtype(series):
+                encoded[key] = series.to_numpy(dtype=float, na_value=np.nan)
+        
+        # Mantém a ordem do catálogo de perguntas
+        ordered = [key for key in QUESTION_CATALOG if key in encoded]
+        return pd.DataFrame({key: encoded[key] for key in ordered}, index=self.df_processed.index)
+    
+    def analyze_correlations(self):
+        """
+        Correlações de Pearson e Spearman entre todas as perguntas numéricas/ordinais
+        
+        Returns:
+            dict: Matrizes de correlação, p-valores (brutos e ajustados por FDR)
+                e respostas completas por par (ver `correlation_engine.correlation_matrix`)
+        """
+        return self.results.get('correlacoes')
+    
+    def _compute_correlations(self):
+        return correlation_matrix(self.encoded_numeric_frame())
+    
+    def categorical_codes(self):
+        """
+        Códigos inteiros das perguntas com poucas categorias, nomeados pela chave canônica
+        
+        Usados pelas tabelas de contingência: cada coluna é codificada uma
+        única vez por versão dos dados (memoizado).
+        
+        Returns:
+            dict: 'codigos' (DataFrame de inteiros, -1 para ausentes) e
+                'categorias' (chave -> lista de categorias na ordem dos códigos)
+        """
+        return self.results.get('codigos_categoricos')
+    
+    def _compute_categorical_codes(self):
+        """Codifica as perguntas com 2 a MAX_CATEGORIES categorias"""
+        codes = {}
+        categories = {}
+        columns = self.schema.columns_of_type('likert', 'numerico', 'faixa', 'categorico')
+        for key in QUESTION_CATALOG:
+            if key not in columns:
+                continue
+            values, labels = category_codes(self.df_processed[columns[key]])
+            if 2 <= len(labels) <= MAX_CATEGORIES:
+                codes[key] = values
+                categories[key] = list(labels)
+        
+        return {
+            'codigos': pd.DataFrame(codes, index=self.df_processed.index),
+            'categorias': categories
+        }
+    
+    def analyze_associations(self):
+        """
+        Qui-quadrado e V de Cramér entre todas as perguntas categóricas/ordinais
+        
+        Returns:
+            dict: Matrizes de associação, p-valores (brutos e ajustados por FDR),
+                tabelas e resíduos por par (ver `contingency.association_matrix`)
+        """
+        return self.results.get('associacoes')
+    
+    def _compute_associations(self):
+        coded = self.categorical_codes()
+        return association_matrix(coded['codigos'], coded['categorias'])
+    
+    def bitmap_index(self):
+        """
+        Índice bitmap das perguntas categóricas/Likert (um bitmap por valor)
+        
+        Montado a partir de `categorical_codes()` uma única vez por versão dos
+        dados; usado pelo painel de filtros.
+        
+        Returns:
+            BitmapIndex: Índice com as mesmas perguntas da matriz de associação
+        """
+        return self.results.get('indice_bitmap')
+    
+    def _compute_bitmap_index(self):
+        coded = self.categorical_codes()
+        return BitmapIndex.from_codes(coded['codigos'], coded['categorias'])
+    
+    @profiled('filtros.subconjunto')
+    def filtered(self, selections, combine=COMBINE_ALL):
+        """
+        Novo analisador só com as respostas que atendem ao filtro
+        
+        As linhas são escolhidas pelo índice bitmap (sem expressões booleanas
+        do pandas) e o novo analisador recalcula todos os resultados sobre o
+        subconjunto, sob demanda. Sem nenhum valor escolhido, devolve o
+        próprio analisador.
+        
+        Args:
+            selections (dict): Chave canônica -> valores aceitos
+            combine (str): 'e' (todas as perguntas) ou 'ou' (qualquer uma)
+        
+        Returns:
+            INJuniorSurveyAnalyzer: Analisador do subconjunto
+        """
+        signature = filter_signature(selections, combine)
+        if not signature:
+            return self
+        
+        index = self.bitmap_index()
+        selected = index.select(selections, combine)
+        rows = np.flatnonzero(np.unpackbits(selected, count=index.n_rows))
+        subset = type(self).from_processed(self.df_processed.take(rows))
+        # Identifica o subconjunto nos caches externos (figuras, tabelas,
+        # arquivos exportados) sem re-hashear as linhas; o separador precisa
+        # ser válido em nomes de arquivo
+        subset.dataset_key = f"{self.dataset_key}_{signature}"
+        
+        # As estatísticas Likert do subconjunto saem das contagens por valor
+        # (AND do filtro com o bitmap de cada valor), sem agregar as respostas
+        columns = self._likert_columns()
+        by_column = {col: key for key, col in self.schema.columns_of_type('likert', 'numerico').items()}
+        if all(by_column.get(col) in index.bitmaps for col in columns):
+            counts = {col: index.value_counts(by_column[col], selected) for col in columns}
+            subset.results.register(
+                'estatisticas_likert', partial(subset._likert_statistics_from_counts, counts, subset.data_version)
+            )
+        return subset
+    
+    def confidence_intervals(self):
+        """
+        Intervalos de confiança bootstrap (95%) de média, mediana e desvio padrão
+        
+        Calculados uma vez por versão dos dados, com semente fixa.
+        
+        Returns:
+            DataFrame: Uma linha por pergunta numérica/ordinal (chave canônica)
+        """
+        return self.results.get('intervalos_confianca')
+    
+    def _compute_confidence_intervals(self):
+        return bootstrap_intervals(self.encoded_numeric_frame())
+    
+    def segment_report(self, by, min_n=DEFAULT_MIN_SEGMENT_SIZE):
+        """
+        Métricas registradas e de carga de trabalho quebradas por segmento
+        
+        A agregação de cada agrupamento é feita uma vez (um único group-by) e
+        memoizada; trocar `min_n` só reaplica a supressão.
+        
+        Args:
+            by (str | list): Chaves canônicas (ou colunas) de agrupamento,
+                ex: 'diretoria' ou ['diretoria', 'projetos_simultaneos']
+            min_n (int): Tamanho mínimo de segmento/métrica para exibir estatísticas
+        
+        Returns:
+            DataFrame: Uma linha por (segmento, chave) (ver `segmentation.segment_metrics`)
+        """
+        by = (by,) if isinstance(by, str) else tuple(by)
+        name = 'segmentos:' + '|'.join(by)
+        if name not in self.results:
+            self.results.register(name, partial(self._compute_segments, by))
+        return suppress_small_segments(self.results.get(name), min_n)
+    
+    def _compute_segments(self, by):
+        """Agrega todas as métricas por segmento em uma única passada"""
+        segments = pd.DataFrame({
+            key: self.df_processed[self.schema.column(key) or key] for key in by
+        })
+        encoded = self.encoded_numeric_frame()
+        metric_keys = [
+            key for key in registered_keys() + list(self.band_columns)
+            if key in encoded.columns and key not in by
+        ]
+        return segment_metrics(encoded[metric_keys], segments)
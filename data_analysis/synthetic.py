@@ -0,0 +1,111 @@
+"""
+Gerador de respostas sintéticas da pesquisa (cabeçalhos e vocabulários reais) para testes de carga
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .schema import QUESTION_CATALOG
+
+
+# Fração padrão de respostas em branco por pergunta
+DEFAULT_MISSING_RATE = 0.05
+
+DEFAULT_SEED = 42
+
+# Linhas geradas por bloco ao gravar o CSV
+DEFAULT_CHUNK_ROWS = 100000
+
+# Respostas das perguntas sem vocabulário no catálogo
+SYNTHETIC_VOCABULARIES = {
+    'carga_horaria_estagio': [0, 4, 6, 8],
+    'diretoria': ['Projetos', 'Comercial', 'Gente e Gestão', 'Marketing', 'Presidência']
+}
+
+TIMESTAMP_COLUMN = 'Carimbo de data/hora'
+
+# Peso do fator latente de satisfação nas escalas 1-5 e (com sinal negativo) nas faixas
+LIKERT_LOADING = 0.8
+BAND_LOADING = 0.5
+
+
+def _band_codes(latent, n_bands, rng):
+    """
+    Índice da faixa de cada resposta, crescente com o fator latente
+    
+    Os cortes são quantis fixos da distribuição teórica do escore, então as
+    faixas têm proporções iguais e não dependem do bloco gerado.
+    """
+    score = -BAND_LOADING * latent + rng.normal(size=len(latent))
+    edges = stats.norm.ppf(np.linspace(0, 1, n_bands + 1)[1:-1], scale=np.sqrt(1 + BAND_LOADING ** 2))
+    return np.searchsorted(edges, score)
+
+
+def generate_survey(n_rows, missing_rate=DEFAULT_MISSING_RATE, seed=DEFAULT_SEED, start_row=0):
+    """
+    Gera respostas sintéticas no formato do CSV exportado pelo formulário
+    
+    Cada respondente tem um fator latente de satisfação: as escalas 1-5 são
+    positivamente correlacionadas entre si e as faixas de horas e projetos
+    negativamente correlacionadas com elas, para que cruzamentos e
+    correlações tenham sinal a detectar.
+    
+    Args:
+        n_rows (int): Número de respostas
+        missing_rate (float): Fração de respostas em branco por pergunta
+        seed (int): Semente do gerador aleatório
+        start_row (int): Posição da primeira linha (para gerar em blocos)
+    
+    Returns:
+        DataFrame: Uma coluna por pergunta do catálogo, com os cabeçalhos reais
+    """
+    rng = np.random.default_rng([seed, start_row])
+    satisfaction = rng.normal(size=n_rows)
+    
+    data = {
+        TIMESTAMP_COLUMN: (
+            pd.Timestamp('2024-01-01') + pd.to_timedelta(np.arange(start_row, start_row + n_rows), unit='min')
+        ).strftime('%Y/%m/%d %H:%M:%S')
+    }
+    
+    for key, spec in QUESTION_CATALOG.items():
+        if spec['tipo'] == 'likert':
+            scores = np.rint(3 + LIKERT_LOADING * satisfaction + rng.normal(size=n_rows))
+            values = pd.array(np.clip(scores, 1, 5).astype(int), dtype='Int8')
+        elif spec['tipo'] == 'faixa':
+            labels = np.array(list(spec['pontos_medios']), dtype=object)
+            values = labels[_band_codes(satisfaction, len(labels), rng)]
+        else:
+            vocabulary = np.array(SYNTHETIC_VOCABULARIES.get(key, ['A', 'B', 'C']), dtype=object)
+            # pd.array mantém inteiros como inteiros (sem virar float com os ausentes)
+            values = pd.array(vocabulary[rng.integers(0, len(vocabulary), n_rows)])
+        
+        series = pd.Series(values)
+        if missing_rate > 0:
+            series = series.mask(rng.random(n_rows) < missing_rate)
+        data[spec['texto']] = series
+    
+    return pd.DataFrame(data)
+
+
+def write_survey_csv(path, n_rows, missing_rate=DEFAULT_MISSING_RATE, seed=DEFAULT_SEED,
+                     chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Grava um CSV sintético em blocos (sem montar todas as linhas em memória)
+    
+    Args:
+        path (str): Arquivo de saída
+        n_rows (int): Número de respostas
+        missing_rate (float): Fração de respostas em branco por pergunta
+        seed (int): Semente do gerador aleatório
+        chunk_rows (int): Linhas geradas por bloco
+    
+    Returns:
+        str: Caminho do arquivo gravado
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as handle:
+        for start in range(0, n_rows, chunk_rows):
+            chunk = generate_survey(min(chunk_rows, n_rows - start), missing_rate, seed, start_row=start)
+            chunk.to_csv(handle, index=False, header=start == 0)
+    return path
@@ -0,0 +1,56 @@
+"""
+Testes do cache de resultados do analisador (dependências e concorrência)
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from data_analysis import INJuniorSurveyAnalyzer, generate_survey
+
+
+def _analyzer():
+    return INJuniorSurveyAnalyzer(generate_survey(100))
+
+
+def test_dependents_are_invalidated():
+    analyzer = _analyzer()
+    analyzer.results.register('base', lambda: 1)
+    analyzer.results.register('derivado', lambda: analyzer.results.get('base') + 1)
+    assert analyzer.results.get('derivado') == 2
+    
+    analyzer.results.register('base', lambda: 10)
+    assert not analyzer.results.is_cached('derivado')
+    assert analyzer.results.get('derivado') == 11
+
+
+def test_different_results_are_computed_concurrently():
+    analyzer = _analyzer()
+    # Cada produtor só termina quando o outro também começou: com um lock
+    # global para todos os cálculos, a barreira estouraria o tempo limite
+    barrier = threading.Barrier(2, timeout=5)
+    analyzer.results.register('a', lambda: barrier.wait() is not None)
+    analyzer.results.register('b', lambda: barrier.wait() is not None)
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(analyzer.results.get, name) for name in ('a', 'b')]
+    assert [future.result() for future in futures] == [True, True]
+
+
+def test_same_result_is_computed_once_across_threads():
+    analyzer = _analyzer()
+    started = threading.Event()
+    release = threading.Event()
+    
+    def _slow():
+        started.set()
+        release.wait(5)
+        return 'valor'
+    
+    analyzer.results.register('lento', _slow)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(analyzer.results.get, 'lento') for _ in range(4)]
+        started.wait(5)
+        release.set()
+    
+    assert {future.result() for future in futures} == {'valor'}
+    assert analyzer.results.compute_counts['lento'] == 1
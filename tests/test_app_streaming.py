@@ -0,0 +1,50 @@
+"""
+Testes do estado do modo streaming incremental do app (isolado por sessão)
+"""
+
+import pytest
+
+from data_analysis import generate_survey
+
+app = pytest.importorskip('app')
+
+
+class _Upload:
+    """Arquivo enviado pelo `st.file_uploader` (só o que o app usa)"""
+    
+    def __init__(self, frame, name='respostas.csv'):
+        self.name = name
+        self._content = frame.to_csv(index=False).encode()
+    
+    def getvalue(self):
+        return self._content
+
+
+def test_same_filename_in_two_sessions_does_not_share_state():
+    first, second = {}, {}
+    survey_a = generate_survey(300, seed=1)
+    survey_b = generate_survey(120, seed=2)
+    
+    summary_a = app.load_survey_streaming(_Upload(survey_a), incremental=True, state=first)
+    summary_b = app.load_survey_streaming(_Upload(survey_b), incremental=True, state=second)
+    
+    assert summary_a['novas'] == 300
+    assert summary_b['novas'] == 120
+    assert summary_a['report']['info_geral']['total_respostas'] == 300
+    assert summary_b['report']['info_geral']['total_respostas'] == 120
+    assert first['streaming_incremental']['respostas.csv']['analyzer'] is not \
+        second['streaming_incremental']['respostas.csv']['analyzer']
+
+
+def test_resending_grown_file_adds_only_new_rows_in_the_session():
+    state = {}
+    survey = generate_survey(200, seed=3)
+    app.load_survey_streaming(_Upload(survey.iloc[:150]), incremental=True, state=state)
+    summary = app.load_survey_streaming(_Upload(survey), incremental=True, state=state)
+    
+    assert summary['novas'] == 50
+    assert summary['report']['info_geral']['total_respostas'] == 200
+    
+    # Outra sessão com o mesmo arquivo começa do zero
+    other = app.load_survey_streaming(_Upload(survey), incremental=True, state={})
+    assert other['novas'] == 200
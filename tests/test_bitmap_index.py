@@ -0,0 +1,92 @@
+"""
+Testes do índice bitmap dos filtros contra máscaras booleanas do pandas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_analysis import INJuniorSurveyAnalyzer, generate_survey
+from data_analysis.bitmap_index import COMBINE_ALL, COMBINE_ANY, BitmapIndex, filter_signature
+from data_analysis.metric_registry import aggregate_likert
+
+
+SELECTIONS = {
+    'horas_semanais_diretoria': ['Mais de 15 horas'],
+    'projetos_simultaneos': ['Dois', 'Três', 'Mais de três']
+}
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    # Número de linhas que não é múltiplo de 8 (bits de preenchimento do packbits)
+    analyzer = INJuniorSurveyAnalyzer(generate_survey(1003, seed=25))
+    analyzer.dataset_key = 'pesquisa'
+    return analyzer
+
+
+def _pandas_mask(analyzer, selections, combine):
+    masks = [
+        analyzer.df_processed[analyzer.schema.column(key)].isin(values).to_numpy()
+        for key, values in selections.items() if values
+    ]
+    return np.logical_and.reduce(masks) if combine == COMBINE_ALL else np.logical_or.reduce(masks)
+
+
+@pytest.mark.parametrize('combine', [COMBINE_ALL, COMBINE_ANY])
+def test_mask_and_count_match_pandas(analyzer, combine):
+    index = analyzer.bitmap_index()
+    expected = _pandas_mask(analyzer, SELECTIONS, combine)
+    np.testing.assert_array_equal(index.mask(SELECTIONS, combine), expected)
+    assert index.count(SELECTIONS, combine) == expected.sum()
+
+
+def test_likert_values_and_value_counts(analyzer):
+    index = analyzer.bitmap_index()
+    selections = {'satisfacao_geral': [4, 5], 'diretoria': []}
+    column = analyzer.df_processed[analyzer.schema.column('satisfacao_geral')]
+    assert index.count(selections) == column.isin([4, 5]).sum()
+    
+    selected = index.select(SELECTIONS)
+    values, counts = index.value_counts('satisfacao_geral', selected)
+    subset = column[_pandas_mask(analyzer, SELECTIONS, COMBINE_ALL)]
+    expected = subset.value_counts().reindex(values, fill_value=0)
+    np.testing.assert_array_equal(counts, expected.to_numpy())
+
+
+def test_empty_filter_selects_everything(analyzer):
+    index = analyzer.bitmap_index()
+    assert index.select({'diretoria': []}) is None
+    assert index.count({}) == len(analyzer.df_processed)
+    assert index.mask({}).all()
+    assert filter_signature({'diretoria': []}) == ''
+    assert analyzer.filtered({}) is analyzer
+
+
+def test_from_codes_skips_missing_codes():
+    codes = pd.DataFrame({'pergunta': [0, 1, -1, 1, 0, -1, 1, 1, 0]})
+    index = BitmapIndex.from_codes(codes, {'pergunta': ['a', 'b']})
+    assert index.count({'pergunta': ['a', 'b']}) == 7
+    np.testing.assert_array_equal(index.mask({'pergunta': ['b']}), codes['pergunta'].to_numpy() == 1)
+
+
+def test_signature_ignores_order_but_not_combination():
+    reordered = {key: list(reversed(values)) for key, values in reversed(list(SELECTIONS.items()))}
+    assert filter_signature(SELECTIONS) == filter_signature(reordered)
+    assert filter_signature(SELECTIONS, COMBINE_ALL) != filter_signature(SELECTIONS, COMBINE_ANY)
+
+
+def test_filtered_analyzer_matches_pandas_subset(analyzer):
+    subset = analyzer.filtered(SELECTIONS)
+    expected = analyzer.df_processed[_pandas_mask(analyzer, SELECTIONS, COMBINE_ALL)]
+    pd.testing.assert_frame_equal(subset.df_processed, expected)
+    assert ':' not in subset.dataset_key
+    
+    # Estatísticas Likert das contagens dos bitmaps = agregação direta do subconjunto
+    pd.testing.assert_frame_equal(
+        subset.results.get('estatisticas_likert'),
+        aggregate_likert(subset.df_processed, subset._likert_columns()),
+        check_exact=False, rtol=1e-12
+    )
+    report = subset.generate_summary_report()
+    assert report['info_geral']['total_respostas'] == len(expected)
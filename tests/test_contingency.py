@@ -0,0 +1,117 @@
+"""
+Testes das tabelas de contingência e da associação qui-quadrado contra SciPy/pandas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from data_analysis.contingency import (
+    association_matrix, category_codes, chi_square_test, contingency_table,
+    crosstab_frame, stratified_association
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(23)
+    size = 800
+    first = rng.choice(['a', 'b', 'c'], size=size)
+    # Segunda variável associada à primeira
+    second = np.where(rng.random(size) < 0.4, np.char.upper(first), rng.choice(['A', 'B', 'C', 'D'], size=size))
+    third = pd.Categorical(rng.choice(['x', 'y'], size=size), categories=['x', 'y', 'z'])
+    data = pd.DataFrame({'primeira': first, 'segunda': second, 'terceira': third})
+    data.loc[rng.random(size) < 0.05, 'primeira'] = None
+    return data
+
+
+def _codes(frame):
+    codes, categories = {}, {}
+    for column in frame.columns:
+        codes[column], labels = category_codes(frame[column])
+        categories[column] = list(labels)
+    return pd.DataFrame(codes), categories
+
+
+def test_contingency_table_matches_crosstab(frame):
+    codes, categories = _codes(frame)
+    table = contingency_table(
+        [codes['primeira'].to_numpy(), codes['segunda'].to_numpy()],
+        [len(categories['primeira']), len(categories['segunda'])]
+    )
+    expected = pd.crosstab(frame['primeira'], frame['segunda'])
+    np.testing.assert_array_equal(table, expected.to_numpy())
+
+
+def test_crosstab_frame_equals_pandas(frame):
+    pd.testing.assert_frame_equal(
+        crosstab_frame(frame['primeira'], frame['segunda']),
+        pd.crosstab(frame['primeira'], frame['segunda'])
+    )
+    pd.testing.assert_frame_equal(
+        crosstab_frame(frame['terceira'], frame['primeira']),
+        pd.crosstab(frame['terceira'], frame['primeira'])
+    )
+
+
+def test_chi_square_matches_scipy_without_continuity_correction(frame):
+    table = pd.crosstab(frame['primeira'], frame['segunda']).to_numpy()
+    result = chi_square_test(table)
+    chi2, pvalue, dof, expected = stats.chi2_contingency(table, correction=False)
+    
+    assert result['qui2'] == pytest.approx(chi2, rel=1e-12)
+    assert result['p_valor'] == pytest.approx(pvalue, rel=1e-9)
+    assert result['gl'] == dof
+    assert result['n'] == table.sum()
+    assert result['v_cramer'] == pytest.approx(
+        stats.contingency.association(table, method='cramer', correction=False), rel=1e-12
+    )
+    
+    # Resíduos padronizados ajustados: (O - E) / sqrt(E (1 - linha/n) (1 - coluna/n))
+    n = table.sum()
+    rows = table.sum(axis=1, keepdims=True) / n
+    cols = table.sum(axis=0, keepdims=True) / n
+    np.testing.assert_allclose(result['residuos'], (table - expected) / np.sqrt(expected * (1 - rows) * (1 - cols)))
+
+
+def test_chi_square_ignores_empty_rows_and_columns():
+    table = np.array([[10, 0, 5], [0, 0, 0], [4, 0, 12]])
+    result = chi_square_test(table)
+    chi2, pvalue, dof, _ = stats.chi2_contingency(np.array([[10, 5], [4, 12]]), correction=False)
+    assert result['gl'] == dof
+    assert result['qui2'] == pytest.approx(chi2)
+    assert result['p_valor'] == pytest.approx(pvalue)
+
+
+def test_association_matrix_uses_pairwise_complete_rows(frame):
+    codes, categories = _codes(frame)
+    result = association_matrix(codes, categories)
+    
+    for first, second in [('primeira', 'segunda'), ('segunda', 'terceira'), ('primeira', 'terceira')]:
+        table = pd.crosstab(frame[first], frame[second]).to_numpy()
+        chi2, pvalue, _, _ = stats.chi2_contingency(table, correction=False)
+        assert result['qui2'].loc[first, second] == pytest.approx(chi2)
+        assert result['p_valor'].loc[second, first] == pytest.approx(pvalue)
+        assert result['n'].loc[first, second] == table.sum()
+    
+    pvalues = result['p_valor'].to_numpy()[np.triu_indices(3, k=1)]
+    np.testing.assert_allclose(
+        result['p_ajustado'].to_numpy()[np.triu_indices(3, k=1)],
+        stats.false_discovery_control(pvalues, method='bh')
+    )
+
+
+def test_stratified_association_matches_each_slice(frame):
+    codes, categories = _codes(frame)
+    strata = stratified_association(codes, categories, 'primeira', 'segunda', 'terceira')
+    
+    assert list(strata['terceira']) == ['x', 'y', 'z']
+    for _, row in strata.iterrows():
+        subset = frame[frame['terceira'] == row['terceira']]
+        if subset.empty:
+            assert row['n_amostras'] == 0
+            continue
+        table = pd.crosstab(subset['primeira'], subset['segunda']).to_numpy()
+        assert row['qui2'] == pytest.approx(stats.chi2_contingency(table, correction=False)[0])
+        assert row['n_amostras'] == table.sum()
@@ -0,0 +1,76 @@
+"""
+Testes do motor de correlações contra as rotinas de referência do SciPy/pandas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from data_analysis.correlation_engine import (
+    correlation_pvalues, fdr_bh, pairwise_pearson, pairwise_spearman
+)
+
+
+@pytest.fixture
+def values():
+    """Escalas 1-5 correlacionadas (muitos empates), com ausentes em posições diferentes por coluna"""
+    rng = np.random.default_rng(11)
+    latent = rng.normal(size=600)
+    columns = [np.clip(np.round(3 + weight * latent + rng.normal(size=600)), 1, 5) for weight in (1.0, 0.6, -0.4, 0.0)]
+    data = np.column_stack(columns)
+    data[rng.random(data.shape) < 0.1] = np.nan
+    return data
+
+
+def test_fdr_bh_matches_scipy():
+    pvalues = np.random.default_rng(5).random(40) ** 3
+    expected = stats.false_discovery_control(pvalues, method='bh')
+    np.testing.assert_allclose(fdr_bh(pvalues), expected, rtol=1e-12)
+
+
+def test_fdr_bh_ignores_nan_and_keeps_shape():
+    pvalues = np.array([[0.01, np.nan], [0.04, 0.03]])
+    adjusted = fdr_bh(pvalues)
+    assert adjusted.shape == pvalues.shape
+    assert np.isnan(adjusted[0, 1])
+    valid = ~np.isnan(pvalues)
+    np.testing.assert_allclose(adjusted[valid], stats.false_discovery_control(pvalues[valid], method='bh'))
+
+
+def test_pairwise_pearson_matches_pandas(values):
+    r, n = pairwise_pearson(values)
+    frame = pd.DataFrame(values)
+    np.testing.assert_allclose(r, frame.corr(method='pearson').to_numpy(), rtol=1e-10)
+    present = frame.notna().astype(int)
+    np.testing.assert_array_equal(n, (present.T @ present).to_numpy())
+
+
+def test_pairwise_spearman_matches_scipy_with_pairwise_exclusion(values):
+    r, n = pairwise_spearman(values)
+    for i in range(values.shape[1]):
+        for j in range(values.shape[1]):
+            both = ~np.isnan(values[:, i]) & ~np.isnan(values[:, j])
+            assert n[i, j] == both.sum()
+            if i != j:
+                expected = stats.spearmanr(values[both, i], values[both, j]).statistic
+                assert r[i, j] == pytest.approx(expected, rel=1e-10)
+
+
+def test_correlation_pvalues_match_pearsonr(values):
+    r, n = pairwise_pearson(values)
+    pvalues = correlation_pvalues(r, n)
+    both = ~np.isnan(values[:, 0]) & ~np.isnan(values[:, 1])
+    expected = stats.pearsonr(values[both, 0], values[both, 1]).pvalue
+    assert pvalues[0, 1] == pytest.approx(expected, rel=1e-8)
+
+
+def test_pairwise_spearman_with_many_distinct_values_matches_pandas(values):
+    # Coluna contínua: a tabela conjunta teria mais células que linhas (cálculo linha a linha)
+    rng = np.random.default_rng(3)
+    continuous = values[:, 0] + rng.normal(size=len(values))
+    continuous[rng.random(len(values)) < 0.05] = np.nan
+    data = np.column_stack([values, continuous, np.round(continuous * 2)])
+    r, n = pairwise_spearman(data)
+    expected = pd.DataFrame(data).corr(method='spearman').to_numpy()
+    np.testing.assert_allclose(r, expected, rtol=1e-10)
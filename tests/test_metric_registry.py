@@ -0,0 +1,56 @@
+"""
+Testes das agregações das métricas Likert contra o pandas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_analysis.metric_registry import aggregate_likert, aggregate_likert_counts
+
+
+@pytest.fixture
+def likert():
+    rng = np.random.default_rng(4)
+    data = pd.DataFrame({
+        'pergunta_a': rng.integers(1, 6, size=501),
+        'pergunta_b': rng.choice([1, 2, 5], size=501, p=[0.2, 0.2, 0.6]),
+        'pergunta_c': rng.integers(1, 6, size=501)
+    }).astype('Int8')
+    data.loc[rng.random(501) < 0.1, 'pergunta_a'] = pd.NA
+    data['pergunta_c'] = pd.array([pd.NA] * len(data), dtype='Int8')
+    data.loc[7, 'pergunta_c'] = 4
+    return data
+
+
+def test_aggregate_likert_matches_series_methods(likert):
+    stats = aggregate_likert(likert, list(likert.columns))
+    for column in likert.columns:
+        series = likert[column].astype(float).dropna()
+        row = stats.loc[column]
+        assert row['n_respostas'] == len(series)
+        assert row['media'] == pytest.approx(series.mean(), nan_ok=True)
+        assert row['mediana'] == pytest.approx(series.median(), nan_ok=True)
+        assert row['desvio_padrao'] == pytest.approx(series.std(), nan_ok=True)
+        assert row['percentil_25'] == pytest.approx(series.quantile(0.25), nan_ok=True)
+        assert row['percentil_75'] == pytest.approx(series.quantile(0.75), nan_ok=True)
+
+
+def test_aggregate_likert_counts_matches_aggregate_likert(likert):
+    counts = {}
+    for column in likert.columns:
+        value_counts = likert[column].value_counts().sort_index()
+        counts[column] = (list(value_counts.index), value_counts.to_numpy())
+    # Valor sem nenhuma resposta (contagem zero) não altera as estatísticas
+    values, column_counts = counts['pergunta_b']
+    counts['pergunta_b'] = (values[:2] + [3] + values[2:], np.insert(column_counts, 2, 0))
+    
+    expected = aggregate_likert(likert, list(likert.columns))
+    actual = aggregate_likert_counts(counts)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-12)
+
+
+def test_aggregate_likert_counts_without_answers():
+    stats = aggregate_likert_counts({'pergunta': ([1, 2, 3], np.zeros(3, dtype=int))})
+    assert stats.loc['pergunta', 'n_respostas'] == 0
+    assert stats.loc['pergunta'].drop('n_respostas').isna().all()
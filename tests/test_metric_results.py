@@ -0,0 +1,40 @@
+"""
+Testes dos resultados compactos (MetricResult)
+"""
+
+import gc
+import pickle
+
+import pytest
+
+from data_analysis import INJuniorSurveyAnalyzer, MetricResult, generate_survey
+
+
+def test_row_level_fields_survive_garbage_collection():
+    report = INJuniorSurveyAnalyzer(generate_survey(300)).generate_summary_report()
+    gc.collect()
+    
+    metric = report['satisfacao']['satisfacao_geral']
+    assert 'data' in metric
+    assert len(metric['data']) == metric['n_respostas']
+
+
+def test_pickle_keeps_only_aggregates_until_bound():
+    analyzer = INJuniorSurveyAnalyzer(generate_survey(300))
+    metric = analyzer.generate_summary_report()['satisfacao']['satisfacao_geral']
+    
+    restored = pickle.loads(pickle.dumps(metric))
+    assert restored.to_dict() == metric.to_dict()
+    assert 'data' in restored
+    with pytest.raises(RuntimeError):
+        restored['data']
+    
+    restored.bind(analyzer)
+    assert restored['data'].equals(metric['data'])
+
+
+def test_unknown_key_is_a_key_error():
+    metric = MetricResult({'media': 3.0})
+    assert metric.get('data') is None
+    with pytest.raises(KeyError):
+        metric['data']
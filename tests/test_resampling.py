@@ -0,0 +1,62 @@
+"""
+Testes dos intervalos bootstrap contra o `scipy.stats.bootstrap`
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from data_analysis import resampling
+from data_analysis.resampling import bootstrap_column
+
+
+def _scipy_interval(values, statistic, n_resamples):
+    result = stats.bootstrap(
+        (values,), statistic, n_resamples=n_resamples, method='percentile',
+        batch=100, rng=np.random.default_rng(1)
+    )
+    return result.confidence_interval.low, result.confidence_interval.high
+
+
+def test_likert_column_matches_index_resampling(monkeypatch):
+    rng = np.random.default_rng(8)
+    values = rng.choice([1, 2, 3, 4, 5], size=2000, p=[0.1, 0.2, 0.3, 0.25, 0.15]).astype(float)
+    values[rng.random(len(values)) < 0.05] = np.nan
+    from_counts = bootstrap_column(values, n_resamples=4000)
+    
+    # Limite zerado: a mesma coluna passa pela reamostragem de índices
+    monkeypatch.setattr(resampling, 'MAX_BLOCK_ELEMENTS', 0)
+    from_indices = bootstrap_column(values, n_resamples=4000)
+    
+    assert from_counts['n_respostas'] == from_indices['n_respostas'] == (~np.isnan(values)).sum()
+    for key in ('ic_media_inf', 'ic_media_sup', 'ic_desvio_inf', 'ic_desvio_sup'):
+        assert from_counts[key] == pytest.approx(from_indices[key], abs=0.01)
+    for key in ('ic_mediana_inf', 'ic_mediana_sup'):
+        assert from_counts[key] == from_indices[key]
+
+
+def test_high_cardinality_column_uses_bounded_memory():
+    rng = np.random.default_rng(9)
+    values = rng.normal(10, 2, size=20000)
+    n_resamples = 2000
+    
+    tracemalloc.start()
+    try:
+        result = bootstrap_column(values, n_resamples=n_resamples, rng=np.random.default_rng(2))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    # A matriz B x K de contagens ocuparia 320 MB; os blocos de índices, poucas
+    # cópias de MAX_BLOCK_ELEMENTS floats
+    assert peak < 4 * resampling.MAX_BLOCK_ELEMENTS * 8 < len(values) * n_resamples * 8
+    
+    standard_error = values.std(ddof=1) / np.sqrt(len(values))
+    for name, statistic in (('media', np.mean), ('mediana', np.median)):
+        low, high = _scipy_interval(values, statistic, n_resamples)
+        assert result[f'ic_{name}_inf'] == pytest.approx(low, abs=0.5 * standard_error)
+        assert result[f'ic_{name}_sup'] == pytest.approx(high, abs=0.5 * standard_error)
+    assert result['ic_media_inf'] < result['media'] < result['ic_media_sup']
+    assert result['ic_desvio_inf'] < result['desvio_padrao'] < result['ic_desvio_sup']
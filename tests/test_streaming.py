@@ -0,0 +1,147 @@
+"""
+Testes dos agregadores online do modo streaming contra o pandas/NumPy e do modo incremental
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_analysis import generate_survey
+from data_analysis.streaming import (
+    TIMESTAMP_COLUMNS, NumericAccumulator, OnlineMoments, QuantileSketch, StreamingSurveyAnalyzer
+)
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(7)
+    return rng.normal(50, 12, size=5000)
+
+
+def test_online_moments_match_numpy_across_chunks_and_merge(values):
+    chunked = OnlineMoments()
+    for chunk in np.array_split(values, 13):
+        chunked.update(chunk)
+    
+    merged = OnlineMoments()
+    for chunk in np.array_split(values, 4):
+        part = OnlineMoments()
+        part.update(chunk)
+        merged.merge(part)
+    
+    for moments in (chunked, merged):
+        assert moments.count == len(values)
+        assert moments.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert moments.std == pytest.approx(values.std(ddof=1), rel=1e-10)
+        assert moments.minimum == values.min()
+        assert moments.maximum == values.max()
+
+
+def test_online_moments_std_needs_two_values():
+    moments = OnlineMoments()
+    moments.update([3.0])
+    assert np.isnan(moments.std)
+
+
+@pytest.mark.parametrize('q', [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0])
+def test_exact_sketch_quantiles_match_series_quantile(q):
+    rng = np.random.default_rng(3)
+    likert = rng.integers(1, 6, size=2001).astype(float)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(likert, 7):
+        sketch.update(chunk)
+    
+    assert sketch.exact
+    assert sketch.quantile(q) == pytest.approx(pd.Series(likert).quantile(q))
+    counts = sketch.counts()
+    expected = pd.Series(likert).value_counts().sort_index()
+    assert counts.to_dict() == expected.to_dict()
+
+
+def test_approximate_sketch_stays_bounded_and_close(values):
+    sketch = QuantileSketch(max_centroids=64)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    
+    assert not sketch.exact
+    assert len(sketch.values) <= 64
+    assert sketch.weights.sum() == len(values)
+    assert sketch.quantile(0.5) == pytest.approx(np.median(values), abs=0.05 * values.std())
+
+
+def test_numeric_accumulator_ignores_missing():
+    accumulator = NumericAccumulator()
+    accumulator.update([1.0, np.nan, 3.0])
+    accumulator.update([np.nan])
+    assert accumulator.count == 2
+    assert accumulator.moments.mean == 2.0
+    assert accumulator.sketch.quantile(0.5) == 2.0
+
+
+def _assert_same_report(actual, expected):
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected)
+        for key in expected:
+            _assert_same_report(actual[key], expected[key])
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual.sort_index(), expected.sort_index(), check_dtype=False)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, abs=0.01, nan_ok=True)
+    else:
+        assert actual == expected
+
+
+@pytest.fixture
+def survey():
+    """Respostas com algumas linhas repetidas (inclusive o carimbo de data/hora)"""
+    df = generate_survey(3000, seed=24)
+    return pd.concat([df, df.iloc[100:160]], ignore_index=True).sample(frac=1, random_state=1, ignore_index=True)
+
+
+@pytest.mark.parametrize('with_timestamp', [True, False])
+def test_append_matches_full_recompute(tmp_path, survey, with_timestamp):
+    if not with_timestamp:
+        survey = survey.drop(columns=[col for col in TIMESTAMP_COLUMNS if col in survey.columns])
+    full_path = tmp_path / 'completo.csv'
+    partial_path = tmp_path / 'parcial.csv'
+    survey.to_csv(full_path, index=False)
+    survey.iloc[:1800].to_csv(partial_path, index=False)
+    
+    incremental = StreamingSurveyAnalyzer()
+    assert incremental.append_csv(partial_path, chunksize=700) == 1800
+    assert incremental.append_csv(full_path, chunksize=700) == len(survey) - 1800
+    assert incremental.append_csv(full_path, chunksize=700) == 0
+    
+    full = StreamingSurveyAnalyzer.from_csv(full_path, chunksize=700)
+    assert incremental.total_respostas == full.total_respostas == len(survey)
+    _assert_same_report(incremental.generate_summary_report(), full.generate_summary_report())
+    pd.testing.assert_frame_equal(
+        incremental.correlations()['pearson']['r'], full.correlations()['pearson']['r'], check_exact=False
+    )
+
+
+def test_identical_new_responses_are_kept(survey):
+    analyzer = StreamingSurveyAnalyzer()
+    analyzer.append(survey.iloc[:10])
+    repeated = pd.concat([survey.iloc[:10], survey.iloc[:3]], ignore_index=True)
+    assert analyzer.append(repeated) == 3
+    assert analyzer.total_respostas == 13
+
+
+def test_edited_response_with_same_timestamp_is_not_counted_twice(survey):
+    analyzer = StreamingSurveyAnalyzer()
+    analyzer.append(survey.iloc[:100])
+    
+    edited = survey.iloc[:100].copy()
+    edited.iloc[0, 1] = 1 if edited.iloc[0, 1] != 1 else 5
+    assert analyzer.append(edited) == 0
+    assert analyzer.total_respostas == 100
+
+
+def test_plain_streaming_keeps_no_fingerprints(tmp_path, survey):
+    path = tmp_path / 'pesquisa.csv'
+    survey.to_csv(path, index=False)
+    analyzer = StreamingSurveyAnalyzer.from_csv(path, chunksize=1000)
+    assert analyzer.fingerprints is None
+    with pytest.raises(ValueError):
+        analyzer.append(survey.iloc[:5])
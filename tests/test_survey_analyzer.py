@@ -0,0 +1,96 @@
+"""
+Testes da limpeza em lote do analisador (conversão numérica, descarte dos dados originais e medição de memória)
+"""
+
+import gc
+import tracemalloc
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_analysis import INJuniorSurveyAnalyzer, generate_survey
+from data_analysis import survey_analyzer
+from data_analysis.survey_analyzer import _coerce_numeric_columns, measure_ingest_memory
+
+
+@pytest.fixture
+def raw_frame():
+    rng = np.random.default_rng(4)
+    size = 1000
+    likert = rng.integers(1, 6, size=size).astype(object)
+    likert[rng.random(size) < 0.1] = 'não sei'
+    likert[rng.random(size) < 0.05] = None
+    return pd.DataFrame({
+        'texto': pd.Series(likert).map(lambda value: value if value is None else str(value)).astype(object),
+        'inteiros': rng.integers(1, 6, size=size),
+        'decimais': [f'{value:.2f}' for value in rng.normal(10, 2, size=size)],
+        'grandes': rng.integers(0, 100000, size=size),
+        'booleanos': rng.random(size) < 0.5,
+        'outra': ['x'] * size
+    })
+
+
+def test_coerce_numeric_columns_matches_per_column_to_numeric(raw_frame, monkeypatch):
+    # Blocos pequenos: várias passadas com um bloco final incompleto
+    monkeypatch.setattr(survey_analyzer, 'COERCE_CHUNK_ROWS', 64)
+    columns = ['texto', 'inteiros', 'decimais', 'grandes', 'booleanos']
+    converted = _coerce_numeric_columns(raw_frame, columns)
+    
+    assert list(converted.columns) == columns
+    assert converted.index.equals(raw_frame.index)
+    for col in columns:
+        expected = pd.to_numeric(raw_frame[col].astype(object), errors='coerce').astype(float)
+        np.testing.assert_array_equal(
+            converted[col].to_numpy(dtype=float, na_value=np.nan), expected.to_numpy(dtype=float)
+        )
+    
+    assert converted['texto'].dtype == 'Int8'
+    assert converted['inteiros'].dtype == 'Int8'
+    assert converted['grandes'].dtype == 'Int32'
+    assert converted['decimais'].dtype == float
+
+
+def test_keep_raw_false_releases_original_frame():
+    df = generate_survey(300, seed=4)
+    reference = weakref.ref(df)
+    analyzer = INJuniorSurveyAnalyzer(df, keep_raw=False)
+    del df
+    gc.collect()
+    
+    assert analyzer.df is None
+    assert reference() is None
+    assert analyzer.memory_report()['original_bytes'] is None
+    assert analyzer.generate_summary_report()['info_geral']['total_respostas'] == 300
+
+
+def test_keep_raw_true_keeps_original_frame():
+    df = generate_survey(300, seed=4)
+    analyzer = INJuniorSurveyAnalyzer(df)
+    assert analyzer.df is df
+    assert analyzer.memory_report()['original_bytes'] == df.memory_usage(deep=True).sum()
+
+
+def test_measure_ingest_memory_reports_peak_and_restores_tracing():
+    df = generate_survey(2000, seed=4)
+    assert not tracemalloc.is_tracing()
+    report = measure_ingest_memory(df, keep_raw=False)
+    
+    assert not tracemalloc.is_tracing()
+    assert report['dados_bytes'] == df.memory_usage(deep=True).sum()
+    assert report['pico_extra_bytes'] > 0
+    assert report['razao_pico'] == round(
+        (report['dados_bytes'] + report['pico_extra_bytes']) / report['dados_bytes'], 2
+    )
+    assert report['processado_bytes'] == INJuniorSurveyAnalyzer(df).memory_report()['processado_bytes']
+
+
+def test_measure_ingest_memory_keeps_existing_tracing():
+    tracemalloc.start()
+    try:
+        report = measure_ingest_memory(generate_survey(200, seed=4))
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert report['pico_extra_bytes'] > 0
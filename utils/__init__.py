@@ -2,6 +2,35 @@
 Módulo de funções utilitárias
 """
 
-from .helpers import display_metrics_cards
+from .helpers import display_metrics_cards, display_streaming_report
+from .cache import LRUCache, get_survey_cache, get_filter_cache, hash_bytes
+from .columnar_cache import ColumnarCache, get_columnar_cache
+from .figure_cache import FigureCache, get_figure_cache, cached_figure
+from .table_viewer import PagedTable, get_paged_table, display_paged_table
+from .export import ExportCache, get_export_cache, write_export, available_formats
+from .profiling import Profiler, get_profiler, span, profiled
 
-__all__ = ['display_metrics_cards']
+__all__ = [
+    'display_metrics_cards',
+    'display_streaming_report',
+    'LRUCache',
+    'get_survey_cache',
+    'get_filter_cache',
+    'hash_bytes',
+    'ColumnarCache',
+    'get_columnar_cache',
+    'FigureCache',
+    'get_figure_cache',
+    'cached_figure',
+    'PagedTable',
+    'get_paged_table',
+    'display_paged_table',
+    'ExportCache',
+    'get_export_cache',
+    'write_export',
+    'available_formats',
+    'Profiler',
+    'get_profiler',
+    'span',
+    'profiled'
+]
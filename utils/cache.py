@@ -0,0 +1,126 @@
+"""
+Cache em memória para reaproveitar dados entre reruns do Streamlit
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+# Número máximo de pesquisas (arquivos distintos) mantidas em memória
+SURVEY_CACHE_MAXSIZE = 4
+
+# Número máximo de subconjuntos filtrados mantidos em memória (todas as pesquisas)
+FILTER_CACHE_MAXSIZE = 8
+
+
+def hash_bytes(data):
+    """
+    Calcula o hash do conteúdo de um arquivo
+
+    Args:
+        data (bytes): Conteúdo bruto do arquivo
+
+    Returns:
+        str: Hash hexadecimal usado como chave de cache
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """
+    Cache de tamanho limitado com descarte do item menos usado recentemente (LRU)
+
+    O lock do cache só protege o dicionário: a criação de um item em
+    `get_or_create` roda fora dele, com um lock por chave, então uma
+    pesquisa sendo processada não bloqueia as consultas às demais.
+    """
+
+    def __init__(self, maxsize=SURVEY_CACHE_MAXSIZE):
+        """
+        Inicializa o cache
+
+        Args:
+            maxsize (int): Número máximo de itens mantidos
+        """
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.RLock()
+        # Chave em criação -> [lock da chave, threads usando o lock]
+        self._pending = {}
+
+    def get(self, key, default=None):
+        """Retorna o item da chave (marcando-o como recente) ou `default`"""
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key, value):
+        """Armazena um item, descartando os mais antigos se o limite for excedido"""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        """
+        Retorna o item da chave, criando-o com `factory()` se não existir
+
+        Chamadas simultâneas com a mesma chave esperam uma única criação;
+        chaves diferentes são criadas (e consultadas) em paralelo.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            pending = self._pending.setdefault(key, [threading.RLock(), 0])
+            pending[1] += 1
+        try:
+            with pending[0]:
+                # Outra thread pode ter criado o item enquanto esta esperava
+                value = self.get(key)
+                if value is None:
+                    value = factory()
+                    self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                pending[1] -= 1
+                if pending[1] == 0:
+                    del self._pending[key]
+
+    def clear(self):
+        """Remove todos os itens do cache"""
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+
+# O módulo é importado uma única vez pelo Streamlit, então este cache
+# sobrevive aos reruns do script (o app.py é reexecutado a cada interação)
+_survey_cache = LRUCache(SURVEY_CACHE_MAXSIZE)
+
+
+def get_survey_cache():
+    """Retorna o cache global de pesquisas carregadas"""
+    return _survey_cache
+
+
+# Subconjuntos filtrados (analisador + relatório), indexados pelos dados e pelo filtro
+_filter_cache = LRUCache(FILTER_CACHE_MAXSIZE)
+
+
+def get_filter_cache():
+    """Retorna o cache global de pesquisas filtradas"""
+    return _filter_cache
@@ -0,0 +1,156 @@
+"""
+Cache em disco (Arrow IPC) dos dados processados, recarregado sem reprocessar o CSV
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow é opcional: sem ele o cache em disco fica desativado
+    pa = None
+    ipc = None
+
+
+# Versão do formato gravado; incrementar quando a limpeza dos dados mudar
+CACHE_FORMAT_VERSION = 1
+
+# Diretório e tamanho máximo padrão (podem ser alterados por variáveis de ambiente)
+DEFAULT_CACHE_DIR = os.environ.get(
+    'DASHBOARD_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'in_junior_dashboard')
+)
+DEFAULT_CACHE_MAX_BYTES = int(os.environ.get('DASHBOARD_CACHE_MAX_MB', '512')) * 1024 ** 2
+
+
+class ColumnarCache:
+    """
+    Arquivos Arrow IPC com os dados processados, indexados pelo hash do CSV
+    
+    A primeira carga de um arquivo grava o DataFrame já limpo (tipos
+    compactos, categorias e metadados preservados). As seguintes leem o
+    arquivo sem reprocessar o texto do CSV nem repetir a limpeza. A leitura
+    não é zero-copy: `to_pandas` copia as colunas numéricas anuláveis e as
+    categorias para buffers novos do pandas; só as colunas de texto (tipo
+    `str` com armazenamento Arrow) continuam apontando para o arquivo mapeado.
+    O diretório tem tamanho máximo; ao excedê-lo, os arquivos usados há mais
+    tempo são removidos.
+    """
+    
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        """
+        Args:
+            directory (str): Diretório dos arquivos de cache
+            max_bytes (int): Tamanho máximo total do diretório
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self):
+        """Indica se o cache pode ser usado (pyarrow instalado)"""
+        return pa is not None
+    
+    def path_for(self, key):
+        """Caminho do arquivo de cache de uma chave"""
+        return self.directory / f"v{CACHE_FORMAT_VERSION}_{key}.arrow"
+    
+    def load(self, key):
+        """
+        Recarrega os dados processados de uma chave
+        
+        A tabela Arrow é lida sobre o memory-map e convertida em DataFrame;
+        o mapeamento continua aberto enquanto alguma coluna de texto o usar.
+        
+        Returns:
+            DataFrame | None: Dados processados, ou None se não houver cache
+        """
+        if not self.available:
+            return None
+        
+        path = self.path_for(key)
+        try:
+            with pa.memory_map(str(path), 'r') as source:
+                df = ipc.open_file(source).read_all().to_pandas()
+        except (FileNotFoundError, pa.ArrowInvalid, OSError):
+            return None
+        
+        # Atualiza a data de acesso usada no descarte (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return df
+    
+    def store(self, key, df):
+        """
+        Grava os dados processados de uma chave e aplica o limite de tamanho
+        
+        Args:
+            key (str): Hash do conteúdo do CSV
+            df (DataFrame): Dados processados
+        
+        Returns:
+            bool: True se gravou; False se o cache está indisponível ou a
+                gravação falhou (ex: coluna com tipos mistos, disco cheio)
+        """
+        if not self.available:
+            return False
+        
+        try:
+            table = pa.Table.from_pandas(df)
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except (pa.ArrowException, OSError):
+            return False
+        
+        # Grava em arquivo temporário e renomeia: leitores nunca veem arquivo parcial
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, self.path_for(key))
+        except (pa.ArrowException, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        
+        self.evict()
+        return True
+    
+    def evict(self):
+        """Remove os arquivos menos usados até respeitar `max_bytes`"""
+        with self._lock:
+            try:
+                files = [(path, path.stat()) for path in self.directory.glob('*.arrow')]
+            except FileNotFoundError:
+                return
+            
+            total = sum(stat.st_size for _, stat in files)
+            for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= stat.st_size
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # Ainda mapeado por uma coluna de texto (Windows não remove arquivos mapeados)
+                    continue
+    
+    def size_bytes(self):
+        """Tamanho total atual do diretório de cache"""
+        return sum(path.stat().st_size for path in self.directory.glob('*.arrow'))
+
+
+_columnar_cache = ColumnarCache()
+
+
+def get_columnar_cache():
+    """Retorna o cache em disco global"""
+    return _columnar_cache
@@ -0,0 +1,183 @@
+"""
+Exportação dos dados processados (CSV gzip, Parquet, JSON Lines) gerada sob demanda e em disco
+"""
+
+import gzip
+import io
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow é opcional: sem ele a exportação Parquet fica indisponível
+    pa = None
+    pq = None
+
+from .columnar_cache import DEFAULT_CACHE_DIR
+
+
+# Formatos disponíveis: extensão -> rótulo e tipo MIME
+EXPORT_FORMATS = {
+    'csv.gz': {'rotulo': 'CSV (gzip)', 'mime': 'application/gzip'},
+    'parquet': {'rotulo': 'Parquet', 'mime': 'application/vnd.apache.parquet'},
+    'jsonl': {'rotulo': 'JSON Lines', 'mime': 'application/jsonl'}
+}
+
+# Linhas convertidas por bloco: o arquivo é escrito aos poucos, sem montar
+# o conteúdo inteiro como uma única string
+EXPORT_CHUNK_ROWS = 50000
+
+# Diretório e tamanho máximo das exportações em cache
+DEFAULT_EXPORT_DIR = os.environ.get('DASHBOARD_EXPORT_DIR', os.path.join(DEFAULT_CACHE_DIR, 'exportacoes'))
+DEFAULT_EXPORT_MAX_BYTES = int(os.environ.get('DASHBOARD_EXPORT_MAX_MB', '256')) * 1024 ** 2
+
+
+def available_formats():
+    """Formatos que podem ser gerados no ambiente atual"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet' or pq is not None]
+
+
+def _chunks(frame, chunk_rows):
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        yield start, frame.iloc[start:start + chunk_rows]
+
+
+def write_export(frame, fmt, sink, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Escreve o DataFrame no formato pedido, bloco a bloco
+    
+    Args:
+        frame (DataFrame): Dados a exportar
+        fmt (str): Uma das chaves de EXPORT_FORMATS
+        sink: Arquivo binário aberto para escrita
+        chunk_rows (int): Linhas por bloco
+    """
+    if fmt == 'csv.gz':
+        # mtime fixo: o mesmo conteúdo gera sempre os mesmos bytes; nível 6
+        # comprime quase o mesmo que o 9 em bem menos tempo
+        with gzip.GzipFile(fileobj=sink, mode='wb', compresslevel=6, mtime=0) as compressed:
+            with io.TextIOWrapper(compressed, encoding='utf-8', newline='') as text:
+                for start, chunk in _chunks(frame, chunk_rows):
+                    chunk.to_csv(text, index=False, header=start == 0)
+    
+    elif fmt == 'jsonl':
+        for _, chunk in _chunks(frame, chunk_rows):
+            if len(chunk):
+                lines = chunk.to_json(orient='records', lines=True, date_format='iso', force_ascii=False)
+                sink.write(lines.rstrip('\n').encode('utf-8') + b'\n')
+    
+    elif fmt == 'parquet':
+        if pq is None:
+            raise RuntimeError("Exportação Parquet requer o pacote pyarrow")
+        writer = None
+        try:
+            # Cada bloco vira um row group do mesmo arquivo
+            for _, chunk in _chunks(frame, chunk_rows):
+                table = pa.Table.from_pandas(
+                    chunk, schema=writer.schema if writer else None, preserve_index=False
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(sink, table.schema, compression='zstd')
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    else:
+        raise ValueError(f"Formato de exportação desconhecido: {fmt}")
+
+
+class ExportCache:
+    """
+    Arquivos exportados em disco, indexados pelos dados, versão e formato
+    
+    Cada arquivo só é gerado quando alguém pede o download e é reaproveitado
+    enquanto os dados não mudam. O diretório tem tamanho máximo; ao excedê-lo,
+    as exportações usadas há mais tempo são removidas.
+    """
+    
+    def __init__(self, directory=DEFAULT_EXPORT_DIR, max_bytes=DEFAULT_EXPORT_MAX_BYTES):
+        """
+        Args:
+            directory (str): Diretório das exportações
+            max_bytes (int): Tamanho máximo total do diretório
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+    
+    def path_for(self, dataset_key, data_version, fmt):
+        """Caminho da exportação de uma versão dos dados"""
+        return self.directory / f"{dataset_key}_v{data_version}.{fmt}"
+    
+    def get_or_create(self, analyzer, fmt):
+        """
+        Retorna o caminho da exportação, gerando o arquivo se ainda não existir
+        
+        Args:
+            analyzer: Instância do INJuniorSurveyAnalyzer
+            fmt (str): Uma das chaves de EXPORT_FORMATS
+        
+        Returns:
+            Path: Arquivo exportado
+        """
+        path = self.path_for(analyzer.dataset_key, analyzer.data_version, fmt)
+        
+        # Um único arquivo é gerado por vez (o download roda em outra thread)
+        with self._lock:
+            if path.exists():
+                os.utime(path)
+                return path
+            
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Grava em arquivo temporário e renomeia: leitores nunca veem arquivo parcial
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as sink:
+                    write_export(analyzer.df_processed, fmt, sink)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        
+        self.evict(keep=path)
+        return path
+    
+    def read(self, analyzer, fmt):
+        """Conteúdo da exportação (gerada se necessário), para o botão de download"""
+        return self.get_or_create(analyzer, fmt).read_bytes()
+    
+    def evict(self, keep=None):
+        """Remove as exportações menos usadas até respeitar `max_bytes`"""
+        with self._lock:
+            try:
+                files = [
+                    (path, path.stat()) for path in self.directory.iterdir()
+                    if path.suffix != '.tmp' and path != keep
+                ]
+            except FileNotFoundError:
+                return
+            
+            total = sum(stat.st_size for _, stat in files)
+            if keep is not None and keep.exists():
+                total += keep.stat().st_size
+            for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= stat.st_size
+                except FileNotFoundError:
+                    pass
+
+
+_export_cache = ExportCache()
+
+
+def get_export_cache():
+    """Retorna o cache global de exportações"""
+    return _export_cache
@@ -0,0 +1,109 @@
+"""
+Cache das figuras Plotly entre reruns, indexado por dados, gráfico e parâmetros
+"""
+
+import threading
+
+from .cache import LRUCache
+from .profiling import span
+
+
+# Número máximo de figuras mantidas em memória
+FIGURE_CACHE_MAXSIZE = 128
+
+
+class FigureCache:
+    """
+    Figuras Plotly já construídas, reaproveitadas enquanto os dados não mudam
+    
+    A chave combina o identificador dos dados do analisador, a versão dos
+    dados, o nome do gráfico e os parâmetros que alteram a figura. Guarda o
+    objeto Figure pronto: reconstruí-lo a partir do JSON custaria uma nova
+    validação completa da especificação a cada rerun. As figuras em cache
+    são compartilhadas e não devem ser alteradas depois de obtidas.
+    """
+    
+    def __init__(self, maxsize=FIGURE_CACHE_MAXSIZE):
+        """
+        Args:
+            maxsize (int): Número máximo de figuras mantidas
+        """
+        self._figures = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_or_create(self, key, builder):
+        """
+        Retorna a figura da chave, construindo-a com `builder()` se não existir
+        
+        Args:
+            key (tuple): Chave (ver `figure_key`)
+            builder (callable): Função sem argumentos que constrói a figura
+        """
+        figure = self._figures.get(key)
+        with self._lock:
+            if figure is not None:
+                self.hits += 1
+                return figure
+            self.misses += 1
+        
+        figure = builder()
+        self._figures.set(key, figure)
+        return figure
+    
+    def stats(self):
+        """Contadores de acertos e falhas e ocupação do cache"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'acertos': self.hits,
+                'falhas': self.misses,
+                'taxa_acerto': round(self.hits / total, 3) if total else None,
+                'figuras': len(self._figures),
+                'capacidade': self._figures.maxsize
+            }
+    
+    def clear(self):
+        """Remove todas as figuras e zera os contadores"""
+        self._figures.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def figure_key(analyzer, chart_id, **params):
+    """
+    Monta a chave de uma figura
+    
+    Args:
+        analyzer: Instância do INJuniorSurveyAnalyzer
+        chart_id (str): Nome do gráfico (ex: 'satisfacao_histograma')
+        **params: Parâmetros que alteram a figura (valores hasheáveis)
+    """
+    return (analyzer.dataset_key, analyzer.data_version, chart_id, tuple(sorted(params.items())))
+
+
+_figure_cache = FigureCache()
+
+
+def get_figure_cache():
+    """Retorna o cache global de figuras"""
+    return _figure_cache
+
+
+def cached_figure(analyzer, chart_id, builder, **params):
+    """
+    Atalho para obter uma figura do cache global
+    
+    Args:
+        analyzer: Instância do INJuniorSurveyAnalyzer
+        chart_id (str): Nome do gráfico
+        builder (callable): Função sem argumentos que constrói a figura
+        **params: Parâmetros que alteram a figura
+    """
+    def _build():
+        with span(f'figura.{chart_id}'):
+            return builder()
+    
+    return _figure_cache.get_or_create(figure_key(analyzer, chart_id, **params), _build)
@@ -43,3 +43,42 @@ def display_metrics_cards(report):
                 value=f"{hours['media']}h",
                 delta=f"Max: {hours['maximo']}h"
             )
+
+
+def display_streaming_report(report):
+    """Exibe o relatório do modo streaming (apenas agregados, sem dados brutos)"""
+    section_names = {
+        'satisfacao': '😊 Satisfação',
+        'estrutura_organizacional': '🏢 Estrutura Organizacional',
+        'cultura_feedback': '💬 Cultura de Feedback',
+        'engajamento': '🙋 Engajamento'
+    }
+    
+    for section, metrics in report.items():
+        if section in ('info_geral', 'carga_trabalho') or not metrics:
+            continue
+        
+        st.subheader(section_names.get(section, section.replace('_', ' ').title()))
+        summary = pd.DataFrame([
+            {
+                'Métrica': key.replace('_', ' ').title(),
+                'Média': data['media'],
+                'Mediana': data['mediana'],
+                'Desvio Padrão': data['desvio_padrao'],
+                'N° Respostas': data['n_respostas']
+            }
+            for key, data in metrics.items()
+        ])
+        st.dataframe(summary, width="stretch")
+        
+        # Histograma exato das respostas da satisfação geral
+        if 'satisfacao_geral' in metrics:
+            st.bar_chart(metrics['satisfacao_geral']['histograma'])
+    
+    if report['carga_trabalho']:
+        st.subheader("⏰ Carga de Trabalho")
+        cols = st.columns(len(report['carga_trabalho']))
+        for col, (key, data) in zip(cols, report['carga_trabalho'].items()):
+            with col:
+                st.write(f"**{key.replace('_', ' ').title()}**")
+                st.bar_chart(data['value_counts'])
@@ -0,0 +1,268 @@
+"""
+Medição de tempo e memória por etapa (spans nomeados), desligada por padrão
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import nullcontext
+
+import pandas as pd
+
+
+# Ativa a medição desde o início (ex: DASHBOARD_PROFILING=1 streamlit run app.py)
+PROFILING_ENABLED = os.environ.get('DASHBOARD_PROFILING', '').lower() in ('1', 'true', 'sim')
+
+# Número máximo de spans guardados (os mais antigos são descartados)
+MAX_SPANS = 20000
+
+# Contexto vazio reutilizado quando a medição está desligada
+_NOOP_SPAN = nullcontext()
+
+
+class _Span:
+    """
+    Um trecho medido: duração e memória alocada (tracemalloc) entre a entrada e a saída
+    
+    O pico do tracemalloc é do processo inteiro e `reset_peak` afeta todas as
+    threads, então só a thread dona da memória (a primeira a abrir um span
+    enquanto nenhuma outra tinha spans abertos) zera o pico e grava memória.
+    Spans de outras threads abertos ao mesmo tempo (ex: cruzamentos no pool)
+    gravam só a duração; a memória deles entra nos spans da thread dona.
+    """
+    
+    __slots__ = ('profiler', 'name', 'args', 'start_ns', 'start_memory', 'peak_memory', 'depth', 'track_memory')
+    
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+    
+    def __enter__(self):
+        stack = self.profiler._stack()
+        self.track_memory = self.profiler._acquire_memory(bool(stack))
+        if self.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # O pico do tracemalloc é global: antes de zerá-lo, repassa ao span pai
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak)
+            tracemalloc.reset_peak()
+            self.start_memory = current
+            self.peak_memory = current
+        
+        self.depth = len(stack)
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        stack = self.profiler._stack()
+        stack.pop()
+        
+        allocated = peak_delta = None
+        if self.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self.peak_memory = max(self.peak_memory, peak)
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, self.peak_memory)
+            allocated = current - self.start_memory
+            peak_delta = self.peak_memory - self.start_memory
+        if not stack:
+            self.profiler._release_memory()
+        
+        self.profiler._record({
+            'nome': self.name,
+            'inicio_ns': self.start_ns,
+            'duracao_ns': end_ns - self.start_ns,
+            'thread': threading.get_ident(),
+            'profundidade': self.depth,
+            'memoria_alocada': allocated,
+            'memoria_pico': peak_delta,
+            'erro': exc_type.__name__ if exc_type else None,
+            'args': self.args
+        })
+        return False
+
+
+class Profiler:
+    """
+    Coletor dos spans medidos no processo
+    
+    Quando desligado, `span()` devolve um contexto vazio compartilhado e
+    `profiled` só verifica uma flag antes de chamar a função, então a
+    instrumentação pode ficar espalhada pelo código sem custo perceptível.
+    Ligado, usa o tracemalloc para medir a memória alocada em cada span.
+    """
+    
+    def __init__(self, enabled=PROFILING_ENABLED, max_spans=MAX_SPANS):
+        """
+        Args:
+            enabled (bool): Começar com a medição ligada
+            max_spans (int): Número máximo de spans guardados
+        """
+        self.enabled = False
+        self._spans = deque(maxlen=max_spans)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memory_owner = None
+        self._origin_ns = time.perf_counter_ns()
+        self.set_enabled(enabled)
+    
+    def set_enabled(self, enabled):
+        """Liga ou desliga a medição (e o tracemalloc, se foi iniciado por aqui)"""
+        enabled = bool(enabled)
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        elif not enabled and getattr(self, '_started_tracing', False):
+            tracemalloc.stop()
+            self._started_tracing = False
+        self.enabled = enabled
+    
+    def span(self, name, **args):
+        """
+        Contexto que mede um trecho de código
+        
+        Args:
+            name (str): Nome da etapa (ex: 'analyzer.limpeza')
+            **args: Informações extras gravadas no trace (ex: linhas=...)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, args)
+    
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def _acquire_memory(self, nested):
+        """Indica se a thread atual mede memória, tornando-se dona se nenhuma outra for"""
+        thread = threading.get_ident()
+        with self._lock:
+            if self._memory_owner is None and not nested:
+                self._memory_owner = thread
+            return self._memory_owner == thread
+    
+    def _release_memory(self):
+        """Libera a medição de memória quando a thread dona fecha seu último span"""
+        with self._lock:
+            if self._memory_owner == threading.get_ident():
+                self._memory_owner = None
+    
+    def _record(self, record):
+        with self._lock:
+            self._spans.append(record)
+    
+    def records(self):
+        """Spans medidos, do mais antigo para o mais recente"""
+        with self._lock:
+            return list(self._spans)
+    
+    def clear(self):
+        """Descarta os spans medidos"""
+        with self._lock:
+            self._spans.clear()
+    
+    def summary(self):
+        """
+        Resumo por etapa
+        
+        Returns:
+            DataFrame: etapa, chamadas, tempo total/médio/máximo (ms) e
+                maior pico de memória (MB), do maior tempo total para o menor
+        """
+        records = self.records()
+        columns = ['etapa', 'chamadas', 'total_ms', 'media_ms', 'max_ms', 'pico_memoria_mb']
+        if not records:
+            return pd.DataFrame(columns=columns)
+        
+        spans = pd.DataFrame(records)
+        spans['ms'] = spans['duracao_ns'] / 1e6
+        # Spans sem medição de memória (threads paralelas) ficam como NaN
+        spans['memoria_pico'] = spans['memoria_pico'].astype(float)
+        grouped = spans.groupby('nome', sort=False)
+        summary = pd.DataFrame({
+            'chamadas': grouped.size(),
+            'total_ms': grouped['ms'].sum(),
+            'media_ms': grouped['ms'].mean(),
+            'max_ms': grouped['ms'].max(),
+            'pico_memoria_mb': grouped['memoria_pico'].max() / 1024 ** 2
+        }).round(2)
+        summary = summary.rename_axis('etapa').reset_index()
+        return summary.sort_values('total_ms', ascending=False, ignore_index=True)[columns]
+    
+    def chrome_trace(self):
+        """
+        Spans no formato Trace Event (chrome://tracing, Perfetto, speedscope)
+        
+        Returns:
+            dict: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.records():
+            args = {}
+            if record['memoria_pico'] is not None:
+                args['memoria_alocada_bytes'] = record['memoria_alocada']
+                args['memoria_pico_bytes'] = record['memoria_pico']
+            if record['erro']:
+                args['erro'] = record['erro']
+            args.update({key: str(value) for key, value in record['args'].items()})
+            events.append({
+                'name': record['nome'],
+                'cat': record['nome'].split('.')[0],
+                'ph': 'X',
+                'ts': (record['inicio_ns'] - self._origin_ns) / 1000,
+                'dur': record['duracao_ns'] / 1000,
+                'pid': pid,
+                'tid': record['thread'],
+                'args': args
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def write_chrome_trace(self, path):
+        """Grava o trace em um arquivo JSON"""
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(self.chrome_trace(), handle, ensure_ascii=False)
+        return path
+
+
+_profiler = Profiler()
+
+
+def get_profiler():
+    """Retorna o coletor global de spans"""
+    return _profiler
+
+
+def span(name, **args):
+    """Atalho para `get_profiler().span(...)`"""
+    return _profiler.span(name, **args)
+
+
+def profiled(name=None):
+    """
+    Decorador que mede cada chamada da função como um span
+    
+    Args:
+        name (str, optional): Nome da etapa (padrão: módulo.função)
+    """
+    def decorator(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _Span(_profiler, span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,199 @@
+"""
+Visualizador paginado de tabelas: ordenação, filtro e projeção no servidor
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .cache import LRUCache
+
+
+# Opções de linhas por página
+PAGE_SIZE_OPTIONS = [25, 50, 100, 500]
+
+# Tabelas mantidas entre reruns (processada e original do arquivo atual)
+TABLE_CACHE_MAXSIZE = 2
+
+# Máscaras de filtro guardadas por tabela (texto + colunas)
+FILTER_CACHE_MAXSIZE = 16
+
+# Rótulo da opção "sem ordenação" no seletor de colunas
+NO_SORT_LABEL = "(ordem original)"
+
+
+class PagedTable:
+    """
+    Tabela mantida no servidor, da qual só a página visível é enviada ao navegador
+    
+    Os índices de ordenação (permutação das linhas por coluna e direção) e as
+    máscaras de filtro são calculados uma vez e reaproveitados: trocar de
+    página ou de colunas visíveis só recorta arrays já prontos.
+    """
+    
+    def __init__(self, frame):
+        """
+        Args:
+            frame (DataFrame): Dados completos (não são copiados)
+        """
+        self.frame = frame
+        self._sort_indexes = {}
+        self._text_codes = {}
+        self._filters = LRUCache(FILTER_CACHE_MAXSIZE)
+    
+    def __len__(self):
+        return len(self.frame)
+    
+    @property
+    def columns(self):
+        return list(self.frame.columns)
+    
+    def sort_index(self, column, ascending=True):
+        """
+        Posições das linhas ordenadas por uma coluna (ordenação estável, ausentes no fim)
+        
+        Colunas categóricas ordenadas seguem a ordem das categorias (ex: faixas de horas).
+        """
+        key = (column, ascending)
+        if key not in self._sort_indexes:
+            series = self.frame[column].reset_index(drop=True)
+            try:
+                ordered = series.sort_values(ascending=ascending, kind='stable', na_position='last')
+            except TypeError:
+                # Colunas com tipos misturados são ordenadas pelo texto
+                ordered = series.astype(str).sort_values(ascending=ascending, kind='stable')
+            self._sort_indexes[key] = ordered.index.to_numpy()
+        return self._sort_indexes[key]
+    
+    def _column_matches(self, column, text):
+        """Máscara das linhas cuja coluna contém o texto (sem diferenciar maiúsculas)"""
+        if column not in self._text_codes:
+            # Cada valor distinto é convertido para texto uma única vez; as
+            # linhas são representadas pelos códigos dos seus valores
+            series = self.frame[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+            else:
+                codes, uniques = pd.factorize(series)
+            self._text_codes[column] = (codes, pd.Index(uniques).astype(str).str.lower())
+        
+        codes, uniques = self._text_codes[column]
+        # Posição extra (False) para os ausentes, de código -1
+        matches = np.append(np.asarray(uniques.str.contains(text, regex=False), dtype=bool), False)
+        return matches[codes]
+    
+    def filter_mask(self, text, columns):
+        """
+        Máscara das linhas em que alguma das colunas contém o texto
+        
+        Args:
+            text (str): Texto procurado
+            columns (list): Colunas consideradas
+        
+        Returns:
+            ndarray: Booleanos por linha (None se o filtro estiver vazio)
+        """
+        text = text.strip().lower()
+        if not text:
+            return None
+        
+        key = (text, tuple(columns))
+        mask = self._filters.get(key)
+        if mask is None:
+            mask = np.zeros(len(self.frame), dtype=bool)
+            for column in columns:
+                mask |= self._column_matches(column, text)
+            self._filters.set(key, mask)
+        return mask
+    
+    def page(self, columns=None, sort_by=None, ascending=True, query='', page=1, page_size=PAGE_SIZE_OPTIONS[0]):
+        """
+        Recorta uma página da tabela
+        
+        Args:
+            columns (list, optional): Colunas visíveis (padrão: todas)
+            sort_by (str, optional): Coluna de ordenação
+            ascending (bool): Ordem crescente
+            query (str): Texto filtrado nas colunas visíveis
+            page (int): Página, a partir de 1
+            page_size (int): Linhas por página
+        
+        Returns:
+            tuple: (DataFrame da página, total de linhas após o filtro)
+        """
+        columns = list(columns) if columns else self.columns
+        order = self.sort_index(sort_by, ascending) if sort_by is not None else None
+        mask = self.filter_mask(query, columns)
+        
+        if mask is not None:
+            order = order[mask[order]] if order is not None else np.flatnonzero(mask)
+        total = len(order) if order is not None else len(self.frame)
+        
+        start = (page - 1) * page_size
+        if order is not None:
+            positions = order[start:start + page_size]
+        else:
+            positions = np.arange(start, min(start + page_size, total))
+        
+        return self.frame.iloc[positions][columns], total
+
+
+_table_cache = LRUCache(TABLE_CACHE_MAXSIZE)
+
+
+def get_paged_table(key, factory):
+    """
+    Retorna a tabela paginada da chave, criando-a com `factory()` (DataFrame) se preciso
+    
+    Args:
+        key (tuple): Identifica os dados (ex: hash do arquivo e versão)
+        factory (callable): Função sem argumentos que retorna o DataFrame
+    """
+    return _table_cache.get_or_create(key, lambda: PagedTable(factory()))
+
+
+def display_paged_table(table, key):
+    """
+    Exibe uma tabela paginada com seletores de colunas, ordenação, filtro e página
+    
+    Args:
+        table (PagedTable): Tabela mantida no servidor
+        key (str): Prefixo das chaves dos widgets (uma tabela por prefixo)
+    """
+    columns = st.multiselect("Colunas:", table.columns, default=table.columns, key=f"{key}_colunas")
+    if not columns:
+        st.info("Selecione ao menos uma coluna.")
+        return
+    
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+    with col1:
+        sort_by = st.selectbox("Ordenar por:", [NO_SORT_LABEL] + columns, key=f"{key}_ordenar")
+    with col2:
+        descending = st.checkbox("Decrescente", key=f"{key}_decrescente")
+    with col3:
+        query = st.text_input("Filtrar:", key=f"{key}_filtro", placeholder="Texto nas colunas visíveis")
+    with col4:
+        page_size = st.selectbox("Linhas por página:", PAGE_SIZE_OPTIONS, key=f"{key}_tamanho")
+    
+    sort_by = None if sort_by == NO_SORT_LABEL else sort_by
+    # Total de linhas após o filtro (reaproveita a máscara em cache)
+    mask = table.filter_mask(query, columns)
+    total = int(mask.sum()) if mask is not None else len(table)
+    n_pages = max(1, math.ceil(total / page_size))
+    # Um filtro novo pode reduzir o número de páginas abaixo da página atual
+    if st.session_state.get(f"{key}_pagina", 1) > n_pages:
+        st.session_state[f"{key}_pagina"] = n_pages
+    
+    page = st.number_input("Página:", min_value=1, max_value=n_pages, step=1, key=f"{key}_pagina")
+    
+    data, total = table.page(columns, sort_by, not descending, query, int(page), page_size)
+    st.dataframe(data, width="stretch")
+    
+    first = (page - 1) * page_size + 1 if total else 0
+    filtered = f" (filtradas de {len(table):,})" if total != len(table) else ""
+    st.caption(
+        f"Linhas {first:,}–{first + len(data) - 1 if total else 0:,} de {total:,}{filtered} "
+        f"· página {int(page)} de {n_pages}"
+    )